@@ -103,23 +103,29 @@ class AdHocActionDescriptor(action_providers_base.ActionDescriptorBase):
 
         self._definition = action_def.definition
         self._spec = spec_parser.get_action_spec(action_def.spec)
-        self._action_def = action_def
+
+        # Descriptors may be cached and outlive the DB session so the
+        # needed fields of the definition are copied.
+        self._id = action_def.id
+        self._created_at = action_def.created_at
+        self._updated_at = action_def.updated_at
+        self._tags = action_def.tags
 
     @property
     def id(self):
-        return self._action_def.id
+        return self._id
 
     @property
     def created_at(self):
-        return self._action_def.created_at
+        return self._created_at
 
     @property
     def updated_at(self):
-        return self._action_def.updated_at
+        return self._updated_at
 
     @property
     def tags(self):
-        return self._action_def.tags
+        return self._tags
 
     @property
     def definition(self):
@@ -245,6 +251,9 @@ class AdHocActionProvider(ml_actions.ActionProvider):
     def __init__(self, name='adhoc'):
         super().__init__(name)
 
+    def get_state(self):
+        return db_api.get_action_definitions_state()
+
     def find(self, action_name, namespace=None):
         action_def = db_api.load_action_definition(
             action_name,
@@ -13,17 +13,43 @@
 #    limitations under the License.
 
 
-from oslo_config import cfg
+import collections
+import threading
+import time
 import types
 
+import cachetools
+from oslo_config import cfg
+
 from mistral_lib import actions as ml_actions
 from mistral_lib import serialization
 from mistral_lib.utils import inspect_utils
 
 from mistral.db.v2 import api as db_api
+from mistral.services import security
 
 CONF = cfg.CONF
 
+# Dynamic action definitions and code source modules are cached in memory
+# until the state of dynamic actions in DB changes. The state is a result
+# of a single aggregate query so checking it is much cheaper than loading
+# definitions and code sources from DB for every action lookup.
+_CACHE_LOCK = threading.RLock()
+
+# {code_source_id => (python module, version)}
+_CODE_SOURCES = {}
+
+# {(action name, namespace, project id) => action definition or None}
+_ACTION_DEFS = None
+
+_DB_STATE = None
+_DB_STATE_CHECKED_AT = 0
+
+_ActionDefinition = collections.namedtuple(
+    '_ActionDefinition',
+    ['name', 'class_name', 'code_source_id', 'project_id', 'scope']
+)
+
 
 class DynamicAction(ml_actions.Action):
     def __init__(self, action, code_source_id, namespace=''):
@@ -131,15 +157,118 @@ class DynamicActionSerializer(serialization.DictBasedSerializer):
         )
 
 
+def _check_db_state():
+    global _DB_STATE
+    global _DB_STATE_CHECKED_AT
+
+    interval = CONF.dynamic_action_provider.version_check_interval
+
+    with _CACHE_LOCK:
+        if (_DB_STATE is not None and
+                time.monotonic() - _DB_STATE_CHECKED_AT < interval):
+            return
+
+    db_state = db_api.get_dynamic_actions_state()
+
+    with _CACHE_LOCK:
+        if db_state != _DB_STATE:
+            _clear_caches()
+
+            _DB_STATE = db_state
+
+        _DB_STATE_CHECKED_AT = time.monotonic()
+
+
+def _get_action_defs_cache():
+    global _ACTION_DEFS
+
+    if _ACTION_DEFS is None:
+        _ACTION_DEFS = cachetools.LRUCache(
+            maxsize=CONF.dynamic_action_provider.cache_size
+        )
+
+    return _ACTION_DEFS
+
+
+def _load_action_definition(action_name, namespace=None):
+    _check_db_state()
+
+    key = (action_name, namespace, security.get_project_id())
+
+    with _CACHE_LOCK:
+        cache = _get_action_defs_cache()
+
+        # Missing actions are cached too since the provider is usually
+        # asked for actions that it doesn't have.
+        if key in cache:
+            return cache[key]
+
+    action_def = db_api.load_dynamic_action_definition(
+        action_name,
+        namespace
+    )
+
+    if action_def is not None:
+        action_def = _ActionDefinition(
+            action_def.name,
+            action_def.class_name,
+            action_def.code_source_id,
+            action_def.project_id,
+            action_def.scope
+        )
+
+    with _CACHE_LOCK:
+        _get_action_defs_cache()[key] = action_def
+
+    return action_def
+
+
 def _get_python_module(code_source_id, namespace=''):
+    _check_db_state()
+
+    return _get_cached_python_module(code_source_id, namespace)
+
+
+def _get_cached_python_module(code_source_id, namespace=''):
+    with _CACHE_LOCK:
+        mod = _CODE_SOURCES.get(code_source_id)
+
+    if mod is not None:
+        return mod
+
     code_source = db_api.get_code_source(
         code_source_id,
         namespace=namespace
     )
 
-    mod = _load_python_module(code_source.name, code_source.content)
+    mod = (
+        _load_python_module(code_source.name, code_source.content),
+        code_source.version
+    )
+
+    with _CACHE_LOCK:
+        _CODE_SOURCES[code_source_id] = mod
+
+    return mod
+
 
-    return mod, code_source.version
+def _clear_caches():
+    _CODE_SOURCES.clear()
+
+    if _ACTION_DEFS is not None:
+        _ACTION_DEFS.clear()
+
+
+def clear_caches():
+    """Clears all caches of dynamic actions."""
+    global _ACTION_DEFS
+    global _DB_STATE
+
+    with _CACHE_LOCK:
+        _clear_caches()
+
+        _ACTION_DEFS = None
+        _DB_STATE = None
 
 
 def _load_python_module(fullname, content):
@@ -159,31 +288,10 @@ class DynamicActionProvider(ml_actions.ActionProvider):
     def __init__(self, name='dynamic'):
         super().__init__(name)
 
-        # {code_source_id => (python module, version)}
-        self._code_sources = dict()
-
     def ensure_latest_module_version(self, action_def):
-        # We need to compare the version of the corresponding module
-        # that's already loaded into memory with the version stored in
-        # DB and reimport the module if the DB version is higher.
-
-        code_src_id = action_def.code_source_id
-
-        # TODO(rakhmerov): To avoid this DB call we need to store code source
-        # versions also in the dynamic action definition model.
-        db_ver = db_api.get_code_source(code_src_id, fields=['version'])[0]
-
-        if db_ver > self._code_sources.get(code_src_id, (None, -1))[1]:
-            # Reload module.
-            code_src = db_api.get_code_source(code_src_id)
-
-            module = _load_python_module(code_src.name, code_src.content)
-
-            self._code_sources[code_src_id] = (module, code_src.version)
-        else:
-            module = self._code_sources[code_src_id][0]
-
-        return module
+        # The cached module is reloaded once the code source gets changed
+        # in DB.
+        return _get_cached_python_module(action_def.code_source_id)[0]
 
     def _get_action_class(self, action_def):
         module = self.ensure_latest_module_version(action_def)
@@ -204,10 +312,7 @@ class DynamicActionProvider(ml_actions.ActionProvider):
         )
 
     def find(self, action_name, namespace=None):
-        action_def = db_api.load_dynamic_action_definition(
-            action_name,
-            namespace
-        )
+        action_def = _load_action_definition(action_name, namespace)
 
         if action_def is None:
             return None
@@ -221,6 +326,8 @@ class DynamicActionProvider(ml_actions.ActionProvider):
 
         filters['namespace'] = {'eq': namespace}
 
+        _check_db_state()
+
         action_defs = db_api.get_dynamic_action_definitions(
             limit=limit,
             sort_keys=sort_fields,
@@ -22,12 +22,13 @@ import smtplib
 import time
 from urllib import parse
 
+from oslo_config import cfg
 from oslo_log import log as logging
 import random
-import requests
 
 from mistral import exceptions as exc
 from mistral import utils
+from mistral.utils import http_utils
 from mistral.utils import javascript
 from mistral.utils import rest_utils
 from mistral.utils import ssh_utils
@@ -203,6 +204,9 @@ class HTTPAction(actions.Action):
         the proxy.
     :param verify: (optional) if ``True``, the SSL cert will be verified.
         A CA_BUNDLE path can also be provided.
+    :param stream: (optional) if ``True``, the response body is read in
+        chunks and the action fails as soon as the body exceeds the
+        execution field size limit instead of downloading it completely.
     """
 
     def __init__(self,
@@ -217,7 +221,8 @@ class HTTPAction(actions.Action):
                  timeout=None,
                  allow_redirects=None,
                  proxies=None,
-                 verify=None):
+                 verify=None,
+                 stream=False):
         super(HTTPAction, self).__init__()
 
         if auth and len(auth.split(':')) == 2:
@@ -246,6 +251,7 @@ class HTTPAction(actions.Action):
         self.allow_redirects = allow_redirects
         self.proxies = proxies
         self.verify = verify
+        self.stream = stream
 
     def run(self, context):
         LOG.info(
@@ -280,7 +286,7 @@ class HTTPAction(actions.Action):
                 self.headers.update(
                     context.execution.workflow_propagated_headers)
 
-            resp = requests.request(
+            resp = http_utils.request(
                 self.method,
                 self.url,
                 params=self.params,
@@ -292,8 +298,14 @@ class HTTPAction(actions.Action):
                 timeout=self.timeout,
                 allow_redirects=self.allow_redirects,
                 proxies=self.proxies,
-                verify=action_verify
+                verify=action_verify,
+                stream=self.stream
             )
+
+            if self.stream:
+                self._read_response_stream(resp)
+        except exc.ActionException:
+            raise
         except Exception as e:
             LOG.exception(
                 "Failed to send HTTP request for action execution: %s",
@@ -333,6 +345,33 @@ class HTTPAction(actions.Action):
 
         return _result
 
+    @staticmethod
+    def _read_response_stream(resp):
+        limit_kb = cfg.CONF.engine.execution_field_size_limit_kb
+        limit = limit_kb * 1024 if limit_kb >= 0 else None
+
+        chunks = []
+        size = 0
+
+        try:
+            for chunk in resp.iter_content(
+                    cfg.CONF.http_connection_pool.stream_chunk_size):
+                size += len(chunk)
+
+                if limit is not None and size > limit:
+                    raise exc.ActionException(
+                        "HTTP response body is larger than the execution"
+                        " field size limit: %s KB" % limit_kb
+                    )
+
+                chunks.append(chunk)
+        finally:
+            resp.close()
+
+        # NOTE: the same way requests builds the content of a response
+        # that was not read in the streaming mode.
+        resp._content = b''.join(chunks)
+
     def test(self, context):
         # TODO(rakhmerov): Implement.
         return None
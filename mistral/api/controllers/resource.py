@@ -101,7 +101,7 @@ class ResourceList(Resource):
 
     @classmethod
     def convert_with_links(cls, resources, limit, url=None, fields=None,
-                           **kwargs):
+                           cursor=None, **kwargs):
         resource_list = cls()
 
         setattr(resource_list, resource_list._type, resources)
@@ -110,6 +110,7 @@ class ResourceList(Resource):
             limit,
             url=url,
             fields=fields,
+            cursor=cursor,
             **kwargs
         )
 
@@ -119,9 +120,14 @@ class ResourceList(Resource):
         """Return whether resources has more items."""
         return len(self.collection) and len(self.collection) == limit
 
-    def get_next(self, limit, url=None, fields=None, **kwargs):
-        """Return a link to the next subset of the resources."""
-        if not self.has_next(limit):
+    def get_next(self, limit, url=None, fields=None, cursor=None,
+                 **kwargs):
+        """Return a link to the next subset of the resources.
+
+        If a keyset pagination cursor is given then the link contains it
+        instead of a marker.
+        """
+        if not cursor and not self.has_next(limit):
             return wtypes.Unset
 
         q_args = ''
@@ -133,12 +139,17 @@ class ResourceList(Resource):
             else:
                 q_args += '%s=%s&' % (key, value)
 
+        if cursor:
+            page_arg = 'cursor=%s' % cursor
+        else:
+            page_arg = 'marker=%s' % self.collection[-1].id
+
         resource_args = (
-            '?%(args)slimit=%(limit)d&marker=%(marker)s' %
+            '?%(args)slimit=%(limit)d&%(page_arg)s' %
             {
                 'args': q_args,
                 'limit': limit,
-                'marker': self.collection[-1].id
+                'page_arg': page_arg
             }
         )
 
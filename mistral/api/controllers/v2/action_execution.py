@@ -92,7 +92,8 @@ def _get_action_execution_resource_for_list(action_ex, fields=()):
 
 def _get_action_executions(task_execution_id=None, marker=None, limit=None,
                            sort_keys='created_at', sort_dirs='asc',
-                           fields='', include_output=False, **filters):
+                           fields='', include_output=False, cursor=None,
+                           keyset=False, **filters):
     """Return all action executions.
 
     Where project_id is the same as the requester or
@@ -112,6 +113,9 @@ def _get_action_executions(task_execution_id=None, marker=None, limit=None,
                    be returned. 'id' will be included automatically in
                    fields if it's not provided, since it will be used when
                    constructing 'next' link.
+    :param cursor: Optional. Keyset pagination cursor taken from the 'next'
+                   link of the previous page.
+    :param keyset: Optional. Use keyset pagination.
     :param filters: Optional. A list of filters to apply to the result.
     """
     if task_execution_id:
@@ -133,6 +137,8 @@ def _get_action_executions(task_execution_id=None, marker=None, limit=None,
         sort_keys=sort_keys,
         sort_dirs=sort_dirs,
         fields=fields,
+        cursor=cursor,
+        keyset=keyset,
         **filters
     )
 
@@ -243,13 +249,15 @@ class ActionExecutionsController(rest.RestController):
                          wtypes.text, wtypes.text, wtypes.text,
                          wtypes.text, wtypes.text, wtypes.text, types.uuid,
                          wtypes.text, wtypes.text, bool, types.jsontype,
-                         types.jsontype, types.jsontype, wtypes.text, bool)
+                         types.jsontype, types.jsontype, wtypes.text, bool,
+                         wtypes.text, bool)
     def get_all(self, marker=None, limit=None, sort_keys='created_at',
                 sort_dirs='asc', fields='', created_at=None, name=None,
                 tags=None, updated_at=None, workflow_name=None,
                 task_name=None, task_execution_id=None, state=None,
                 state_info=None, accepted=None, input=None, output=None,
-                params=None, description=None, include_output=False):
+                params=None, description=None, include_output=False,
+                cursor=None, keyset=False):
         """Return all tasks within the execution.
 
         Where project_id is the same as the requester or
@@ -293,6 +301,10 @@ class ActionExecutionsController(rest.RestController):
                            update time and date.
         :param include_output: Optional. Include the output for all executions
                                in the list
+        :param cursor: Optional. Keyset pagination cursor taken from the
+                       'next' link of the previous page.
+        :param keyset: Optional. Use keyset pagination. The 'next' link
+                       contains a cursor instead of a marker.
         """
         acl.enforce('action_executions:list', context.ctx())
 
@@ -314,9 +326,10 @@ class ActionExecutionsController(rest.RestController):
         )
 
         LOG.debug(
-            "Fetch action_executions. marker=%s, limit=%s, "
+            "Fetch action_executions. marker=%s, cursor=%s, limit=%s, "
             "sort_keys=%s, sort_dirs=%s, filters=%s",
             marker,
+            cursor,
             limit,
             sort_keys,
             sort_dirs,
@@ -330,6 +343,8 @@ class ActionExecutionsController(rest.RestController):
             sort_dirs=sort_dirs,
             fields=fields,
             include_output=include_output,
+            cursor=cursor,
+            keyset=keyset,
             **filters
         )
 
@@ -371,14 +386,15 @@ class TasksActionExecutionController(rest.RestController):
                          wtypes.text, types.uniquelist, wtypes.text,
                          wtypes.text, wtypes.text, wtypes.text, wtypes.text,
                          wtypes.text, bool, types.jsontype, types.jsontype,
-                         types.jsontype, wtypes.text, bool)
+                         types.jsontype, wtypes.text, bool, wtypes.text,
+                         bool)
     def get_all(self, task_execution_id, marker=None, limit=None,
                 sort_keys='created_at', sort_dirs='asc', fields='',
                 created_at=None, name=None, tags=None,
                 updated_at=None, workflow_name=None, task_name=None,
                 state=None, state_info=None, accepted=None, input=None,
                 output=None, params=None, description=None,
-                include_output=None):
+                include_output=None, cursor=None, keyset=False):
         """Return all tasks within the execution.
 
         Where project_id is the same as the requester or
@@ -422,6 +438,10 @@ class TasksActionExecutionController(rest.RestController):
                            update time and date.
         :param include_output: Optional. Include the output for all executions
                                in the list
+        :param cursor: Optional. Keyset pagination cursor taken from the
+                       'next' link of the previous page.
+        :param keyset: Optional. Use keyset pagination. The 'next' link
+                       contains a cursor instead of a marker.
         """
         acl.enforce('action_executions:list', context.ctx())
 
@@ -443,9 +463,10 @@ class TasksActionExecutionController(rest.RestController):
         )
 
         LOG.debug(
-            "Fetch action_executions. marker=%s, limit=%s, "
+            "Fetch action_executions. marker=%s, cursor=%s, limit=%s, "
             "sort_keys=%s, sort_dirs=%s, filters=%s",
             marker,
+            cursor,
             limit,
             sort_keys,
             sort_dirs,
@@ -459,6 +480,8 @@ class TasksActionExecutionController(rest.RestController):
             sort_dirs=sort_dirs,
             fields=fields,
             include_output=include_output,
+            cursor=cursor,
+            keyset=keyset,
             **filters
         )
 
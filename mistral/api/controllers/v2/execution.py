@@ -438,7 +438,7 @@ class ExecutionsController(rest.RestController):
                          types.uuid, STATE_TYPES, wtypes.text,
                          types.jsontype, types.jsontype, wtypes.text,
                          wtypes.text, bool, types.uuid,
-                         bool, types.list)
+                         bool, types.list, wtypes.text, bool)
     def get_all(self, marker=None, limit=None,
                 sort_keys='created_at', sort_dirs='asc', fields='',
                 workflow_name=None, workflow_id=None, description=None,
@@ -446,7 +446,7 @@ class ExecutionsController(rest.RestController):
                 root_execution_id=None, state=None, state_info=None,
                 input=None, output=None, created_at=None,
                 updated_at=None, include_output=None, project_id=None,
-                all_projects=False, nulls=''):
+                all_projects=False, nulls='', cursor=None, keyset=False):
 
         """Return all Executions.
 
@@ -493,6 +493,11 @@ class ExecutionsController(rest.RestController):
             required.
         :param nulls: Optional. The names of the columns with null value in
                         the query.
+        :param cursor: Optional. Keyset pagination cursor taken from the
+                       'next' link of the previous page.
+        :param keyset: Optional. Use keyset pagination. The 'next' link
+                       contains a cursor instead of a marker and the total
+                       number of executions is not counted.
         """
         acl.enforce('executions:list', context.ctx())
 
@@ -520,9 +525,9 @@ class ExecutionsController(rest.RestController):
         )
 
         LOG.debug(
-            "Fetch executions. marker=%s, limit=%s, sort_keys=%s, "
-            "sort_dirs=%s, filters=%s, all_projects=%s", marker, limit,
-            sort_keys, sort_dirs, filters, all_projects
+            "Fetch executions. marker=%s, cursor=%s, limit=%s, sort_keys=%s, "
+            "sort_dirs=%s, filters=%s, all_projects=%s", marker, cursor,
+            limit, sort_keys, sort_dirs, filters, all_projects
         )
 
         if include_output:
@@ -543,5 +548,7 @@ class ExecutionsController(rest.RestController):
             sort_dirs=sort_dirs,
             fields=fields,
             all_projects=all_projects,
+            cursor=cursor,
+            keyset=keyset,
             **filters
         )
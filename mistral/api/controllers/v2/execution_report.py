@@ -19,6 +19,7 @@ import wsmeext.pecan as wsme_pecan
 
 from mistral.api.controllers.v2 import resources
 from mistral.api.controllers.v2 import types
+from mistral.db import utils as db_utils
 from mistral.db.v2 import api as db_api
 from mistral.db.v2.sqlalchemy import models as db_models
 from mistral.utils import rest_utils
@@ -68,11 +69,6 @@ def analyse_task_execution(task_ex_id, stat, filters, cur_depth):
 
         child_executions = task_ex.executions
 
-    if 'retry_task_policy' in task_ex.runtime_context:
-        retry_ctx = task_ex.runtime_context['retry_task_policy']
-
-        entry.retry_count = retry_ctx['retry_no']
-
     entry.action_executions = []
     entry.workflow_executions = []
 
@@ -192,6 +188,7 @@ def estimate_time_for_execution(ex_id):
     return 0
 
 
+@db_utils.collect_query_stats('execution_report')
 def build_report(wf_ex_id, filters):
     report = resources.ExecutionReport()
 
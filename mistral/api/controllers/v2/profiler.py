@@ -0,0 +1,77 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from oslo_log import log as logging
+from pecan import rest
+from wsme import types as wtypes
+import wsmeext.pecan as wsme_pecan
+
+from mistral.api import access_control as acl
+from mistral.api.controllers.v2 import resources
+from mistral import context
+from mistral import exceptions as exc
+from mistral.rpc import clients as rpc
+from mistral.utils import rest_utils
+
+
+LOG = logging.getLogger(__name__)
+
+
+class ProfilerController(rest.RestController):
+    @rest_utils.wrap_wsme_controller_exception
+    @wsme_pecan.wsexpose(resources.ProfilerStats, wtypes.text)
+    def get(self, host=None):
+        """Return aggregated profiler statistics of an engine.
+
+        :param host: Optional. Host of the engine. If not specified,
+            the statistics of any engine are returned.
+        """
+        acl.enforce('profiler:get', context.ctx())
+
+        LOG.debug("Fetch profiler statistics [host=%s]", host)
+
+        stats = rpc.get_engine_client().get_profiler_stats(host)
+
+        return resources.ProfilerStats.from_dict(stats)
+
+    @rest_utils.wrap_wsme_controller_exception
+    @wsme_pecan.wsexpose(
+        None,
+        body=resources.ProfilerSettings,
+        status_code=202
+    )
+    def put(self, settings):
+        """Change profiler aggregation settings of all engines.
+
+        :param settings: Required. Settings to change. The settings that
+            are not specified remain the same.
+        """
+        acl.enforce('profiler:update', context.ctx())
+
+        LOG.debug("Update profiler settings [settings=%s]", settings)
+
+        settings = settings.to_dict()
+
+        sampling_rate = settings.get('sampling_rate')
+
+        if sampling_rate is not None and not 0 <= sampling_rate <= 1:
+            raise exc.InputException(
+                'Sampling rate must be between 0 and 1: %s' % sampling_rate
+            )
+
+        rpc.get_engine_client().configure_profiler(
+            enabled=settings.get('enabled'),
+            sampling_rate=sampling_rate,
+            reset=settings.get('reset', False)
+        )
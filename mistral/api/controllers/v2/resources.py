@@ -1146,3 +1146,71 @@ class WithItemsStatisticsResource(resource.Resource):
             SKIPPED=0,
             CANCELLED=0
         )
+
+
+class ProfilerTrace(resource.Resource):
+    """Aggregated statistics of a profiler trace, in seconds."""
+
+    name = wtypes.text
+    count = wtypes.IntegerType(minimum=0)
+    total = float
+    avg = float
+    max = float
+    p50 = float
+    p95 = float
+    p99 = float
+
+    @classmethod
+    def sample(cls):
+        return cls(
+            name='engine-on-action-complete',
+            count=1000,
+            total=25.0,
+            avg=0.025,
+            max=0.6,
+            p50=0.02,
+            p95=0.05,
+            p99=0.2
+        )
+
+
+class ProfilerStats(resource.Resource):
+    """Aggregated profiler statistics of an engine."""
+
+    host = wtypes.text
+    enabled = bool
+    sampling_rate = float
+    started_at = wtypes.text
+    traces = [ProfilerTrace]
+
+    @classmethod
+    def from_dict(cls, d):
+        obj = super(ProfilerStats, cls).from_dict(
+            {k: v for k, v in d.items() if k != 'traces'}
+        )
+
+        obj.traces = [ProfilerTrace.from_dict(t) for t in d.get('traces', [])]
+
+        return obj
+
+    @classmethod
+    def sample(cls):
+        return cls(
+            host='host1',
+            enabled=True,
+            sampling_rate=0.1,
+            started_at='1970-01-01T00:00:00.000000',
+            traces=[ProfilerTrace.sample()]
+        )
+
+
+class ProfilerSettings(resource.Resource):
+    """Profiler aggregation settings."""
+
+    enabled = bool
+    sampling_rate = float
+    reset = bool
+
+    @classmethod
+    def sample(cls):
+        return cls(enabled=True, sampling_rate=0.1, reset=False)
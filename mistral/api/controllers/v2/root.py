@@ -26,6 +26,7 @@ from mistral.api.controllers.v2 import dynamic_action
 from mistral.api.controllers.v2 import environment
 from mistral.api.controllers.v2 import event_trigger
 from mistral.api.controllers.v2 import execution
+from mistral.api.controllers.v2 import profiler
 from mistral.api.controllers.v2 import service
 from mistral.api.controllers.v2 import task
 from mistral.api.controllers.v2 import workbook
@@ -60,6 +61,7 @@ class Controller(object):
     action_executions = action_execution.ActionExecutionsController()
     services = service.ServicesController()
     event_triggers = event_trigger.EventTriggersController()
+    profiler = profiler.ProfilerController()
 
     @wsme_pecan.wsexpose(RootResource)
     def index(self):
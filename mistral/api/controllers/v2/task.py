@@ -244,14 +244,14 @@ class TasksController(rest.RestController):
                          types.uuid, types.uniquelist, STATE_TYPES,
                          wtypes.text, wtypes.text, types.jsontype,
                          bool, wtypes.text, wtypes.text,
-                         bool, types.jsontype)
+                         bool, types.jsontype, wtypes.text, bool)
     def get_all(self, marker=None, limit=None, sort_keys='created_at',
                 sort_dirs='asc', fields='', name=None,
                 workflow_name=None, workflow_id=None,
                 workflow_execution_id=None, tags=None, state=None,
                 state_info=None, result=None, published=None,
                 processed=None, created_at=None, updated_at=None,
-                reset=None, env=None):
+                reset=None, env=None, cursor=None, keyset=False):
         """Return all tasks.
 
         Where project_id is the same as the requester or
@@ -293,6 +293,11 @@ class TasksController(rest.RestController):
                            time and date.
         :param updated_at: Optional. Keep only resources with specific latest
                            update time and date.
+        :param cursor: Optional. Keyset pagination cursor taken from the
+                       'next' link of the previous page.
+        :param keyset: Optional. Use keyset pagination. The 'next' link
+                       contains a cursor instead of a marker and the total
+                       number of tasks is not counted.
         """
         acl.enforce('tasks:list', context.ctx())
 
@@ -314,8 +319,9 @@ class TasksController(rest.RestController):
         )
 
         LOG.debug(
-            "Fetch tasks. marker=%s, limit=%s, sort_keys=%s, sort_dirs=%s,"
-            " filters=%s", marker, limit, sort_keys, sort_dirs, filters
+            "Fetch tasks. marker=%s, cursor=%s, limit=%s, sort_keys=%s, "
+            "sort_dirs=%s, filters=%s", marker, cursor, limit, sort_keys,
+            sort_dirs, filters
         )
 
         return rest_utils.get_all(
@@ -329,6 +335,8 @@ class TasksController(rest.RestController):
             sort_keys=sort_keys,
             sort_dirs=sort_dirs,
             fields=fields,
+            cursor=cursor,
+            keyset=keyset,
             **filters
         )
 
@@ -427,13 +435,15 @@ class ExecutionTasksController(rest.RestController):
                          wtypes.text, wtypes.text, types.uuid,
                          types.uniquelist, STATE_TYPES, wtypes.text,
                          wtypes.text, types.jsontype, bool,
-                         wtypes.text, wtypes.text, bool, types.jsontype)
+                         wtypes.text, wtypes.text, bool, types.jsontype,
+                         wtypes.text, bool)
     def get_all(self, workflow_execution_id, marker=None, limit=None,
                 sort_keys='created_at', sort_dirs='asc', fields='',
                 name=None, workflow_name=None, workflow_id=None,
                 tags=None, state=None, state_info=None,
                 result=None, published=None, processed=None,
-                created_at=None, updated_at=None, reset=None, env=None):
+                created_at=None, updated_at=None, reset=None, env=None,
+                cursor=None, keyset=False):
         """Return all tasks within the execution.
 
         Where project_id is the same as the requester or
@@ -476,6 +486,11 @@ class ExecutionTasksController(rest.RestController):
                            time and date.
         :param updated_at: Optional. Keep only resources with specific latest
                            update time and date.
+        :param cursor: Optional. Keyset pagination cursor taken from the
+                       'next' link of the previous page.
+        :param keyset: Optional. Use keyset pagination. The 'next' link
+                       contains a cursor instead of a marker and the total
+                       number of tasks is not counted.
         """
         acl.enforce('tasks:list', context.ctx())
 
@@ -503,10 +518,10 @@ class ExecutionTasksController(rest.RestController):
         )
 
         LOG.debug(
-            "Fetch tasks. workflow_execution_id=%s, marker=%s, limit=%s, "
-            "sort_keys=%s, sort_dirs=%s, filters=%s",
-            workflow_execution_id, marker, limit, sort_keys, sort_dirs,
-            filters
+            "Fetch tasks. workflow_execution_id=%s, marker=%s, cursor=%s, "
+            "limit=%s, sort_keys=%s, sort_dirs=%s, filters=%s",
+            workflow_execution_id, marker, cursor, limit, sort_keys,
+            sort_dirs, filters
         )
 
         return rest_utils.get_all(
@@ -520,5 +535,7 @@ class ExecutionTasksController(rest.RestController):
             sort_keys=sort_keys,
             sort_dirs=sort_dirs,
             fields=fields,
+            cursor=cursor,
+            keyset=keyset,
             **filters
         )
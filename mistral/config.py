@@ -161,6 +161,33 @@ js_impl_opt = cfg.StrOpt(
            'action to evaluate scripts.')
 )
 
+js_context_pool_size_opt = cfg.IntOpt(
+    'js_context_pool_size',
+    default=4,
+    min=0,
+    help=_('The maximum number of warm JavaScript contexts kept by the '
+           'py_mini_racer implementation for reuse. Scripts are compiled '
+           'once per context and then only called with new data. If set '
+           'to 0 then a new context is created for every script.')
+)
+
+js_context_max_memory_opt = cfg.IntOpt(
+    'js_context_max_memory',
+    default=0,
+    min=0,
+    help=_('The maximum amount of memory in MB that a script evaluated by '
+           'the py_mini_racer implementation may use. 0 means no limit.')
+)
+
+js_context_max_idle_memory_opt = cfg.IntOpt(
+    'js_context_max_idle_memory',
+    default=64,
+    min=1,
+    help=_('A pooled py_mini_racer context whose heap is larger than this '
+           'value in MB after evaluating a script is discarded instead '
+           'of being reused.')
+)
+
 rpc_impl_opt = cfg.StrOpt(
     'rpc_implementation',
     default='oslo',
@@ -294,6 +321,99 @@ engine_opts = [
         default="replace",
         help=_('Merge strategy of data inside workflow execution. '
                '(replace, merge)')
+    ),
+    cfg.BoolOpt(
+        'lock_global_publish',
+        default=False,
+        help=_('If enabled then variables published globally by a task are '
+               'merged into the workflow execution context while the '
+               'workflow execution row is locked. It guarantees that tasks '
+               'of the same workflow execution completing in parallel do '
+               'not lose each other variables. Task completions that do not '
+               'publish global variables are not affected.')
+    ),
+    cfg.StrOpt(
+        'named_lock_backend',
+        choices=['table', 'advisory'],
+        default='table',
+        help=_('The backend of named locks used by the engine to serialize '
+               'operations on the same task execution. "table" inserts and '
+               'deletes rows of the named_locks table. "advisory" uses '
+               'transaction scoped PostgreSQL advisory locks that do not '
+               'write anything and are released automatically when the '
+               'transaction ends. It is ignored for other databases and '
+               'for locks taken outside of a transaction.')
+    ),
+    cfg.BoolOpt(
+        'execution_state_counters',
+        default=False,
+        help=_('If enabled then engines keep the number of workflow, task '
+               'and action executions in every state in the '
+               'execution_state_counters table and the monitoring service '
+               'reads the metrics of executions by state from it instead of '
+               'counting the rows of the execution tables.')
+    ),
+    cfg.IntOpt(
+        'execution_state_counters_flush_interval',
+        default=10,
+        min=1,
+        help=_('How often, in seconds, an engine writes the changes of '
+               'execution states made since the previous flush to the '
+               'execution_state_counters table.')
+    ),
+    cfg.IntOpt(
+        'post_tx_queue_pool_size',
+        default=64,
+        min=0,
+        help=_('The number of worker threads that run operations scheduled '
+               'by the engine after a DB transaction, such as sending RPC '
+               'calls to start tasks or run actions. If set to 0 then '
+               'a new thread is spawned for every transaction and the '
+               'number of such threads is not limited.')
+    ),
+    cfg.IntOpt(
+        'post_tx_queue_max_size',
+        default=1024,
+        min=0,
+        help=_('The maximum number of pending post transaction work items '
+               'waiting for a free worker thread. If set to 0 then the '
+               'queue is not limited. What happens when the queue is full '
+               'is defined by the "post_tx_queue_overflow_policy" '
+               'property.')
+    ),
+    cfg.StrOpt(
+        'post_tx_queue_overflow_policy',
+        choices=['block', 'inline', 'spawn'],
+        default='block',
+        help=_('Defines what the engine does when the post transaction '
+               'queue is full. "block" - wait for a free slot in the queue '
+               'which slows down processing of incoming engine requests, '
+               '"inline" - run the operations in the current thread, '
+               '"spawn" - run the operations in a new thread (the legacy '
+               'behaviour).')
+    ),
+    cfg.IntOpt(
+        'spec_cache_max_memory',
+        default=256,
+        min=1,
+        help=_('The maximum estimated memory in MB taken by workflow '
+               'specifications cached by the engine. Workflow executions '
+               'of the same workflow share one cached specification.')
+    ),
+    cfg.IntOpt(
+        'spec_cache_max_entries',
+        default=10000,
+        min=1,
+        help=_('The maximum number of workflow executions and, separately, '
+               'workflow definitions whose specifications are cached by '
+               'the engine.')
+    ),
+    cfg.BoolOpt(
+        'spec_cache_warm_up',
+        default=True,
+        help=_('If this value is set to True then the engine caches '
+               'specifications of running workflow executions when it '
+               'starts.')
     )
 ]
 
@@ -338,6 +458,25 @@ executor_opts = [
         'version',
         default='1.0',
         help=_('The version of the executor.')
+    ),
+    cfg.IntOpt(
+        'process_pool_size',
+        default=0,
+        min=0,
+        help=_('The number of worker processes started by the executor to '
+               'run CPU-bound actions so that they do not block other '
+               'actions, heartbeats and RPC calls handled by the executor. '
+               'Only actions listed in process_pool_actions or having the '
+               'class attribute "run_in_process" set to True are run in '
+               'the worker processes. If set to 0 then all actions are run '
+               'within the executor process.')
+    ),
+    cfg.ListOpt(
+        'process_pool_actions',
+        default=[],
+        help=_('Full names of the action classes that are run in the worker '
+               'processes, for example '
+               '"mistral.actions.std_actions.JavaScriptAction".')
     )
 ]
 
@@ -493,6 +632,37 @@ notifier_opts = [
         item_type=json.loads,
         bounds=True,
         help=_('List of publishers to publish notification.')
+    ),
+    cfg.IntOpt(
+        'webhook_pool_parallelism',
+        default=10,
+        min=1,
+        help=_('The maximum number of webhook requests that the '
+               '"webhook_pool" publisher sends concurrently. Requests to '
+               'the same URL are always sent one by one in order.')
+    ),
+    cfg.IntOpt(
+        'webhook_pool_queue_size',
+        default=10000,
+        min=1,
+        help=_('The maximum number of notifications waiting for delivery '
+               'to one URL in the "webhook_pool" publisher. When the queue '
+               'of a URL is full new notifications for it are dropped.')
+    ),
+    cfg.FloatOpt(
+        'webhook_pool_retry_delay',
+        default=1.0,
+        min=0,
+        help=_('The initial delay in seconds before a failed webhook '
+               'request is retried by the "webhook_pool" publisher. The '
+               'delay is doubled after every unsuccessful attempt.')
+    ),
+    cfg.FloatOpt(
+        'webhook_pool_max_retry_delay',
+        default=60.0,
+        min=0,
+        help=_('The maximum delay in seconds between retries of a failed '
+               'webhook request.')
     )
 ]
 
@@ -672,6 +842,47 @@ action_logging_opts = [
     )
 ]
 
+http_connection_pool_opts = [
+    cfg.BoolOpt(
+        'enabled',
+        default=False,
+        help=_('If this value is set to True then HTTP requests made by '
+               'std.http and std.mistral_http actions reuse connections '
+               'from a connection pool shared within the executor process '
+               'instead of opening a new connection for every action.')
+    ),
+    cfg.IntOpt(
+        'max_pools',
+        default=100,
+        min=1,
+        help=_('The maximum number of connection pools kept by the '
+               'executor. There is one pool per combination of a scheme, '
+               'host, SSL verification setting and proxies. The least '
+               'recently used pool is closed when the limit is exceeded.')
+    ),
+    cfg.IntOpt(
+        'max_connections_per_host',
+        default=10,
+        min=1,
+        help=_('The maximum number of connections to one host kept open '
+               'in a connection pool.')
+    ),
+    cfg.IntOpt(
+        'idle_timeout',
+        default=60,
+        min=1,
+        help=_('A number of seconds after which a connection pool that has '
+               'not been used is closed.')
+    ),
+    cfg.IntOpt(
+        'stream_chunk_size',
+        default=65536,
+        min=1,
+        help=_('The size of a chunk in bytes used to read a response body '
+               'when an HTTP action runs in the streaming mode.')
+    )
+]
+
 context_versioning_opts = [
     cfg.BoolOpt(
         'enabled',
@@ -719,6 +930,34 @@ profiler_opts.append(
         help=_('Logger name for the osprofiler trace output.')
     )
 )
+profiler_opts.extend([
+    cfg.BoolOpt(
+        'aggregate',
+        default=False,
+        help=_('If this value is set to True then the trace points are not '
+               'written to the profiler log. Instead, every service keeps '
+               'per trace statistics in memory (count, total, average, '
+               'maximum time and percentiles) that are available through '
+               'the profiler API. Requires the profiler to be enabled.')
+    ),
+    cfg.FloatOpt(
+        'sampling_rate',
+        default=1.0,
+        min=0.0,
+        max=1.0,
+        help=_('The fraction of trace points that are aggregated if the '
+               '"aggregate" option is enabled. It can be changed at runtime '
+               'through the profiler API.')
+    ),
+    cfg.IntOpt(
+        'aggregate_samples',
+        default=1000,
+        min=1,
+        help=_('The number of the latest durations of every trace that are '
+               'kept to calculate percentiles if the "aggregate" option is '
+               'enabled.')
+    )
+])
 
 keycloak_oidc_opts = [
     cfg.StrOpt(
@@ -908,10 +1147,26 @@ monitoring_opts = [
         default=30,
         help=('Metric collection interval')
     ),
+    cfg.IntOpt(
+        'metric_collector_timeout',
+        min=1,
+        default=20,
+        help=_('The maximum time in seconds to wait for one metric '
+               'collector. If a collector fails or does not respond in '
+               'time then its previous metrics are reported.')
+    ),
     cfg.BoolOpt(
         'tls_enabled',
         default=False,
         help=('Parameter to enable TLS to monitoring service.')
+    ),
+    cfg.IntOpt(
+        'state_counters_reconcile_interval',
+        min=1,
+        default=600,
+        help=_('How often, in seconds, the execution state counters are '
+               'recalculated from the execution tables. Used only if '
+               'the "execution_state_counters" engine option is enabled.')
     )
 ]
 
@@ -959,6 +1214,185 @@ recovery_job_opts = [
     )
 ]
 
+ssh_connection_pool_opts = [
+    cfg.BoolOpt(
+        'enabled',
+        default=False,
+        help=_('If this value is set to True then std.ssh and '
+               'std.ssh_proxied actions reuse SSH connections opened by '
+               'previous actions to the same host with the same '
+               'credentials instead of connecting for every command.')
+    ),
+    cfg.IntOpt(
+        'max_idle_connections',
+        default=100,
+        min=1,
+        help=_('The maximum number of idle SSH connections kept by the '
+               'executor. The least recently used connection is closed '
+               'when the limit is exceeded.')
+    ),
+    cfg.IntOpt(
+        'idle_timeout',
+        default=60,
+        min=1,
+        help=_('A number of seconds after which an idle SSH connection is '
+               'closed.')
+    ),
+    cfg.IntOpt(
+        'max_output_size',
+        default=0,
+        min=0,
+        help=_('The maximum size in bytes of stdout and stderr of an SSH '
+               'command kept by the executor. The rest of the output is '
+               'read and discarded. 0 means no limit.')
+    )
+]
+
+process_metrics_opts = [
+    cfg.BoolOpt(
+        'enabled',
+        default=False,
+        help=_('If this value is set to True then engine, executor and '
+               'notifier processes measure the time of their main '
+               'operations, such as RPC calls, DB transactions, lock waits '
+               'and expression evaluation, and export the metrics in the '
+               'Prometheus format.')
+    ),
+    cfg.HostAddressOpt(
+        'host',
+        default='0.0.0.0',
+        help=_('The address of the HTTP endpoint that exports the metrics '
+               'of the process.')
+    ),
+    cfg.PortOpt(
+        'port',
+        default=9091,
+        help=_('The port of the HTTP endpoint that exports the metrics of '
+               'the process. If several processes run on the same host '
+               'then only the first one exports the metrics.')
+    ),
+]
+
+query_instrumentation_opts = [
+    cfg.BoolOpt(
+        'enabled',
+        default=False,
+        help=_('If this value is set to True then the number of DB '
+               'transactions, statements, rows and the time of the '
+               'statements made by every top-level engine operation are '
+               'counted. The operations exceeding the thresholds below are '
+               'logged.')
+    ),
+    cfg.IntOpt(
+        'max_queries',
+        default=100,
+        min=0,
+        help=_('The number of DB statements made by one operation above '
+               'which the operation is logged. 0 means no limit.')
+    ),
+    cfg.FloatOpt(
+        'max_query_time',
+        default=1.0,
+        min=0,
+        help=_('The total time of DB statements made by one operation in '
+               'seconds above which the operation is logged. 0 means no '
+               'limit.')
+    ),
+    cfg.IntOpt(
+        'max_repeated_queries',
+        default=20,
+        min=0,
+        help=_('The number of times the same DB statement is made by one '
+               'operation above which the operation is logged. It usually '
+               'means that the objects are loaded one by one in a loop '
+               '(the N+1 problem). 0 means no limit.')
+    ),
+]
+
+action_lookup_cache_opts = [
+    cfg.BoolOpt(
+        'enabled',
+        default=True,
+        help=_('If this value is set to True then results of action lookups '
+               'by name in ad-hoc actions are cached in memory, including '
+               'the actions that are not found. The cache is dropped once '
+               'ad-hoc actions are changed.')
+    ),
+    cfg.IntOpt(
+        'size',
+        default=1000,
+        min=1,
+        help=_('The maximum number of action lookup results cached per '
+               'action provider.')
+    ),
+    cfg.IntOpt(
+        'state_check_interval',
+        default=5,
+        min=0,
+        help=_('A number of seconds during which cached action lookup '
+               'results are used without checking whether the actions of '
+               'the corresponding action provider have been changed. So '
+               'changes of actions may be noticed by other processes with '
+               'this delay. 0 means that the check, an aggregate query '
+               'over all action definitions, is made on every action '
+               'lookup.')
+    )
+]
+
+dynamic_action_provider_opts = [
+    cfg.IntOpt(
+        'version_check_interval',
+        default=5,
+        min=0,
+        help=_('A number of seconds during which dynamic action definitions '
+               'and code source modules loaded by the dynamic action '
+               'provider are used without checking whether they have been '
+               'changed in DB. So changes of dynamic actions may be '
+               'noticed by other processes with this delay. 0 means that '
+               'the check, a single aggregate query, is made on every '
+               'action lookup.')
+    ),
+    cfg.IntOpt(
+        'cache_size',
+        default=1000,
+        min=1,
+        help=_('The maximum number of dynamic action lookup results cached '
+               'by the dynamic action provider.')
+    )
+]
+
+kombu_rpc_opts = [
+    cfg.IntOpt(
+        'prefetch_count',
+        default=0,
+        min=0,
+        max=65535,
+        help=_('The maximum number of unacknowledged messages delivered to '
+               'a Kombu RPC server. If set to 0 then it equals the number of '
+               'worker threads of the server so that every free worker '
+               'always has a message to process.')
+    ),
+    cfg.DictOpt(
+        'method_concurrency',
+        default={},
+        help=_('The maximum number of concurrent calls of particular RPC '
+               'methods handled by one Kombu RPC server, for example '
+               '"run_action:32,start_task:16". Messages of a method that '
+               'reached its limit wait without occupying a worker thread '
+               'and extend the prefetch window so that messages of other '
+               'methods are still delivered.')
+    ),
+    cfg.ListOpt(
+        'ack_on_accept_methods',
+        default=['process_action_heartbeats'],
+        help=_('Asynchronous RPC methods whose messages are acknowledged '
+               'as soon as they are accepted for processing rather than '
+               'after processing. Such messages are lost if the server '
+               'dies while processing them, so only idempotent methods '
+               'that tolerate a lost call should be listed.')
+    )
+]
+
 rabbitmq_opts = [
     cfg.StrOpt(
         'management_host',
@@ -995,6 +1429,13 @@ EXECUTION_EXPIRATION_POLICY_GROUP = 'execution_expiration_policy'
 ACTION_HEARTBEAT_GROUP = 'action_heartbeat'
 ACTION_LOGGING_GROUP = 'action_logging'
 CONTEXT_VERSIONING_GROUP = 'context_versioning'
+HTTP_CONNECTION_POOL_GROUP = 'http_connection_pool'
+KOMBU_RPC_GROUP = 'kombu_rpc'
+ACTION_LOOKUP_CACHE_GROUP = 'action_lookup_cache'
+DYNAMIC_ACTION_PROVIDER_GROUP = 'dynamic_action_provider'
+SSH_CONNECTION_POOL_GROUP = 'ssh_connection_pool'
+PROCESS_METRICS_GROUP = 'process_metrics'
+QUERY_INSTRUMENTATION_GROUP = 'query_instrumentation'
 PROFILER_GROUP = profiler.list_opts()[0][0]
 KEYCLOAK_OIDC_GROUP = "keycloak_oidc"
 YAQL_GROUP = "yaql"
@@ -1010,6 +1451,9 @@ CONF.register_opt(wf_trace_log_name_opt)
 CONF.register_opt(auth_type_opt)
 CONF.register_opt(scheduler_type_opt)
 CONF.register_opt(js_impl_opt)
+CONF.register_opt(js_context_pool_size_opt)
+CONF.register_opt(js_context_max_memory_opt)
+CONF.register_opt(js_context_max_idle_memory_opt)
 CONF.register_opt(rpc_impl_opt)
 CONF.register_opt(rpc_response_timeout_opt)
 CONF.register_opt(oslo_rpc_executor)
@@ -1034,6 +1478,28 @@ CONF.register_opts(
 )
 CONF.register_opts(action_logging_opts, group=ACTION_LOGGING_GROUP)
 CONF.register_opts(context_versioning_opts, group=CONTEXT_VERSIONING_GROUP)
+CONF.register_opts(
+    http_connection_pool_opts,
+    group=HTTP_CONNECTION_POOL_GROUP
+)
+CONF.register_opts(kombu_rpc_opts, group=KOMBU_RPC_GROUP)
+CONF.register_opts(
+    action_lookup_cache_opts,
+    group=ACTION_LOOKUP_CACHE_GROUP
+)
+CONF.register_opts(
+    dynamic_action_provider_opts,
+    group=DYNAMIC_ACTION_PROVIDER_GROUP
+)
+CONF.register_opts(
+    ssh_connection_pool_opts,
+    group=SSH_CONNECTION_POOL_GROUP
+)
+CONF.register_opts(process_metrics_opts, group=PROCESS_METRICS_GROUP)
+CONF.register_opts(
+    query_instrumentation_opts,
+    group=QUERY_INSTRUMENTATION_GROUP
+)
 CONF.register_opts(event_engine_opts, group=EVENT_ENGINE_GROUP)
 CONF.register_opts(notifier_opts, group=NOTIFIER_GROUP)
 CONF.register_opts(pecan_opts, group=PECAN_GROUP)
@@ -1062,6 +1528,9 @@ default_group_opts = itertools.chain(
         auth_type_opt,
         scheduler_type_opt,
         js_impl_opt,
+        js_context_pool_size_opt,
+        js_context_max_memory_opt,
+        js_context_max_idle_memory_opt,
         rpc_impl_opt,
         rpc_response_timeout_opt,
         oslo_rpc_executor,
@@ -1102,6 +1571,13 @@ def list_opts():
         (ACTION_HEARTBEAT_GROUP, action_heartbeat_opts),
         (ACTION_LOGGING_GROUP, action_logging_opts),
         (CONTEXT_VERSIONING_GROUP, context_versioning_opts),
+        (HTTP_CONNECTION_POOL_GROUP, http_connection_pool_opts),
+        (KOMBU_RPC_GROUP, kombu_rpc_opts),
+        (ACTION_LOOKUP_CACHE_GROUP, action_lookup_cache_opts),
+        (DYNAMIC_ACTION_PROVIDER_GROUP, dynamic_action_provider_opts),
+        (SSH_CONNECTION_POOL_GROUP, ssh_connection_pool_opts),
+        (PROCESS_METRICS_GROUP, process_metrics_opts),
+        (QUERY_INSTRUMENTATION_GROUP, query_instrumentation_opts),
         (None, default_group_opts)
     ]
 
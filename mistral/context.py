@@ -29,6 +29,7 @@ from pecan import hooks
 
 from mistral import auth
 from mistral import exceptions as exc
+from mistral.utils import profiler as profiler_utils
 from mistral_lib import utils
 
 
@@ -266,6 +267,10 @@ class RpcContextSerializer(messaging.Serializer):
 
         if trace_info:
             profiler.init(**trace_info)
+        elif profiler_utils.is_aggregating():
+            # Aggregated trace points don't need to be related to the
+            # ones of the caller, the RPC call is traced on its own.
+            profiler.init(CONF.profiler.hmac_keys)
 
         ctx = MistralContext.from_dict(context)
 
@@ -13,11 +13,16 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import collections
+import contextlib
+import time
+
 import cachetools
 
 from oslo_config import cfg
 from oslo_db import options
 from oslo_db.sqlalchemy import enginefacade
+from oslo_log import log as logging
 import osprofiler.sqlalchemy
 import sqlalchemy as sa
 from sqlalchemy.sql import column
@@ -26,12 +31,18 @@ from mistral.db.sqlalchemy import sqlite_lock
 from mistral import exceptions as exc
 from mistral_lib import utils
 
+LOG = logging.getLogger(__name__)
+
 
 # Note(dzimine): sqlite only works for basic testing.
 options.set_defaults(cfg.CONF, connection="sqlite:///mistral.sqlite")
 
 _DB_SESSION_THREAD_LOCAL_NAME = "__db_sql_alchemy_session__"
 _TX_SCOPED_CACHE_THREAD_LOCAL_NAME = "__tx_scoped_cache__"
+_QUERY_STATS_THREAD_LOCAL_NAME = "__db_query_stats__"
+
+# Functions called with the statistics of every completed operation.
+_QUERY_STATS_LISTENERS = []
 
 _facade = None
 _sqlalchemy_create_engine_orig = sa.create_engine
@@ -56,6 +67,8 @@ def _get_facade():
                     'db'
                 )
 
+        _add_query_instrumentation(_facade.get_engine())
+
     return _facade
 
 
@@ -72,6 +85,165 @@ def _sqlalchemy_create_engine_wrapper(*args, **kwargs):
     return _sqlalchemy_create_engine_orig(*args, **kwargs)
 
 
+class QueryStats(object):
+    """Statistics of the DB statements made by an operation."""
+
+    def __init__(self, operation):
+        self.operation = operation
+        self.transactions = 0
+        self.queries = 0
+        self.rows = 0
+        self.time = 0.0
+        self.statements = collections.Counter()
+
+    def add(self, statement, rows, duration):
+        self.queries += 1
+        self.rows += rows
+        self.time += duration
+        self.statements[statement] += 1
+
+    def get_most_repeated(self):
+        """Returns the most repeated statement and its number."""
+        most_common = self.statements.most_common(1)
+
+        return most_common[0] if most_common else (None, 0)
+
+    def get_exceeded_thresholds(self):
+        conf = cfg.CONF.query_instrumentation
+
+        exceeded = []
+
+        if conf.max_queries and self.queries > conf.max_queries:
+            exceeded.append('max_queries')
+
+        if conf.max_query_time and self.time > conf.max_query_time:
+            exceeded.append('max_query_time')
+
+        if (conf.max_repeated_queries and
+                self.get_most_repeated()[1] > conf.max_repeated_queries):
+            exceeded.append('max_repeated_queries')
+
+        return exceeded
+
+    def to_dict(self):
+        statement, repeated = self.get_most_repeated()
+
+        return {
+            'operation': self.operation,
+            'transactions': self.transactions,
+            'queries': self.queries,
+            'rows': self.rows,
+            'time': self.time,
+            'most_repeated_query': statement,
+            'most_repeated_count': repeated
+        }
+
+
+def _get_query_stats():
+    return utils.get_thread_local(_QUERY_STATS_THREAD_LOCAL_NAME)
+
+
+def _on_begin(conn):
+    stats = _get_query_stats()
+
+    if stats is not None:
+        stats.transactions += 1
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context,
+                           executemany):
+    if _get_query_stats() is not None:
+        conn.info.setdefault('query_start_time', []).append(time.monotonic())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context,
+                          executemany):
+    stats = _get_query_stats()
+    start_times = conn.info.get('query_start_time')
+
+    if stats is None or not start_times:
+        return
+
+    stats.add(
+        statement,
+        max(cursor.rowcount, 0),
+        time.monotonic() - start_times.pop()
+    )
+
+
+def _add_query_instrumentation(engine):
+    # The listeners do nothing unless the statistics are collected
+    # in the current thread.
+    sa.event.listen(engine, 'begin', _on_begin)
+    sa.event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    sa.event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def add_query_stats_listener(listener):
+    """Adds a function called with the statistics of every operation.
+
+    The statistics are collected regardless of the configuration while
+    there are listeners.
+    """
+    _QUERY_STATS_LISTENERS.append(listener)
+
+
+def remove_query_stats_listener(listener):
+    _QUERY_STATS_LISTENERS.remove(listener)
+
+
+def _report_query_stats(stats):
+    # Imported here because the package "mistral.utils" loads expression
+    # functions that need the configuration to be registered first.
+    from mistral.utils import metrics
+
+    metrics.increment(metrics.DB_QUERIES, stats.operation, stats.queries)
+
+    for listener in list(_QUERY_STATS_LISTENERS):
+        listener(stats)
+
+    if not cfg.CONF.query_instrumentation.enabled:
+        return
+
+    exceeded = stats.get_exceeded_thresholds()
+
+    if exceeded:
+        LOG.warning(
+            "DB statements of the operation exceeded thresholds %s: %s",
+            exceeded,
+            stats.to_dict()
+        )
+
+
+@contextlib.contextmanager
+def query_stats(operation):
+    """Collects statistics of the DB statements made within the block.
+
+    Only the outermost block in a thread collects statistics so that all
+    the statements are attributed to the top-level operation.
+
+    :param operation: Name of the operation.
+    :return: Collected statistics or None if they're not collected.
+    """
+    if _get_query_stats() is not None or not (
+            cfg.CONF.query_instrumentation.enabled or
+            _QUERY_STATS_LISTENERS):
+        yield None
+
+        return
+
+    stats = QueryStats(operation)
+
+    utils.set_thread_local(_QUERY_STATS_THREAD_LOCAL_NAME, stats)
+
+    try:
+        yield stats
+    finally:
+        utils.set_thread_local(_QUERY_STATS_THREAD_LOCAL_NAME, None)
+
+        _report_query_stats(stats)
+
+
 def get_engine():
     # If the patch was not applied yet.
     if sa.create_engine != _sqlalchemy_create_engine_wrapper:
@@ -89,6 +261,11 @@ def _get_thread_local_session():
     return utils.get_thread_local(_DB_SESSION_THREAD_LOCAL_NAME)
 
 
+def in_transaction():
+    """Returns True if a transaction has been started in this thread."""
+    return _get_thread_local_session() is not None
+
+
 def get_tx_scoped_cache():
     return utils.get_thread_local(_TX_SCOPED_CACHE_THREAD_LOCAL_NAME)
 
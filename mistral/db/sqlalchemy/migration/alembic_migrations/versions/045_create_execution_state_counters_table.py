@@ -0,0 +1,43 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""create execution state counters table
+
+Revision ID: 045
+Revises: 044
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '045'
+down_revision = '044'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.create_table(
+        'execution_state_counters',
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('entity', sa.String(length=80), nullable=False),
+        sa.Column('project_id', sa.String(length=80), nullable=False),
+        sa.Column('state', sa.String(length=20), nullable=False),
+        sa.Column('count', sa.BigInteger, nullable=False),
+        sa.UniqueConstraint('entity', 'project_id', 'state'),
+    )
@@ -0,0 +1,102 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""add retry_count to task executions
+
+Revision ID: 046
+Revises: 045
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '046'
+down_revision = '045'
+
+import json
+
+from alembic import op
+from mistral.db.utils import column_exists
+import sqlalchemy as sa
+
+
+BATCH_SIZE = 1000
+
+
+def _backfill_postgresql():
+    op.execute(
+        "UPDATE task_executions_v2 SET retry_count = CAST("
+        "CAST(runtime_context AS jsonb) #>> "
+        "'{retry_task_policy,retry_no}' AS INTEGER) "
+        "WHERE runtime_context LIKE '%retry_no%' AND "
+        "CAST(runtime_context AS jsonb) #>> "
+        "'{retry_task_policy,retry_no}' IS NOT NULL"
+    )
+
+
+def _backfill():
+    bind = op.get_bind()
+
+    task_exs = sa.table(
+        'task_executions_v2',
+        sa.column('id', sa.String),
+        sa.column('runtime_context', sa.Text),
+        sa.column('retry_count', sa.Integer)
+    )
+
+    query = sa.select(task_exs.c.id, task_exs.c.runtime_context).where(
+        task_exs.c.runtime_context.like('%retry_no%')
+    )
+
+    values = []
+
+    for id_, runtime_context in bind.execute(query):
+        policy_ctx = json.loads(runtime_context).get('retry_task_policy')
+
+        if policy_ctx and policy_ctx.get('retry_no'):
+            values.append({'_id': id_, 'retry_count': policy_ctx['retry_no']})
+
+    update = task_exs.update().where(
+        task_exs.c.id == sa.bindparam('_id')
+    ).values(retry_count=sa.bindparam('retry_count'))
+
+    for i in range(0, len(values), BATCH_SIZE):
+        bind.execute(update, values[i:i + BATCH_SIZE])
+
+
+def upgrade():
+    if column_exists('task_executions_v2', 'retry_count'):
+        return
+
+    op.add_column(
+        'task_executions_v2',
+        sa.Column(
+            'retry_count',
+            sa.Integer(),
+            nullable=False,
+            server_default='0'
+        )
+    )
+
+    if op.get_bind().dialect.name == 'postgresql':
+        _backfill_postgresql()
+    else:
+        _backfill()
+
+    op.create_index(
+        'task_executions_v2_retry_count',
+        'task_executions_v2',
+        ['retry_count']
+    )
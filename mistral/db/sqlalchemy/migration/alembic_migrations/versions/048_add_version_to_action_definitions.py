@@ -0,0 +1,45 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""add version to action definitions
+
+Revision ID: 048
+Revises: 047
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '048'
+down_revision = '047'
+
+from alembic import op
+from mistral.db.utils import column_exists
+import sqlalchemy as sa
+
+
+def upgrade():
+    if column_exists('action_definitions_v2', 'version'):
+        return
+
+    op.add_column(
+        'action_definitions_v2',
+        sa.Column(
+            'version',
+            sa.Integer(),
+            nullable=False,
+            server_default='1'
+        )
+    )
@@ -30,6 +30,7 @@ from mistral import context
 from mistral.db.sqlalchemy import base as db_base
 from mistral import exceptions as exc
 from mistral.services import security
+from mistral.utils import metrics
 from mistral_lib import utils as ml_utils
 
 
@@ -71,6 +72,10 @@ def _with_auth_context(auth_ctx, func, *args, **kw):
         context.set_ctx(old_auth_ctx)
 
 
+def _count_retry(operation, retry_state):
+    metrics.increment(metrics.DB_RETRIES, operation)
+
+
 def retry_on_db_error(func, retry=None):
     """Decorates the given function so that it retries on DB errors.
 
@@ -91,7 +96,11 @@ def retry_on_db_error(func, retry=None):
                 )
             ),
             stop=tenacity.stop_after_attempt(50),
-            wait=tenacity.wait_incrementing(start=0, increment=0.1, max=2)
+            wait=tenacity.wait_incrementing(start=0, increment=0.1, max=2),
+            before_sleep=functools.partial(
+                _count_retry,
+                getattr(func, '__name__', 'unknown')
+            )
         )
 
     # The `assigned` arg should be empty as some of the default values are not
@@ -113,6 +122,22 @@ def retry_on_db_error(func, retry=None):
     return decorate
 
 
+def collect_query_stats(operation):
+    """Decorates a function to collect statistics of its DB statements.
+
+    :param operation: Name of the operation used in the statistics.
+    """
+    def _decorator(func):
+        @functools.wraps(func)
+        def _wrapper(*args, **kw):
+            with db_base.query_stats(operation):
+                return func(*args, **kw)
+
+        return _wrapper
+
+    return _decorator
+
+
 def check_db_obj_access(db_obj):
     """Check accessibility to db object."""
     ctx = context.ctx()
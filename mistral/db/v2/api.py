@@ -77,6 +77,18 @@ def acquire_lock(model, id):
     return IMPL.acquire_lock(model, id)
 
 
+def lock_workflow_execution_context(wf_ex):
+    IMPL.lock_workflow_execution_context(wf_ex)
+
+
+def get_lock_stats():
+    return IMPL.get_lock_stats()
+
+
+def clear_lock_stats():
+    IMPL.clear_lock_stats()
+
+
 # Workbooks.
 
 def get_workbook(name, namespace, fields=()):
@@ -213,6 +225,10 @@ def delete_dynamic_action_definitions(**kwargs):
     return IMPL.delete_dynamic_action_definitions(**kwargs)
 
 
+def get_dynamic_actions_state():
+    return IMPL.get_dynamic_actions_state()
+
+
 # Code sources.
 
 def get_code_source(identifier, namespace='', fields=()):
@@ -277,6 +293,10 @@ def load_action_definition(name, fields=(), namespace=''):
     return IMPL.load_action_definition(name, fields=fields, namespace='')
 
 
+def get_action_definitions_state():
+    return IMPL.get_action_definitions_state()
+
+
 def get_action_definitions(limit=None, marker=None, sort_keys=None,
                            sort_dirs=None, **kwargs):
     return IMPL.get_action_definitions(
@@ -800,6 +820,22 @@ def get_workflow_execution_count_by_state():
     return IMPL.get_workflow_execution_count_by_state()
 
 
+def track_execution_state_changes():
+    IMPL.track_execution_state_changes()
+
+
+def untrack_execution_state_changes():
+    IMPL.untrack_execution_state_changes()
+
+
+def flush_execution_state_deltas():
+    return IMPL.flush_execution_state_deltas()
+
+
+def reconcile_execution_state_counters():
+    return IMPL.reconcile_execution_state_counters()
+
+
 def get_delayed_calls_count_by_target():
     return IMPL.get_delayed_calls_count_by_target()
 
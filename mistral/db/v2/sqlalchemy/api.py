@@ -16,11 +16,13 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import collections
 import contextlib
 import datetime
 import re
 import sys
 import threading
+import time
 
 from mistral import context
 from mistral.db.sqlalchemy import base as b
@@ -31,6 +33,7 @@ from mistral.db.v2.sqlalchemy import filters as db_filters
 from mistral.db.v2.sqlalchemy import models
 from mistral import exceptions as exc
 from mistral.services import security
+from mistral.utils import metrics
 from mistral.workflow import states
 from mistral_lib import utils
 from oslo_config import cfg
@@ -41,12 +44,11 @@ from oslo_log import log as logging
 from oslo_utils import uuidutils  # noqa
 import sqlalchemy as sa
 from sqlalchemy import case
-from sqlalchemy import cast
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import event
 from sqlalchemy import func
 from sqlalchemy import or_
+from sqlalchemy import orm
 from sqlalchemy import text
-from sqlalchemy.types import Integer
 
 
 CONF = cfg.CONF
@@ -55,6 +57,12 @@ LOG = logging.getLogger(__name__)
 _SCHEMA_LOCK = threading.RLock()
 _initialized = False
 
+# Time spent waiting for locks, by lock kind.
+_LOCK_STATS_LOCK = threading.Lock()
+_LOCK_STATS = collections.defaultdict(
+    lambda: {'count': 0, 'wait_time': 0.0, 'max_wait_time': 0.0}
+)
+
 
 def get_backend():
     """Consumed by openstack common code.
@@ -118,16 +126,19 @@ def end_tx():
 
 @contextlib.contextmanager
 def transaction(read_only=False):
-    start_tx()
+    mode = 'read_only' if read_only else 'read_write'
 
-    try:
-        yield
-        if read_only:
-            rollback_tx()
-        else:
-            commit_tx()
-    finally:
-        end_tx()
+    with metrics.timer(metrics.DB_TRANSACTION, mode):
+        start_tx()
+
+        try:
+            yield
+            if read_only:
+                rollback_tx()
+            else:
+                commit_tx()
+        finally:
+            end_tx()
 
 
 @b.session_aware()
@@ -140,8 +151,39 @@ def expire_all(session=None):
     session.expire_all()
 
 
+def _record_lock_wait(kind, started):
+    wait_time = time.monotonic() - started
+
+    with _LOCK_STATS_LOCK:
+        stats = _LOCK_STATS[kind]
+
+        stats['count'] += 1
+        stats['wait_time'] += wait_time
+        stats['max_wait_time'] = max(stats['max_wait_time'], wait_time)
+
+    metrics.observe(metrics.LOCK_WAIT, kind, wait_time)
+
+
+def get_lock_stats():
+    """Returns statistics of waiting for locks.
+
+    :return: Dictionary where keys are lock kinds and values contain
+        the number of acquired locks, the total and the maximum time
+        of waiting for them in seconds.
+    """
+    with _LOCK_STATS_LOCK:
+        return {kind: dict(stats) for kind, stats in _LOCK_STATS.items()}
+
+
+def clear_lock_stats():
+    with _LOCK_STATS_LOCK:
+        _LOCK_STATS.clear()
+
+
 @b.session_aware()
 def acquire_lock(model, id, session=None):
+    started = time.monotonic()
+
     # Expire all so all objects queried after lock is acquired
     # will be up-to-date from the DB and not from cache.
     session.expire_all()
@@ -150,7 +192,31 @@ def acquire_lock(model, id, session=None):
         # In case of 'sqlite' we need to apply a manual lock.
         sqlite_lock.acquire_lock(id, session)
 
-    return _lock_entity(model, id)
+    entity = _lock_entity(model, id)
+
+    _record_lock_wait('entity', started)
+
+    return entity
+
+
+@b.session_aware()
+def lock_workflow_execution_context(wf_ex, session=None):
+    """Locks the workflow execution row and reloads its context.
+
+    Unlike acquire_lock() it doesn't expire other objects of the session
+    so it can be used in the middle of a transaction, right before the
+    context is changed. The lock is held until the end of the transaction.
+
+    :param wf_ex: Workflow execution attached to the session.
+    """
+    started = time.monotonic()
+
+    # Changes of the context made in this transaction must not be lost.
+    session.flush()
+
+    session.refresh(wf_ex, attribute_names=['context'], with_for_update=True)
+
+    _record_lock_wait('workflow_context', started)
 
 
 def _lock_entity(model, id):
@@ -774,6 +840,8 @@ def update_dynamic_action_definition(identifier, values, namespace='',
                                      session=None):
     action_def = get_dynamic_action_definition(identifier, namespace=namespace)
 
+    values['version'] = action_def.version + 1
+
     action_def.update(values.copy())
 
     return action_def
@@ -830,6 +898,45 @@ def delete_dynamic_action_definitions(session=None, **kwargs):
     return _delete_all(models.DynamicActionDefinition, **kwargs)
 
 
+def _get_definitions_state(model, session, *columns):
+    # Aggregates that change whenever an object of the given model gets
+    # created, updated or deleted. Objects of all projects are taken into
+    # account.
+    return tuple(
+        session.query(
+            func.count(model.id),
+            func.min(model.id),
+            func.max(model.id),
+            func.max(model.created_at),
+            func.max(model.updated_at),
+            *columns
+        ).one()
+    )
+
+
+@b.session_aware()
+def get_dynamic_actions_state(session=None):
+    """Returns a value that changes whenever dynamic actions change.
+
+    The value is calculated from aggregates of all dynamic action
+    definitions and code sources regardless of their projects so that
+    it can be cheaply compared with a previously obtained one. Versions
+    are summed up because timestamps have a precision of one second.
+    """
+    return (
+        _get_definitions_state(
+            models.CodeSource,
+            session,
+            func.sum(models.CodeSource.version)
+        ) +
+        _get_definitions_state(
+            models.DynamicActionDefinition,
+            session,
+            func.sum(models.DynamicActionDefinition.version)
+        )
+    )
+
+
 # Action definitions.
 
 @b.session_aware()
@@ -886,6 +993,18 @@ def load_action_definition(name, fields=(), session=None, namespace=''):
     )
 
 
+@b.session_aware()
+def get_action_definitions_state(session=None):
+    """Returns a value that changes whenever action definitions change."""
+    # Timestamps have a precision of one second so versions are summed up
+    # to notice subsequent changes made within a second.
+    return _get_definitions_state(
+        models.ActionDefinition,
+        session,
+        func.sum(models.ActionDefinition.version)
+    )
+
+
 @b.session_aware()
 def get_action_definitions(session=None, **kwargs):
     return _get_collection(model=models.ActionDefinition, **kwargs)
@@ -913,6 +1032,8 @@ def update_action_definition(identifier, values, session=None):
     namespace = values.get('namespace', '')
     a_def = get_action_definition(identifier, namespace=namespace)
 
+    values['version'] = a_def.version + 1
+
     a_def.update(values.copy())
 
     return a_def
@@ -1172,10 +1293,16 @@ def delete_workflow_executions(session=None, **kwargs):
     return _delete_all(models.WorkflowExecution, **kwargs)
 
 
-def update_workflow_execution_state(id, cur_state, state):
+@b.session_aware()
+def update_workflow_execution_state(id, cur_state, state, session=None):
     specimen = models.WorkflowExecution(id=id, state=cur_state)
 
-    return update_on_match(id, specimen, values={'state': state}, attempts=1)
+    wf_ex = update_on_match(id, specimen, values={'state': state}, attempts=1)
+
+    if wf_ex is not None:
+        _record_state_change(session, wf_ex, cur_state, state)
+
+    return wf_ex
 
 
 def update_workflow_executions_read_only_status(wf_exs):
@@ -1267,8 +1394,8 @@ def get_task_executions_count_with_filters(session=None, **kwargs):
     return _get_count(model=models.TaskExecution, **kwargs)
 
 
-def _get_completed_task_executions_query(kwargs):
-    query = b.model_query(models.TaskExecution)
+def _get_completed_task_executions_query(kwargs, columns=()):
+    query = b.model_query(models.TaskExecution, columns=columns)
 
     query = query.filter_by(**kwargs)
 
@@ -1292,7 +1419,8 @@ def get_completed_task_executions(session=None, **kwargs):
 
 
 @b.session_aware()
-def get_completed_task_executions_as_batches(session=None, **kwargs):
+def get_completed_task_executions_as_batches(session=None, fields=None,
+                                             batch_size=20, **kwargs):
     # NOTE: Using batch querying seriously allows to optimize memory
     # consumption on operations when we need to iterate through
     # a list of task executions and do some processing like merging
@@ -1300,19 +1428,47 @@ def get_completed_task_executions_as_batches(session=None, **kwargs):
     # hold all the collection (that can be large) in memory.
     # Using a generator that returns batches lets GC to collect a
     # batch of task executions that has already been processed.
-    query = _get_completed_task_executions_query(kwargs)
+    # If "fields" are given then the batches consist of rows with only
+    # these fields rather than of task execution objects.
+    sort_keys = ['created_at', 'id']
+
+    columns = ()
+
+    if fields:
+        columns = tuple(
+            getattr(models.TaskExecution, f)
+            for f in list(fields) + [k for k in sort_keys if k not in fields]
+        )
+
+    query = _get_completed_task_executions_query(kwargs, columns)
 
     # Batch size 20 may be arguable but still seems reasonable: it's big
     # enough to keep the total number of DB hops small (say for 100 tasks
     # we'll need only 5) and small enough not to drastically increase
     # memory footprint if the number of tasks is big like several hundreds.
-    batch_size = 20
-    idx = 0
+    # The batches are fetched using keyset pagination: the next batch
+    # starts after the last task execution of the previous one. Unlike
+    # OFFSET it doesn't make the DB skip the rows that were already
+    # returned, and there's no need to count all the rows.
+    marker = None
 
-    while idx < query.count():
-        yield query.slice(idx, idx + batch_size).all()
+    while True:
+        batch = db_utils.paginate_query(
+            query,
+            models.TaskExecution,
+            batch_size,
+            sort_keys,
+            marker=marker,
+            sort_dirs=['asc', 'asc']
+        ).all()
 
-        idx += batch_size
+        if batch:
+            yield batch
+
+        if len(batch) < batch_size:
+            break
+
+        marker = batch[-1]
 
 
 def _get_incomplete_actions_query(kwargs):
@@ -1428,10 +1584,17 @@ def delete_task_executions(session=None, **kwargs):
     return _delete_all(models.TaskExecution, **kwargs)
 
 
-def update_task_execution_state(id, cur_state, state):
+@b.session_aware()
+def update_task_execution_state(id, cur_state, state, session=None):
     specimen = models.TaskExecution(id=id, state=cur_state)
 
-    return update_on_match(id, specimen, values={'state': state}, attempts=1)
+    task_ex = update_on_match(id, specimen, values={'state': state},
+                              attempts=1)
+
+    if task_ex is not None:
+        _record_state_change(session, task_ex, cur_state, state)
+
+    return task_ex
 
 
 def get_sub_executions_query(id, workflow, accepted=True,
@@ -2317,6 +2480,52 @@ def delete_named_lock(lock_id, session=None):
     session.flush()
 
 
+# Mistral namespace of PostgreSQL advisory locks. The first key of
+# the two-key form of pg_advisory_xact_lock() so that named locks do not
+# interfere with advisory locks taken by other applications.
+_ADVISORY_LOCK_NAMESPACE = 0x4d535452
+
+_ADVISORY_LOCK_WARNED = False
+
+
+def _use_advisory_lock():
+    global _ADVISORY_LOCK_WARNED
+
+    if CONF.engine.named_lock_backend != 'advisory':
+        return False
+
+    # Transaction scoped advisory locks are released at the end of the
+    # transaction so without an explicit transaction the lock would be
+    # released right away.
+    if not b.in_transaction():
+        return False
+
+    if b.get_dialect_name() != 'postgresql':
+        if not _ADVISORY_LOCK_WARNED:
+            LOG.warning(
+                'Advisory named locks are only supported by PostgreSQL, '
+                'falling back to the table based named locks.'
+            )
+
+            _ADVISORY_LOCK_WARNED = True
+
+        return False
+
+    return True
+
+
+@b.session_aware()
+def _acquire_advisory_lock(name, session=None):
+    session.execute(
+        sa.select(
+            func.pg_advisory_xact_lock(
+                _ADVISORY_LOCK_NAMESPACE,
+                func.hashtext(name)
+            )
+        )
+    )
+
+
 @contextlib.contextmanager
 def named_lock(name):
     # NOTE(rakhmerov): We can't use the well-known try-finally pattern here
@@ -2325,8 +2534,25 @@ def named_lock(name):
     # All we can do here is to let the exception bubble up so that the
     # transaction management code could rollback the transaction.
 
+    started = time.monotonic()
+
+    if _use_advisory_lock():
+        # The lock is released by the database when the transaction
+        # ends, nothing is written so no rows have to be cleaned up.
+        # Different names may rarely have the same hash, in this case
+        # they're just serialized.
+        _acquire_advisory_lock(name)
+
+        _record_lock_wait('named', started)
+
+        yield
+
+        return
+
     lock_id = create_named_lock(name)
 
+    _record_lock_wait('named', started)
+
     yield
 
     delete_named_lock(lock_id)
@@ -2376,8 +2602,273 @@ def get_overdue_calls(time, session=None):
 
 
 # Monitoring
+
+_STATE_COUNTER_MODELS = (
+    models.ActionExecution,
+    models.TaskExecution,
+    models.WorkflowExecution
+)
+
+_STATE_DELTAS_KEY = 'execution_state_deltas'
+
+# The counters table row keeping the time of the last reconciliation in
+# microseconds since the epoch in its 'count' column.
+_RECONCILED_AT_ENTITY = 'reconciled_at'
+
+_STATE_DELTAS_LOCK = threading.Lock()
+
+# Pairs of the commit time and changes of the numbers of executions by
+# (entity, project_id, state) committed by this process and not yet
+# written to the counters table.
+_STATE_DELTAS = []
+
+
+def _get_session_state_deltas(session):
+    return session.info.setdefault(_STATE_DELTAS_KEY, collections.Counter())
+
+
+def _record_state_change(session, obj, cur_state, state):
+    # State changes made with UPDATE queries, like in update_on_match(),
+    # don't go through the flush so they're recorded explicitly.
+    if not CONF.engine.execution_state_counters or cur_state == state:
+        return
+
+    deltas = _get_session_state_deltas(session)
+
+    if cur_state:
+        deltas[(obj.__tablename__, obj.project_id, cur_state)] -= 1
+
+    deltas[(obj.__tablename__, obj.project_id, state)] += 1
+
+
+def _collect_state_deltas(session, flush_context):
+    # NOTE: Executions are deleted with bulk queries and cascades that
+    # don't go through the session so deletions are only taken into
+    # account by reconcile_execution_state_counters().
+    if not CONF.engine.execution_state_counters:
+        return
+
+    deltas = _get_session_state_deltas(session)
+
+    for obj in session.new:
+        if isinstance(obj, _STATE_COUNTER_MODELS) and obj.state:
+            deltas[(obj.__tablename__, obj.project_id, obj.state)] += 1
+
+    for obj in session.dirty:
+        if not isinstance(obj, _STATE_COUNTER_MODELS):
+            continue
+
+        hist = sa.inspect(obj).attrs.state.history
+
+        if not hist.added or not hist.deleted:
+            continue
+
+        deltas[(obj.__tablename__, obj.project_id, hist.deleted[0])] -= 1
+        deltas[(obj.__tablename__, obj.project_id, hist.added[0])] += 1
+
+
+def _commit_state_deltas(session):
+    deltas = session.info.pop(_STATE_DELTAS_KEY, None)
+
+    if deltas:
+        _add_state_deltas([(_get_timestamp(), deltas)])
+
+
+def _discard_state_deltas(session, previous_transaction=None):
+    session.info.pop(_STATE_DELTAS_KEY, None)
+
+
+def _get_timestamp():
+    return int(time.time() * 1000000)
+
+
+def _add_state_deltas(deltas):
+    with _STATE_DELTAS_LOCK:
+        _STATE_DELTAS.extend(deltas)
+
+
+def _pop_state_deltas():
+    global _STATE_DELTAS
+
+    with _STATE_DELTAS_LOCK:
+        deltas = _STATE_DELTAS
+
+        _STATE_DELTAS = []
+
+    return deltas
+
+
+@b.session_aware()
+def _get_reconciled_at(session=None):
+    # The row is locked so that reconciliation can't happen between
+    # reading it and applying the changes.
+    table = models.ExecutionStateCounter.__table__
+
+    reconciled_at = session.execute(
+        sa.select(table.c.count).where(
+            table.c.entity == _RECONCILED_AT_ENTITY
+        ).with_for_update()
+    ).scalar()
+
+    return reconciled_at or 0
+
+
+def track_execution_state_changes():
+    """Starts collecting the changes of execution states in this process.
+
+    The changes made by a transaction are taken into account only after
+    it's committed and stay in memory until they're written to the
+    counters table by flush_execution_state_deltas().
+    """
+    if not event.contains(orm.Session, 'after_flush', _collect_state_deltas):
+        event.listen(orm.Session, 'after_flush', _collect_state_deltas)
+        event.listen(orm.Session, 'after_commit', _commit_state_deltas)
+        event.listen(orm.Session, 'after_rollback', _discard_state_deltas)
+
+
+def untrack_execution_state_changes():
+    if event.contains(orm.Session, 'after_flush', _collect_state_deltas):
+        event.remove(orm.Session, 'after_flush', _collect_state_deltas)
+        event.remove(orm.Session, 'after_commit', _commit_state_deltas)
+        event.remove(orm.Session, 'after_rollback', _discard_state_deltas)
+
+
+@b.session_aware()
+def _apply_state_deltas(deltas, session=None):
+    table = models.ExecutionStateCounter.__table__
+
+    for (entity, project_id, state), delta in sorted(deltas.items()):
+        updated = session.execute(
+            table.update().where(
+                sa.and_(
+                    table.c.entity == entity,
+                    table.c.project_id == project_id,
+                    table.c.state == state
+                )
+            ).values(
+                count=table.c.count + delta,
+                updated_at=utils.utc_now_sec()
+            )
+        ).rowcount
+
+        if not updated:
+            session.execute(
+                table.insert().values(
+                    entity=entity,
+                    project_id=project_id,
+                    state=state,
+                    count=delta,
+                    created_at=utils.utc_now_sec()
+                )
+            )
+
+
+def flush_execution_state_deltas():
+    """Writes the collected changes of execution states to the counters.
+
+    The changes committed before the last reconciliation are dropped
+    because the reconciled counters already include them.
+
+    :return: The number of updated counters.
+    """
+    timed_deltas = _pop_state_deltas()
+
+    if not timed_deltas:
+        return 0
+
+    try:
+        with transaction():
+            reconciled_at = _get_reconciled_at()
+
+            deltas = collections.Counter()
+
+            for committed_at, d in timed_deltas:
+                if committed_at >= reconciled_at:
+                    deltas.update(d)
+
+            deltas = {k: v for k, v in deltas.items() if v}
+
+            if deltas:
+                _apply_state_deltas(deltas)
+    except Exception:
+        # Keep the changes until the next attempt.
+        _add_state_deltas(timed_deltas)
+
+        raise
+
+    return len(deltas)
+
+
+@b.session_aware()
+def reconcile_execution_state_counters(session=None):
+    """Recalculates the execution state counters from the executions.
+
+    It corrects the counters for the changes not made by engines, for
+    example executions deleted by the API or with bulk queries. The time
+    of the recalculation is stored with the counters so that engines
+    don't add the changes already included into it. The clocks of the
+    hosts are expected to be synchronized.
+    """
+    table = models.ExecutionStateCounter.__table__
+
+    # Wait for the engines writing their changes to finish.
+    _get_reconciled_at()
+
+    reconciled_at = _get_timestamp()
+
+    rows = []
+
+    for model in _STATE_COUNTER_MODELS:
+        query = session.query(
+            model.project_id,
+            model.state,
+            func.count(model.id)
+        ).group_by(model.project_id, model.state)
+
+        rows.extend(
+            {
+                'entity': model.__tablename__,
+                'project_id': project_id,
+                'state': state,
+                'count': count,
+                'created_at': utils.utc_now_sec()
+            }
+            for project_id, state, count in query
+            if state
+        )
+
+    session.execute(table.delete())
+
+    if rows:
+        session.execute(table.insert(), rows)
+
+    session.execute(
+        table.insert().values(
+            entity=_RECONCILED_AT_ENTITY,
+            project_id='',
+            state='',
+            count=reconciled_at,
+            created_at=utils.utc_now_sec()
+        )
+    )
+
+    return len(rows)
+
+
 @b.session_aware()
 def _get_execution_count_by_state(model, session=None):
+    if CONF.engine.execution_state_counters:
+        counter = models.ExecutionStateCounter
+
+        query = session.query(
+            counter.state,
+            func.sum(counter.count)
+        ).filter(
+            counter.entity == model.__tablename__
+        ).group_by(counter.state)
+
+        return [(state, int(count)) for state, count in query]
+
     return session.query(
         model.state,
         func.count(model.state)
@@ -2510,19 +3001,13 @@ def delete_named_locks(session=None, **kwargs):
 
 @b.session_aware()
 def get_task_retries(limit=50, session=None):
-    ctx_json = cast(models.TaskExecution.runtime_context, JSONB)
-    retry_no_text = func.jsonb_extract_path_text(ctx_json,
-                                                 'retry_task_policy',
-                                                 'retry_no')
-    retry_no_int = cast(retry_no_text, Integer)
-
     q = (
         session.query(
             models.TaskExecution.workflow_execution_id,
             models.TaskExecution.name,
-            retry_no_int.label('retry_no')
+            models.TaskExecution.retry_count
         )
-        .filter(retry_no_int > 0)
+        .filter(models.TaskExecution.retry_count > 0)
         .order_by(models.TaskExecution.updated_at.desc())
         .limit(limit)
     )
@@ -196,6 +196,7 @@ class ActionDefinition(Definition):
     # Service properties.
     action_class = sa.Column(sa.String(200))
     attributes = sa.Column(st.JsonDictType())
+    version = sa.Column(sa.Integer(), nullable=False, default=1)
 
 
 class CodeSource(mb.MistralSecureModelBase):
@@ -233,6 +234,27 @@ class MistralMetrics(mb.MistralModelBase):
     value = sa.Column(sa.String(255), nullable=False)
 
 
+class ExecutionStateCounter(mb.MistralModelBase):
+    """Number of executions of one type in one state within a project.
+
+    'entity' is the table name of the execution model. The counters are
+    updated with the changes made by engines and periodically
+    reconciled with the execution tables. The row with the
+    'reconciled_at' entity keeps the time of the last reconciliation.
+    """
+
+    __tablename__ = 'execution_state_counters'
+    __table_args__ = (
+        sa.UniqueConstraint('entity', 'project_id', 'state'),
+    )
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    entity = sa.Column(sa.String(80), nullable=False)
+    project_id = sa.Column(sa.String(80), nullable=False)
+    state = sa.Column(sa.String(20), nullable=False)
+    count = sa.Column(sa.BigInteger, nullable=False, default=0)
+
+
 class DynamicActionDefinition(mb.MistralSecureModelBase):
     """Contains info about registered Dynamic Actions."""
 
@@ -253,6 +275,7 @@ class DynamicActionDefinition(mb.MistralSecureModelBase):
     namespace = sa.Column(sa.String(255), nullable=True)
     class_name = sa.Column(sa.String(255))
     code_source_name = sa.Column(sa.String(255))
+    version = sa.Column(sa.Integer(), nullable=False, default=1)
 
 
 DynamicActionDefinition.code_source_id = sa.Column(
@@ -305,10 +328,14 @@ class ActionExecution(Execution):
     accepted = sa.Column(sa.Boolean(), default=False)
     input = sa.Column(st.JsonLongDictType(), nullable=True)
     output = sa.orm.deferred(sa.Column(st.JsonLongDictType(), nullable=True))
+    # An executor doesn't report the start of an action and sends its
+    # first heartbeat with the next periodic batch, so an action that has
+    # not got a heartbeat yet is given one more check interval.
     last_heartbeat = sa.Column(
         sa.DateTime,
         default=lambda: utils.utc_now_sec() + datetime.timedelta(
-            seconds=CONF.action_heartbeat.first_heartbeat_timeout
+            seconds=CONF.action_heartbeat.first_heartbeat_timeout +
+            CONF.action_heartbeat.check_interval
         )
     )
     is_sync = sa.Column(sa.Boolean(), default=None, nullable=True)
@@ -352,6 +379,7 @@ class TaskExecution(Execution):
         sa.Index('%s_scope' % __tablename__, 'scope'),
         sa.Index('%s_state' % __tablename__, 'state'),
         sa.Index('%s_updated_at' % __tablename__, 'updated_at'),
+        sa.Index('%s_retry_count' % __tablename__, 'retry_count'),
         sa.UniqueConstraint('unique_key')
     )
 
@@ -385,6 +413,11 @@ class TaskExecution(Execution):
     # is not completed.
     error_handled = sa.Column(sa.Boolean, default=False)
 
+    # The number of times the task has been repeated by the 'retry'
+    # policy. It duplicates 'retry_no' of the policy runtime context
+    # so that retried tasks can be found without parsing the context.
+    retry_count = sa.Column(sa.Integer, nullable=False, default=0)
+
     # Data Flow properties.
     in_context = sa.Column(st.JsonLongDictType())
     published = sa.Column(st.JsonLongDictType())
@@ -33,6 +33,7 @@ from mistral.engine import post_tx_queue
 from mistral.engine import task_handler
 from mistral.engine import workflow_handler as wf_handler
 from mistral import exceptions
+from mistral.utils import metrics
 from mistral.workflow import states
 from mistral_lib import utils as u
 
@@ -45,6 +46,8 @@ LOG = logging.getLogger(__name__)
 
 
 class DefaultEngine(base.Engine):
+    @metrics.timed('start_workflow')
+    @db_utils.collect_query_stats('start_workflow')
     @db_utils.retry_on_db_error
     @post_tx_queue.run
     @profiler.trace('engine-start-workflow', hide_args=True)
@@ -129,6 +132,8 @@ class DefaultEngine(base.Engine):
 
                 return wf_ex.get_clone()
 
+    @metrics.timed('start_task')
+    @db_utils.collect_query_stats('start_task')
     @post_tx_queue.run
     def start_task(self, task_ex_id, first_run, waiting,
                    triggered_by, rerun, reset, **params):
@@ -209,6 +214,8 @@ class DefaultEngine(base.Engine):
 
             return db_api.create_action_execution(values)
 
+    @metrics.timed('on_action_complete')
+    @db_utils.collect_query_stats('on_action_complete')
     @db_utils.retry_on_db_error
     @post_tx_queue.run
     @profiler.trace('engine-on-action-complete', hide_args=True)
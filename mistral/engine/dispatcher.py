@@ -171,7 +171,7 @@ def _process_commands(wf_ex, cmds):
                     reset=_reset
                 )
 
-            post_tx_queue.register_operation(_start_task)
+            post_tx_queue.register_operation(_start_task, group=wf_ex.id)
 
         elif isinstance(cmd, commands.SkipTask):
             task_handler.skip_task(cmd)
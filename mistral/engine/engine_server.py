@@ -13,18 +13,22 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import eventlet
 from oslo_log import log as logging
 
 from mistral import config as cfg
 from mistral.db.v2 import api as db_api
 from mistral.engine import default_engine
 from mistral import exceptions as exc
+from mistral.lang import parser as spec_parser
 from mistral.rpc import base as rpc
 from mistral.scheduler import base as sched_base
 from mistral.service import base as service_base
 from mistral.services import action_heartbeat_checker
 from mistral.services import action_heartbeat_sender
+from mistral.services import execution_state_counters
 from mistral.services import expiration_policy
+from mistral.utils import metrics
 from mistral.utils import profiler as profiler_utils
 from mistral_lib import utils
 
@@ -41,6 +45,13 @@ def _validate_config():
         )
 
 
+def _warm_up_spec_cache():
+    try:
+        spec_parser.warm_up_caches()
+    except Exception:
+        LOG.exception("Failed to warm up the workflow specification cache.")
+
+
 class EngineServer(service_base.MistralService):
     """Engine server.
 
@@ -69,6 +80,8 @@ class EngineServer(service_base.MistralService):
 
         self._expiration_policy_tg = expiration_policy.setup()
 
+        execution_state_counters.start()
+
         action_heartbeat_checker.start()
 
         # If the current engine instance uses a local action executor
@@ -84,6 +97,11 @@ class EngineServer(service_base.MistralService):
         if self._setup_profiler:
             profiler_utils.setup('mistral-engine', CONF.engine.host)
 
+        metrics.setup('mistral-engine')
+
+        if CONF.engine.spec_cache_warm_up:
+            eventlet.spawn_n(_warm_up_spec_cache)
+
         # Initialize and start RPC server.
 
         self._rpc_server = rpc.get_rpc_server_driver()(CONF.engine)
@@ -132,6 +150,8 @@ class EngineServer(service_base.MistralService):
         if self._expiration_policy_tg:
             self._expiration_policy_tg.stop(graceful)
 
+        execution_state_counters.stop(graceful)
+
     def wait(self):
         LOG.info("Waiting for an engine server to exit...")
 
@@ -408,6 +428,39 @@ class EngineServer(service_base.MistralService):
 
         return self.engine.process_action_heartbeats(action_ex_ids)
 
+    def get_profiler_stats(self, rpc_ctx):
+        """Receives calls over RPC to get aggregated profiler statistics.
+
+        :param rpc_ctx: RPC request context.
+        :return: Profiler statistics of this engine.
+        """
+        LOG.info("Received RPC request 'get_profiler_stats'")
+
+        stats = profiler_utils.get_stats() or {}
+
+        stats['host'] = CONF.engine.host
+
+        return stats
+
+    def configure_profiler(self, rpc_ctx, enabled=None, sampling_rate=None,
+                           reset=False):
+        """Receives calls over RPC to change profiler aggregation settings.
+
+        :param rpc_ctx: RPC request context.
+        :param enabled: Whether to aggregate the profiler trace points.
+        :param sampling_rate: The fraction of trace points to aggregate.
+        :param reset: Whether to drop the collected statistics.
+        """
+        LOG.info(
+            "Received RPC request 'configure_profiler'"
+            "[enabled=%s, sampling_rate=%s, reset=%s]",
+            enabled,
+            sampling_rate,
+            reset
+        )
+
+        profiler_utils.configure(enabled, sampling_rate, reset)
+
 
 def get_oslo_service(setup_profiler=True):
     return EngineServer(
@@ -379,6 +379,8 @@ class RetryPolicy(base.TaskPolicy):
 
         task.touch_runtime_context()
 
+        task.task_ex.retry_count = retry_no + 1
+
         # NOTE(vgvoleg): join tasks in direct workflows can't be
         # retried as-is, because these tasks can't start without
         # a correct logical state.
@@ -13,8 +13,12 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import eventlet
+import collections
 import functools
+import time
+
+import eventlet
+from eventlet import queue as eventlet_queue
 from oslo_config import cfg
 from oslo_log import log as logging
 from osprofiler import profiler
@@ -30,27 +34,59 @@ This module contains a mini framework for scheduling operations while
 performing transactional processing of a workflow event such as
 completing a workflow action. The scheduled operations will run after
 the main DB transaction, in a new transaction, if needed.
+
+Operations registered within one transaction make up a work item that is
+processed by a bounded pool of worker threads. If a work item for the same
+group (normally a workflow execution) is still waiting in the queue then
+new operations are merged into it instead of occupying one more slot and
+operations registered with the same key run only once.
 """
 
 LOG = logging.getLogger(__name__)
 
 
 _THREAD_LOCAL_NAME = "__operation_queue_thread_local"
+_WORKER_THREAD_LOCAL_NAME = "__operation_queue_worker_thread_local"
+
+_POOL = None
+
+_Operation = collections.namedtuple('_Operation', ['func', 'args', 'key'])
 
 
 def _prepare():
-    # Register two queues: transactional and non transactional operations.
-    utils.set_thread_local(_THREAD_LOCAL_NAME, (list(), list()))
+    # Register two queues: transactional and non transactional operations,
+    # and a set of groups the operations belong to.
+    utils.set_thread_local(_THREAD_LOCAL_NAME, (list(), list(), set()))
 
 
 def _clear():
     utils.set_thread_local(_THREAD_LOCAL_NAME, None)
 
 
-def register_operation(func, args=None, in_tx=False):
-    """Register an operation."""
+def register_operation(func, args=None, in_tx=False, key=None, group=None):
+    """Register an operation.
 
-    _get_queues()[0 if in_tx else 1].append((func, args or []))
+    :param func: Function to run.
+    :param args: Function positional arguments.
+    :param in_tx: If True, the operation runs in a new DB transaction.
+    :param key: Optional key identifying the operation. If an operation
+        with the same key is already registered then the new one is ignored.
+    :param group: Optional group of the operation, normally a workflow
+        execution id. Operations of the same group registered by different
+        transactions can be merged into one work item while it's waiting
+        for a free worker thread.
+    """
+    queues = _get_queues()
+
+    if group is not None:
+        queues[2].add(group)
+
+    queue = queues[0 if in_tx else 1]
+
+    if key is not None and any(op.key == key for op in queue):
+        return
+
+    queue.append(_Operation(func, args or [], key))
 
 
 def _get_queues():
@@ -79,50 +115,266 @@ def run(func):
         try:
             res = func(*args, **kw)
 
-            queues = _get_queues()
-
-            tx_queue = queues[0]
-            non_tx_queue = queues[1]
+            tx_queue, non_tx_queue, groups = _get_queues()
 
             if not tx_queue and not non_tx_queue:
                 return res
 
-            auth_ctx = context.ctx() if context.has_ctx() else None
+            item = _WorkItem(
+                group=next(iter(groups)) if len(groups) == 1 else None,
+                auth_ctx=context.ctx() if context.has_ctx() else None,
+                tx_queue=tx_queue,
+                non_tx_queue=non_tx_queue
+            )
+
+            pool = get_pool()
+
+            if pool:
+                pool.submit(item)
+            else:
+                eventlet.spawn(_process_work_item, item)
+        finally:
+            _clear()
+
+        return res
+
+    return decorate
+
+
+class _WorkItem(object):
+    """Operations scheduled by one or more engine transactions."""
+
+    def __init__(self, group, auth_ctx, tx_queue, non_tx_queue):
+        self.group = group
+        self.auth_ctx = auth_ctx
+        self.tx_queue = list(tx_queue)
+        self.non_tx_queue = list(non_tx_queue)
+        self.submitted_at = time.monotonic()
+
+    def merge(self, other):
+        """Merges operations of the given work item into this one.
+
+        :return: The number of operations that were dropped as duplicates.
+        """
+        dropped = 0
+
+        for src, dst in ((other.tx_queue, self.tx_queue),
+                         (other.non_tx_queue, self.non_tx_queue)):
+            keys = set(op.key for op in dst if op.key is not None)
+
+            for op in src:
+                if op.key is not None and op.key in keys:
+                    dropped += 1
+
+                    continue
+
+                if other.auth_ctx is not self.auth_ctx:
+                    op = op._replace(
+                        func=functools.partial(
+                            _run_with_auth_ctx,
+                            other.auth_ctx,
+                            op.func
+                        )
+                    )
+
+                dst.append(op)
+
+        return dropped
+
+
+def _run_with_auth_ctx(auth_ctx, func, *args):
+    old_auth_ctx = context.ctx() if context.has_ctx() else None
+
+    context.set_ctx(auth_ctx)
+
+    try:
+        return func(*args)
+    finally:
+        context.set_ctx(old_auth_ctx)
+
+
+def _process_work_item(item):
+    # This may be a new thread so we need to init a profiler again. A work
+    # item may also run inline in the thread that submitted it and then the
+    # profiler of that thread must stay as it is.
+    init_profiler = cfg.CONF.profiler.enabled and profiler.get() is None
+
+    if init_profiler:
+        profiler.init(cfg.CONF.profiler.hmac_keys)
+
+    old_auth_ctx = context.ctx() if context.has_ctx() else None
+
+    context.set_ctx(item.auth_ctx)
+
+    try:
+        if item.tx_queue:
+            _process_tx_queue(item.tx_queue)
+
+        if item.non_tx_queue:
+            _process_non_tx_queue(item.non_tx_queue)
+    finally:
+        context.set_ctx(old_auth_ctx)
+
+        if init_profiler:
+            profiler.clean()
+
+
+class _WorkerPool(object):
+    """A bounded pool of threads processing post transaction work items."""
 
-            def _within_new_thread():
-                # This is a new thread so we need to init a profiler again.
-                if cfg.CONF.profiler.enabled:
-                    profiler.init(cfg.CONF.profiler.hmac_keys)
+    def __init__(self, size, max_queue_size, overflow_policy):
+        self._size = size
+        self._overflow_policy = overflow_policy
+        self._queue = eventlet_queue.LightQueue(max_queue_size or None)
 
-                old_auth_ctx = context.ctx() if context.has_ctx() else None
+        # Work items that are waiting in the queue, by group.
+        self._pending = {}
 
-                context.set_ctx(auth_ctx)
+        self._threads = []
 
-                try:
-                    if tx_queue:
-                        _process_tx_queue(tx_queue)
+        self._stats = {
+            'submitted': 0,
+            'coalesced': 0,
+            'deduplicated': 0,
+            'overflowed': 0,
+            'processed': 0,
+            'max_queue_depth': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'run_time_total': 0.0,
+            'run_time_max': 0.0
+        }
 
-                    if non_tx_queue:
-                        _process_non_tx_queue(non_tx_queue)
-                finally:
-                    context.set_ctx(old_auth_ctx)
+    def start(self):
+        for _ in range(self._size):
+            self._threads.append(eventlet.spawn(self._work))
 
-            eventlet.spawn(_within_new_thread)
+    def stop(self):
+        for t in self._threads:
+            t.kill()
+
+        self._threads = []
+        self._pending = {}
+
+    def get_stats(self):
+        stats = dict(self._stats)
+
+        stats['queue_depth'] = self._queue.qsize()
+        stats['pool_size'] = self._size
+
+        return stats
+
+    def submit(self, item):
+        self._stats['submitted'] += 1
+
+        if item.group is not None:
+            pending = self._pending.get(item.group)
+
+            if pending is not None:
+                self._stats['coalesced'] += 1
+                self._stats['deduplicated'] += pending.merge(item)
+
+                return
+
+        if self._queue.full():
+            self._stats['overflowed'] += 1
+
+            # A worker thread must never wait for a free slot since
+            # it may lead to a deadlock when all workers are waiting.
+            in_worker = utils.get_thread_local(_WORKER_THREAD_LOCAL_NAME)
+
+            if self._overflow_policy == 'inline' or in_worker:
+                self._run(item)
+
+                return
+
+            if self._overflow_policy == 'spawn':
+                eventlet.spawn(self._run, item)
+
+                return
+
+        if item.group is not None:
+            self._pending[item.group] = item
+
+        self._queue.put(item)
+
+        self._stats['max_queue_depth'] = max(
+            self._stats['max_queue_depth'],
+            self._queue.qsize()
+        )
+
+    def _work(self):
+        utils.set_thread_local(_WORKER_THREAD_LOCAL_NAME, True)
+
+        while True:
+            item = self._queue.get()
+
+            if self._pending.get(item.group) is item:
+                del self._pending[item.group]
+
+            try:
+                self._run(item)
+            except Exception:
+                LOG.exception("Failed to process post transaction operations.")
+
+    def _run(self, item):
+        started_at = time.monotonic()
+
+        self._update_time_stats('wait_time', started_at - item.submitted_at)
+
+        try:
+            _process_work_item(item)
         finally:
-            _clear()
+            self._stats['processed'] += 1
 
-        return res
+            self._update_time_stats('run_time', time.monotonic() - started_at)
 
-    return decorate
+    def _update_time_stats(self, name, value):
+        self._stats[name + '_total'] += value
+        self._stats[name + '_max'] = max(self._stats[name + '_max'], value)
+
+
+def get_pool():
+    global _POOL
+
+    if _POOL is None and cfg.CONF.engine.post_tx_queue_pool_size > 0:
+        _POOL = _WorkerPool(
+            cfg.CONF.engine.post_tx_queue_pool_size,
+            cfg.CONF.engine.post_tx_queue_max_size,
+            cfg.CONF.engine.post_tx_queue_overflow_policy
+        )
+
+        _POOL.start()
+
+    return _POOL
+
+
+def get_stats():
+    """Returns statistics of the post transaction worker pool.
+
+    :return: A dict with queue depth, the number of processed, merged
+        and deduplicated work items and their waiting and running time.
+        Empty dict if the worker pool is disabled.
+    """
+    return _POOL.get_stats() if _POOL else {}
+
+
+def cleanup():
+    global _POOL
+
+    if _POOL:
+        _POOL.stop()
+
+    _POOL = None
 
 
 @db_utils.retry_on_db_error
 @run
 def _process_tx_queue(queue):
     with db_api.transaction():
-        for func, args in queue:
+        for op in queue:
             try:
-                func(*args)
+                op.func(*op.args)
             except Exception:
                 LOG.exception("Failed to run transactional engine operation.")
 
@@ -130,8 +382,8 @@ def _process_tx_queue(queue):
 
 
 def _process_non_tx_queue(queue):
-    for func, args in queue:
+    for op in queue:
         try:
-            func(*args)
+            op.func(*op.args)
         except Exception:
             LOG.exception("Failed to run non-transactional engine operation.")
@@ -381,7 +381,8 @@ def _check_affected_tasks(task):
         post_tx_queue.register_operation(
             _schedule_if_needed,
             args=[t_ex.id],
-            in_tx=True
+            in_tx=True,
+            key=('refresh_task_state', t_ex.id)
         )
 
 
@@ -223,6 +223,8 @@ class Task(object, metaclass=abc.ABCMeta):
         if runtime_context:
             runtime_context.clear()
 
+        self.task_ex.retry_count = 0
+
     def get_policy_context(self, key):
         assert self.task_ex
 
@@ -477,7 +479,12 @@ class Task(object, metaclass=abc.ABCMeta):
             wf_handler.check_and_complete(self.wf_ex.id)
 
         if force or wf_ctrl.may_complete_workflow(self.task_ex):
-            post_tx_queue.register_operation(_check, in_tx=True)
+            post_tx_queue.register_operation(
+                _check,
+                in_tx=True,
+                key=('check_and_complete', self.wf_ex.id),
+                group=self.wf_ex.id
+            )
 
     @profiler.trace('task-update')
     def update(self, state, state_info=None):
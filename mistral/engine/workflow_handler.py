@@ -27,6 +27,7 @@ from mistral.engine import workflows
 from mistral import exceptions as exc
 from mistral.executors import base as exe
 from mistral.scheduler import base as sched_base
+from mistral.utils import metrics
 from mistral.workflow import states
 
 LOG = logging.getLogger(__name__)
@@ -155,6 +156,8 @@ def cancel_workflow(wf_ex, msg=None):
     stop_workflow(wf_ex, states.CANCELLED, msg)
 
 
+@metrics.timed('check_and_complete')
+@db_utils.collect_query_stats('check_and_complete')
 @profiler.trace('workflow-handler-check-and-complete', hide_args=True)
 def check_and_complete(wf_ex_id):
     wf_ex = db_api.load_workflow_execution(wf_ex_id)
@@ -25,6 +25,7 @@ from osprofiler import profiler
 from mistral import context
 from mistral import exceptions as exc
 from mistral.executors import base
+from mistral.executors import process_pool
 from mistral.rpc import clients as rpc
 from mistral.services import action_heartbeat_sender
 
@@ -44,6 +45,8 @@ class DefaultExecutor(base.Executor):
         else:
             self.running_actions[action_ex_id] = True
 
+        process_pool.interrupt_action(action_ex_id)
+
     @profiler.trace('default-executor-run-action', hide_args=True)
     def run_action(self, action, action_ex_id, safe_rerun, exec_ctx,
                    redelivered=False, target=None, async_=True,
@@ -128,7 +131,13 @@ class DefaultExecutor(base.Executor):
                     exception=TimeoutError("Action timed out")):
                 # NOTE(d0ugal): If the action is a subclass of mistral-lib we
                 # know that it expects to be passed the context.
-                if isinstance(action, mistral_lib.Action):
+                if process_pool.is_enabled_for(action):
+                    result = process_pool.get_pool().run_action(
+                        action,
+                        action_ex_id,
+                        exec_ctx
+                    )
+                elif isinstance(action, mistral_lib.Action):
                     result = action.run(
                         context.create_action_context(exec_ctx)
                     )
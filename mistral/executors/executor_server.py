@@ -17,10 +17,12 @@ from oslo_log import log as logging
 
 from mistral import config as cfg
 from mistral.executors import default_executor as exe
+from mistral.executors import process_pool
 from mistral.rpc import base as rpc
 from mistral.service import base as service_base
 from mistral.services import action_heartbeat_sender
 from mistral.services import actions as action_service
+from mistral.utils import metrics
 from mistral.utils import profiler as profiler_utils
 
 
@@ -50,10 +52,17 @@ class ExecutorServer(service_base.MistralService):
         if self._setup_profiler:
             profiler_utils.setup('mistral-executor', cfg.CONF.executor.host)
 
+        metrics.setup('mistral-executor')
+
         # Initialize action providers to make sure all action classes
         # are initially imported.
         action_service.get_system_action_provider()
 
+        # Start worker processes in advance so that the first CPU-bound
+        # actions don't have to wait for them.
+        if cfg.CONF.executor.process_pool_size:
+            process_pool.get_pool()
+
         # Initialize and start RPC server.
 
         self._rpc_server = rpc.get_rpc_server_driver()(cfg.CONF.executor)
@@ -68,6 +77,8 @@ class ExecutorServer(service_base.MistralService):
 
         action_heartbeat_sender.stop()
 
+        process_pool.cleanup()
+
         if self._rpc_server:
             self._rpc_server.stop(graceful)
 
@@ -0,0 +1,268 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Pool of worker processes running CPU-bound actions.
+
+An action run by the executor within a green thread blocks all other
+green threads of the executor for as long as it uses CPU. Such actions can
+be run in one of the worker processes started by the executor in advance.
+The green thread running the action only waits for the result of the
+action from a pipe without blocking the other green threads.
+
+An action is sent to a worker process in the same serialized form that is
+used to send actions over RPC. If the action times out or gets interrupted
+then the worker process is killed and replaced by a new one.
+"""
+
+import json
+import os
+import sys
+
+from eventlet.green import subprocess
+from eventlet import queue
+from mistral_lib import actions as mistral_lib
+from mistral_lib import serialization
+from oslo_config import cfg
+from oslo_log import log as logging
+
+from mistral.actions import dynamic_action
+from mistral import context
+from mistral import exceptions as exc
+
+
+LOG = logging.getLogger(__name__)
+
+CONF = cfg.CONF
+
+_POOL = None
+
+
+def _get_config_args():
+    args = []
+
+    for config_file in getattr(CONF, 'config_file', None) or []:
+        args.extend(['--config-file', config_file])
+
+    for config_dir in getattr(CONF, 'config_dir', None) or []:
+        args.extend(['--config-dir', config_dir])
+
+    return args
+
+
+class _Worker(object):
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            [sys.executable, '-m', __name__] + _get_config_args(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+
+        self.interrupted = False
+
+    def call(self, request):
+        self._proc.stdin.write(json.dumps(request).encode() + b'\n')
+        self._proc.stdin.flush()
+
+        # Only the current green thread waits for the response.
+        line = self._proc.stdout.readline()
+
+        if not line:
+            if self.interrupted:
+                raise exc.ActionException("The action was interrupted.")
+
+            raise exc.MistralException(
+                "Action worker process exited [code=%s]" % self._proc.wait()
+            )
+
+        return json.loads(line)
+
+    def kill(self):
+        if self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+
+
+class ProcessPool(object):
+    def __init__(self, size):
+        self._serializer = serialization.get_polymorphic_serializer()
+
+        self._idle = queue.LightQueue()
+
+        # All started workers.
+        self._workers = set()
+
+        # Action execution id -> worker running the action.
+        self._running = {}
+
+        for _ in range(size):
+            self._idle.put(self._start_worker())
+
+    def _start_worker(self):
+        worker = _Worker()
+
+        self._workers.add(worker)
+
+        return worker
+
+    def _replace_worker(self, worker):
+        worker.kill()
+
+        self._workers.discard(worker)
+
+        return self._start_worker()
+
+    def run_action(self, action, action_ex_id, exec_ctx):
+        """Runs the action in a worker process.
+
+        :param action: Action to run.
+        :param action_ex_id: Action execution id.
+        :param exec_ctx: A dict of values providing information about
+            the current execution.
+        :return: Action result.
+        """
+        request = {
+            'action': self._serializer.serialize(action),
+            'exec_ctx': exec_ctx,
+            'auth_ctx': context.ctx().to_dict() if context.has_ctx() else {}
+        }
+
+        worker = self._idle.get()
+
+        if action_ex_id:
+            self._running[action_ex_id] = worker
+
+        try:
+            response = worker.call(request)
+        except BaseException:
+            # The worker may still be running the action, e.g. if the
+            # action timed out, so it can't be reused.
+            worker = self._replace_worker(worker)
+
+            raise
+        finally:
+            self._running.pop(action_ex_id, None)
+
+            self._idle.put(worker)
+
+        if 'error' in response:
+            raise exc.ActionException(response['error'])
+
+        return self._serializer.deserialize(response['result'])
+
+    def interrupt_action(self, action_ex_id):
+        worker = self._running.get(action_ex_id)
+
+        if worker:
+            LOG.info(
+                "Killing the worker process running the action "
+                "[action_ex_id=%s]", action_ex_id
+            )
+
+            worker.interrupted = True
+            worker.kill()
+
+    def stop(self):
+        for worker in self._workers:
+            worker.kill()
+
+        self._workers.clear()
+
+
+def is_enabled_for(action):
+    if not CONF.executor.process_pool_size:
+        return False
+
+    if isinstance(action, dynamic_action.DynamicAction):
+        action = action.action
+
+    if getattr(action, 'run_in_process', False):
+        return True
+
+    cls = type(action)
+
+    return (
+        '%s.%s' % (cls.__module__, cls.__name__) in
+        CONF.executor.process_pool_actions
+    )
+
+
+def get_pool():
+    global _POOL
+
+    if _POOL is None:
+        _POOL = ProcessPool(CONF.executor.process_pool_size)
+
+    return _POOL
+
+
+def interrupt_action(action_ex_id):
+    if _POOL:
+        _POOL.interrupt_action(action_ex_id)
+
+
+def cleanup():
+    global _POOL
+
+    if _POOL:
+        _POOL.stop()
+
+    _POOL = None
+
+
+def _run_action(serializer, request):
+    context.set_ctx(context.MistralContext.from_dict(request['auth_ctx']))
+
+    action = serializer.deserialize(request['action'])
+
+    if isinstance(action, mistral_lib.Action):
+        result = action.run(
+            context.create_action_context(request['exec_ctx'])
+        )
+    else:
+        result = action.run()
+
+    if not isinstance(result, mistral_lib.Result):
+        result = mistral_lib.Result(data=result)
+
+    return serializer.serialize(result)
+
+
+def _worker_main():
+    from mistral import config
+
+    # Responses are written to the original stdout while everything else
+    # printed by actions goes to stderr.
+    out = os.fdopen(os.dup(1), 'w')
+    os.dup2(2, 1)
+
+    config.parse_args(sys.argv[1:])
+    logging.setup(CONF, 'Mistral')
+
+    serializer = serialization.get_polymorphic_serializer()
+
+    for line in sys.stdin:
+        request = json.loads(line)
+
+        try:
+            response = {'result': _run_action(serializer, request)}
+        except Exception as e:
+            response = {'error': '%s: %s' % (type(e).__name__, e)}
+
+        out.write(json.dumps(response) + '\n')
+        out.flush()
+
+
+if __name__ == '__main__':
+    _worker_main()
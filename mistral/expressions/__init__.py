@@ -20,6 +20,7 @@ from oslo_log import log as logging
 from stevedore import extension
 
 from mistral import exceptions as exc
+from mistral.utils import metrics
 
 LOG = logging.getLogger(__name__)
 
@@ -67,7 +68,11 @@ def evaluate(expression, context):
         # every time on a caller side.
         if (isinstance(expression, str) and
                 evaluator.is_expression(expression)):
-            return evaluator.evaluate(expression, context)
+            if not metrics.is_enabled():
+                return evaluator.evaluate(expression, context)
+
+            with metrics.timer(metrics.EXPRESSION_EVALUATION, name):
+                return evaluator.evaluate(expression, context)
 
     return expression
 
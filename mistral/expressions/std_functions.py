@@ -24,6 +24,7 @@ import yaml
 from mistral.db import utils as db_utils
 from mistral.db.v2 import api as db_api
 from mistral.utils import filter_utils
+from mistral.utils import safe_yaml
 from mistral_lib import utils as ml_utils
 
 # Additional YAQL/Jinja functions provided by Mistral out of the box.
@@ -287,7 +288,7 @@ def json_parse_(context, data):
 
 
 def yaml_parse_(context, data):
-    return yaml.safe_load(data)
+    return safe_yaml.load_with_anchors(data)
 
 
 def generate_random_data_(context, count=10, length=10):
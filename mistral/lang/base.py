@@ -204,6 +204,29 @@ class BaseSpec(object):
 
         return schema
 
+    @classmethod
+    def get_validator(cls):
+        """Returns a JSON schema validator for the specification class.
+
+        The validator is built once per class because building it, along
+        with checking the schema itself, may take more time than the
+        validation of the data.
+        """
+        # The validator of a parent class must not be used.
+        validator = cls.__dict__.get('_validator')
+
+        if validator is None:
+            schema = cls.get_schema()
+
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+
+            validator = validator_cls(schema)
+
+            cls._validator = validator
+
+        return validator
+
     def __init__(self, data, validate):
         self._data = data
         self._validate = validate
@@ -225,10 +248,12 @@ class BaseSpec(object):
         a dictionary accessible through '_data' instance field.
         """
 
-        try:
-            jsonschema.validate(self._data, self.get_schema())
-        except jsonschema.ValidationError as e:
-            raise exc.InvalidModelException("Invalid DSL: %s" % e)
+        error = jsonschema.exceptions.best_match(
+            self.get_validator().iter_errors(self._data)
+        )
+
+        if error is not None:
+            raise exc.InvalidModelException("Invalid DSL: %s" % error)
 
     def validate_semantics(self):
         """Validates semantics of specification object.
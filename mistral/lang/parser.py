@@ -14,11 +14,19 @@
 #    limitations under the License.
 
 import cachetools
+import collections
+import hashlib
+import json
+import sys
 import threading
+import weakref
 from yaml import error
 
 import io as six_io
 
+from oslo_config import cfg
+from oslo_log import log as logging
+
 from mistral.db.v2 import api as db_api
 from mistral import exceptions as exc
 from mistral.lang import base
@@ -27,19 +35,39 @@ from mistral.lang.v2 import tasks as tasks_v2
 from mistral.lang.v2 import workbook as wb_v2
 from mistral.lang.v2 import workflows as wf_v2
 from mistral.utils import safe_yaml
+from mistral.workflow import states
+
+CONF = cfg.CONF
+
+LOG = logging.getLogger(__name__)
 
 V2_0 = '2.0'
 
 ALL_VERSIONS = [V2_0]
 
+# Workflow specifications are cached by checksums of their raw
+# dictionaries so that all executions of the same workflow share one
+# specification object. The caches are created on first use because
+# their sizes are configurable.
+
+# {workflow spec checksum => (workflow specification, estimated size)}.
+_WF_SPEC_CACHE = None
+
+# {workflow execution id => workflow spec checksum}.
+_WF_EX_CACHE = None
 
-# {workflow execution id => workflow specification}.
-_WF_EX_CACHE = cachetools.LRUCache(maxsize=100)
-_WF_EX_CACHE_LOCK = threading.RLock()
+# {(workflow def id, workflow def updated at) => workflow spec checksum}.
+_WF_DEF_CACHE = None
 
-# {(workflow def id, workflow def updated at) => workflow specification}.
-_WF_DEF_CACHE = cachetools.LRUCache(maxsize=100)
-_WF_DEF_CACHE_LOCK = threading.RLock()
+# {workflow specification => workflow spec checksum}.
+_WF_SPEC_CHECKSUMS = weakref.WeakKeyDictionary()
+
+_WF_SPEC_CACHE_LOCK = threading.RLock()
+
+_WF_SPEC_CACHE_STATS = collections.Counter()
+
+_EXECUTION = 'execution'
+_DEFINITION = 'definition'
 
 
 def parse_yaml(text):
@@ -207,7 +235,114 @@ def _parse_def_from_wb(wb_def, section_name, item_name):
 # Methods for obtaining specifications in a more efficient way using
 # caching techniques.
 
-@cachetools.cached(_WF_EX_CACHE, lock=_WF_EX_CACHE_LOCK)
+def _get_key_cache(kind):
+    global _WF_SPEC_CACHE
+    global _WF_EX_CACHE
+    global _WF_DEF_CACHE
+
+    if _WF_SPEC_CACHE is None:
+        _WF_SPEC_CACHE = cachetools.LRUCache(
+            maxsize=CONF.engine.spec_cache_max_memory * 1024 * 1024,
+            getsizeof=lambda entry: entry[1]
+        )
+        _WF_EX_CACHE = cachetools.LRUCache(
+            maxsize=CONF.engine.spec_cache_max_entries
+        )
+        _WF_DEF_CACHE = cachetools.LRUCache(
+            maxsize=CONF.engine.spec_cache_max_entries
+        )
+
+    return _WF_EX_CACHE if kind == _EXECUTION else _WF_DEF_CACHE
+
+
+def _estimate_size(obj):
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(
+            _estimate_size(k) + _estimate_size(v) for k, v in obj.items()
+        )
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_estimate_size(v) for v in obj)
+
+    return size
+
+
+def _get_spec_checksum(spec_dict):
+    return hashlib.md5(
+        json.dumps(spec_dict, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+
+
+def _get_cached_spec(kind, key):
+    with _WF_SPEC_CACHE_LOCK:
+        checksum = _get_key_cache(kind).get(key)
+
+        entry = _WF_SPEC_CACHE.get(checksum) if checksum else None
+
+        if entry is None:
+            _WF_SPEC_CACHE_STATS['misses'] += 1
+
+            return None
+
+        _WF_SPEC_CACHE_STATS['hits'] += 1
+
+        return entry[0]
+
+
+def _cache_spec(kind, key, spec_dict, wf_spec=None):
+    """Caches a workflow specification under the given key.
+
+    If a specification with the same checksum is already cached then it
+    is returned instead of the given one and nothing needs to be parsed.
+
+    :param kind: Kind of the key, either workflow execution id or
+        workflow definition id with its 'updated_at'.
+    :param key: Cache key.
+    :param spec_dict: Raw specification dictionary.
+    :param wf_spec: Specification object if it's already built.
+    :return: Workflow specification.
+    """
+    with _WF_SPEC_CACHE_LOCK:
+        key_cache = _get_key_cache(kind)
+
+        checksum = _WF_SPEC_CHECKSUMS.get(wf_spec) if wf_spec else None
+
+    if checksum is None:
+        checksum = _get_spec_checksum(spec_dict)
+
+    with _WF_SPEC_CACHE_LOCK:
+        entry = _WF_SPEC_CACHE.get(checksum)
+
+    if entry is None:
+        if wf_spec is None:
+            wf_spec = get_workflow_spec(spec_dict)
+
+            _WF_SPEC_CACHE_STATS['parsed'] += 1
+
+        entry = (wf_spec, _estimate_size(spec_dict))
+
+        with _WF_SPEC_CACHE_LOCK:
+            try:
+                _WF_SPEC_CACHE[checksum] = entry
+            except ValueError:
+                LOG.warning(
+                    "Workflow specification is too large to be cached "
+                    "[size=%s, max_memory=%sMB]",
+                    entry[1],
+                    CONF.engine.spec_cache_max_memory
+                )
+
+                return wf_spec
+
+            _WF_SPEC_CHECKSUMS[wf_spec] = checksum
+
+    with _WF_SPEC_CACHE_LOCK:
+        key_cache[key] = checksum
+
+    return entry[0]
+
+
 def get_workflow_spec_by_execution_id(wf_ex_id):
     """Gets workflow specification by workflow execution id.
 
@@ -223,12 +358,16 @@ def get_workflow_spec_by_execution_id(wf_ex_id):
     if not wf_ex_id:
         return None
 
-    wf_ex = db_api.get_workflow_execution(wf_ex_id)
+    wf_spec = _get_cached_spec(_EXECUTION, wf_ex_id)
+
+    if wf_spec is not None:
+        return wf_spec
 
-    return get_workflow_spec(wf_ex.spec)
+    wf_ex = db_api.get_workflow_execution(wf_ex_id, fields=['spec'])
+
+    return _cache_spec(_EXECUTION, wf_ex_id, wf_ex.spec)
 
 
-@cachetools.cached(_WF_DEF_CACHE, lock=_WF_DEF_CACHE_LOCK)
 def get_workflow_spec_by_definition_id(wf_def_id, wf_def_updated_at):
     """Gets specification by workflow definition id and its 'updated_at'.
 
@@ -250,28 +389,111 @@ def get_workflow_spec_by_definition_id(wf_def_id, wf_def_updated_at):
     if not wf_def_id:
         return None
 
-    wf_def = db_api.get_workflow_definition(wf_def_id)
+    key = (wf_def_id, wf_def_updated_at)
+
+    wf_spec = _get_cached_spec(_DEFINITION, key)
 
-    return get_workflow_spec(wf_def.spec)
+    if wf_spec is not None:
+        return wf_spec
+
+    wf_def = db_api.get_workflow_definition(wf_def_id, fields=['spec'])
+
+    return _cache_spec(_DEFINITION, key, wf_def.spec)
 
 
 def cache_workflow_spec_by_execution_id(wf_ex_id, wf_spec):
-    with _WF_EX_CACHE_LOCK:
-        _WF_EX_CACHE[cachetools.keys.hashkey(wf_ex_id)] = wf_spec
+    _cache_spec(_EXECUTION, wf_ex_id, wf_spec.to_dict(), wf_spec)
+
+
+def warm_up_caches():
+    """Caches specifications of running workflow executions.
+
+    It's supposed to be called when the engine starts so that workflow
+    executions started by other engine instances or before a restart
+    don't need to parse their specifications on demand.
+    """
+    wf_ex_ids = [
+        wf_ex.id for wf_ex in db_api.get_workflow_executions(
+            insecure=True,
+            state=states.RUNNING,
+            fields=['id'],
+            limit=CONF.engine.spec_cache_max_entries,
+            sort_keys=['updated_at'],
+            sort_dirs=['desc']
+        )
+    ]
+
+    batch_size = 100
+
+    for i in range(0, len(wf_ex_ids), batch_size):
+        wf_exs = db_api.get_workflow_executions(
+            insecure=True,
+            id={'in': wf_ex_ids[i:i + batch_size]},
+            fields=['id', 'spec']
+        )
+
+        for wf_ex in wf_exs:
+            try:
+                _cache_spec(_EXECUTION, wf_ex.id, wf_ex.spec)
+            except Exception:
+                LOG.exception(
+                    "Failed to cache workflow specification "
+                    "[wf_ex_id=%s]", wf_ex.id
+                )
+
+    LOG.info(
+        "Workflow specification cache is warmed up [executions=%s, "
+        "specifications=%s]",
+        get_wf_execution_spec_cache_size(),
+        len(_WF_SPEC_CACHE)
+    )
 
 
 def get_wf_execution_spec_cache_size():
-    return len(_WF_EX_CACHE)
+    with _WF_SPEC_CACHE_LOCK:
+        return len(_get_key_cache(_EXECUTION))
 
 
 def get_wf_definition_spec_cache_size():
-    return len(_WF_DEF_CACHE)
+    with _WF_SPEC_CACHE_LOCK:
+        return len(_get_key_cache(_DEFINITION))
+
+
+def get_stats():
+    """Returns statistics of the workflow specification cache.
+
+    :return: A dict with the number of cache hits and misses, the hit
+        rate, the number of parsed specifications, cached specifications
+        and the keys referring to them, and the estimated memory taken by
+        the cached specifications in bytes.
+    """
+    with _WF_SPEC_CACHE_LOCK:
+        _get_key_cache(_EXECUTION)
+
+        stats = dict(_WF_SPEC_CACHE_STATS)
+
+        stats['specifications'] = len(_WF_SPEC_CACHE)
+        stats['executions'] = len(_WF_EX_CACHE)
+        stats['definitions'] = len(_WF_DEF_CACHE)
+        stats['memory'] = _WF_SPEC_CACHE.currsize
+
+    lookups = stats.get('hits', 0) + stats.get('misses', 0)
+
+    stats['hit_rate'] = stats.get('hits', 0) / lookups if lookups else 0.0
+
+    return stats
 
 
 def clear_caches():
     """Clears all specification caches."""
-    with _WF_EX_CACHE_LOCK:
-        _WF_EX_CACHE.clear()
+    global _WF_SPEC_CACHE
+    global _WF_EX_CACHE
+    global _WF_DEF_CACHE
+
+    with _WF_SPEC_CACHE_LOCK:
+        _WF_SPEC_CACHE = None
+        _WF_EX_CACHE = None
+        _WF_DEF_CACHE = None
 
-    with _WF_DEF_CACHE_LOCK:
-        _WF_DEF_CACHE.clear()
+        _WF_SPEC_CHECKSUMS.clear()
+        _WF_SPEC_CACHE_STATS.clear()
@@ -238,19 +238,25 @@ class DirectWorkflowSpec(WorkflowSpec):
     def find_inbound_task_specs(self, task_spec):
         task_name = task_spec.get_name()
 
-        specs = self.inbound_tasks_cache.get(task_name)
+        if not self.inbound_tasks_cache:
+            self._build_inbound_tasks_cache()
 
-        if specs is not None:
-            return specs
+        return self.inbound_tasks_cache.get(task_name, [])
 
-        specs = [
-            t_s for t_s in self.get_tasks()
-            if self.transition_exists(t_s.get_name(), task_name)
-        ]
+    def _build_inbound_tasks_cache(self):
+        # Inbound tasks of all tasks are found in one pass over the
+        # transitions. Looking them up for every task separately takes
+        # quadratic time which is noticeable for big workflows.
+        task_specs = self.get_tasks()
 
-        self.inbound_tasks_cache[task_name] = specs
+        cache = {t_s.get_name(): [] for t_s in task_specs}
 
-        return specs
+        for t_s in task_specs:
+            for t_name in self.find_outbound_task_names(t_s.get_name()):
+                if t_name in cache:
+                    cache[t_name].append(t_s)
+
+        self.inbound_tasks_cache = cache
 
     def find_outbound_task_specs(self, task_spec):
         task_name = task_spec.get_name()
@@ -0,0 +1,49 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); you may
+#  not use this file except in compliance with the License. You may obtain
+#  a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#  WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#  License for the specific language governing permissions and limitations
+#  under the License.
+
+from mistral import context as auth_ctx
+from mistral.db.v2 import api as db_api
+from mistral.monitoring import base
+
+from oslo_config import cfg
+from oslo_log import log as logging
+
+CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
+
+
+class StateCountersReconciliationJob(base.MonitoringJob):
+    def __init__(self):
+        super(StateCountersReconciliationJob, self).__init__(
+            interval=CONF.monitoring.state_counters_reconcile_interval,
+            first_execute=True
+        )
+
+    def get_name(self):
+        return "execution state counters reconciliation"
+
+    def execute(self):
+        with db_api.transaction():
+            auth_ctx.set_ctx(
+                auth_ctx.MistralContext(
+                    user=None,
+                    project_id=None,
+                    auth_token=None,
+                    is_admin=True
+                )
+            )
+
+            count = db_api.reconcile_execution_state_counters()
+
+        LOG.debug('Execution state counters reconciled: %s', count)
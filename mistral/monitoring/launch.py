@@ -41,7 +41,7 @@ def main():
     CONF(project='mistral')
     logging.setup(CONF, 'Mistral')
 
-    monitoring = monitoring_server.MonitoringServer()
+    monitoring = monitoring_server.get_oslo_service()
     monitoring.start()
 
 
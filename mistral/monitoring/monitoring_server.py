@@ -13,6 +13,8 @@
 #  License for the specific language governing permissions and limitations
 #  under the License.
 
+import asyncio
+from concurrent import futures
 import datetime
 
 from asyncio import iscoroutinefunction
@@ -25,6 +27,7 @@ from oslo_config import cfg
 from oslo_log import log as logging
 from prometheus_client import CONTENT_TYPE_LATEST
 
+from mistral.monitoring.jobs import state_counters_reconciliation as sc_job
 from mistral.monitoring.prometheus import format_to_prometheus
 from mistral.service import base as service_base
 
@@ -67,17 +70,75 @@ class MonitoringServer(service_base.MistralService):
         self._prometheus_cache = ""
         self._prometheus_last_updated = None
 
-    async def collect_metrics(self, to_json=False):
-        now = datetime.datetime.now()
-        if not self._last_updated or self._outdated(now):
-            metrics = []
-            for collector in self._metric_collectors:
-                if hasattr(collector, "collect_async"):
-                    metrics.extend(await collector.collect_async())
-                elif iscoroutinefunction(collector.collect):
-                    metrics.extend(await collector.collect())
-                else:
-                    metrics.extend(collector.collect())
+        # The last metrics returned by every collector. They're used
+        # if the collector fails or doesn't respond in time.
+        self._collector_metrics = {}
+        self._collector_futures = {}
+        self._collector_executor = futures.ThreadPoolExecutor(
+            max_workers=max(len(self._metric_collectors), 1),
+            thread_name_prefix='metric-collector'
+        )
+
+        # Created in the event loop of the web server.
+        self._refresh_lock = None
+        self._refresh_task = None
+
+    async def _collect(self, collector):
+        name = type(collector).__name__
+        timeout = CONF.monitoring.metric_collector_timeout
+
+        try:
+            if hasattr(collector, "collect_async"):
+                coro = collector.collect_async()
+            elif iscoroutinefunction(collector.collect):
+                coro = collector.collect()
+            else:
+                # A collector that didn't respond in time may still be
+                # running, there's no need to call it once again.
+                future = self._collector_futures.get(name)
+
+                if not future or future.done():
+                    future = self._collector_executor.submit(
+                        collector.collect
+                    )
+
+                    self._collector_futures[name] = future
+
+                coro = asyncio.wrap_future(future)
+
+            metrics = await asyncio.wait_for(asyncio.shield(coro), timeout)
+
+            self._collector_metrics[name] = metrics
+        except asyncio.TimeoutError:
+            LOG.warning(
+                "Metric collector did not respond in time, the previous "
+                "metrics are used [collector=%s, timeout=%s]",
+                name,
+                timeout
+            )
+        except Exception:
+            LOG.exception(
+                "Metric collector failed, the previous metrics are used "
+                "[collector=%s]",
+                name
+            )
+
+        return self._collector_metrics.get(name, [])
+
+    async def refresh_metrics(self):
+        """Runs all collectors concurrently and caches their metrics."""
+        if not self._refresh_lock:
+            self._refresh_lock = asyncio.Lock()
+
+        async with self._refresh_lock:
+            now = datetime.datetime.now()
+
+            results = await asyncio.gather(
+                *[self._collect(c) for c in self._metric_collectors]
+            )
+
+            metrics = [m for collector_metrics in results
+                       for m in collector_metrics]
 
             for metric in metrics:
                 metric.tags.update(self._standard_tags)
@@ -85,6 +146,33 @@ class MonitoringServer(service_base.MistralService):
             self._metrics = metrics
             self._last_updated = now
 
+            self._prometheus_cache = ''.join(
+                line.decode('utf-8') for line in format_to_prometheus(
+                    [m.__dict__ for m in metrics]
+                )
+            )
+            self._prometheus_last_updated = now
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self.refresh_metrics()
+            except Exception:
+                LOG.exception("Failed to refresh metrics.")
+
+            await asyncio.sleep(self._timedelta.total_seconds())
+
+    def start_background_refresh(self):
+        if not self._refresh_task:
+            self._refresh_task = asyncio.ensure_future(self._refresh_loop())
+
+    async def collect_metrics(self, to_json=False):
+        # With the background refresh the metrics are only collected
+        # here before the first refresh completes.
+        if self._outdated(datetime.datetime.now()) and (
+                not self._refresh_task or self._last_updated is None):
+            await self.refresh_metrics()
+
         if to_json:
             return [m.__dict__ for m in self._metrics]
         return self._metrics
@@ -95,20 +183,7 @@ class MonitoringServer(service_base.MistralService):
         return self._last_updated <= now - self._timedelta
 
     async def _get_prometheus_metrics(self):
-        if (
-            not self._prometheus_last_updated
-            or self._prometheus_last_updated
-            <= datetime.datetime.now() - self._timedelta
-        ):
-            now = datetime.datetime.now()
-
-            metrics = await self.collect_metrics(to_json=True)
-            formatted = format_to_prometheus(metrics)
-            self._prometheus_cache = ''.join(
-                line.decode('utf-8') for line in formatted
-            )
-
-            self._prometheus_last_updated = now
+        await self.collect_metrics()
 
         return self._prometheus_cache
 
@@ -120,6 +195,11 @@ class MonitoringServer(service_base.MistralService):
                 self._jobs.append(recovery_job)
                 recovery_job.start()
 
+        if CONF.engine.execution_state_counters:
+            job = sc_job.StateCountersReconciliationJob()
+            self._jobs.append(job)
+            job.start()
+
     def start(self):
         super().start()
         self._init_monitoring_jobs()
@@ -148,6 +228,13 @@ class MonitoringServer(service_base.MistralService):
         for job in self._jobs:
             job.stop(graceful)
 
+        self._collector_executor.shutdown(wait=graceful)
+
+
+@app.on_event("startup")
+async def start_background_refresh():
+    get_oslo_service().start_background_refresh()
+
 
 @app.get("/health")
 def health():
@@ -21,6 +21,7 @@ from mistral.notifiers import default_notifier as notif
 from mistral.rpc import base as rpc
 from mistral.service import base as service_base
 from mistral.services.kafka_notifications import init_consume_loop
+from mistral.utils import metrics
 from mistral.utils import profiler as profiler_utils
 from mistral_lib import utils
 
@@ -44,6 +45,8 @@ class NotificationServer(service_base.MistralService):
         if self._setup_profiler:
             profiler_utils.setup('mistral-notifier', cfg.CONF.notifier.host)
 
+        metrics.setup('mistral-notifier')
+
         db_api.setup_db()
 
         # Initialize and start RPC server.
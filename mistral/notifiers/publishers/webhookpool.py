@@ -0,0 +1,267 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import collections
+from http import HTTPStatus
+import json
+
+import eventlet
+from eventlet import queue as eventlet_queue
+from oslo_config import cfg
+from oslo_log import log as logging
+
+from mistral.notifiers import base
+from mistral.services import secure_request
+from mistral.utils import http_utils
+
+
+LOG = logging.getLogger(__name__)
+
+CONF = cfg.CONF
+
+
+class _Delivery(object):
+    def __init__(self, url, headers, body, event, ex_id, number_of_retries,
+                 batch_size, timeout):
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.event = event
+        self.ex_id = ex_id
+        self.number_of_retries = number_of_retries
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.attempts = 0
+
+    def can_batch_with(self, other):
+        return (
+            self.batch_size > 1 and
+            self.batch_size == other.batch_size and
+            self.headers == other.headers
+        )
+
+
+class WebhookPoolPublisher(base.NotificationPublisher):
+    """Webhook publisher delivering notifications asynchronously.
+
+    Notifications are put into a bounded queue and sent by a pool of
+    worker threads using keep-alive connections. Notifications for the
+    same URL are delivered one by one in the order they were published,
+    while a slow or failing URL doesn't hold up deliveries to other URLs.
+    Failed requests are retried with an exponential backoff. If too many
+    notifications are waiting for delivery to a URL then new notifications
+    for it are dropped.
+
+    Supported publisher parameters:
+        url - webhook URL.
+        headers - (optional) HTTP headers.
+        number_of_retries - (optional) number of retries of a failed
+            request, 3 by default. -1 means retrying until success.
+        batch_size - (optional) if greater than 1 then up to batch_size
+            pending notifications are sent in one request as a JSON array.
+        timeout - (optional) HTTP request timeout in seconds.
+    """
+
+    def __init__(self):
+        # URL -> deliveries waiting to be sent to it.
+        self._deliveries = collections.defaultdict(collections.deque)
+
+        # URLs that have a worker thread sending to them or scheduled
+        # to be processed by a worker thread.
+        self._scheduled = set()
+
+        # URL -> timer scheduling the next attempt to send to it.
+        self._retry_timers = {}
+
+        self._ready_urls = eventlet_queue.LightQueue()
+        self._workers = []
+
+    def _ensure_started(self):
+        if self._workers:
+            return
+
+        for _ in range(CONF.notifier.webhook_pool_parallelism):
+            self._workers.append(eventlet.spawn(self._work))
+
+    def stop(self):
+        for w in self._workers:
+            w.kill()
+
+        for t in self._retry_timers.values():
+            t.cancel()
+
+        self._workers = []
+        self._retry_timers = {}
+
+        # Undelivered notifications are dropped.
+        self._deliveries.clear()
+        self._scheduled.clear()
+        self._ready_urls = eventlet_queue.LightQueue()
+
+    def publish(self, ctx, ex_id, data, event, timestamp, **kwargs):
+        url = kwargs.get('url')
+        headers = dict(kwargs.get('headers') or {})
+
+        if 'headers' in data:
+            headers.update(data['headers'])
+            del data['headers']
+
+        delivery = _Delivery(
+            url,
+            headers,
+            json.dumps(data),
+            event,
+            ex_id,
+            int(kwargs.get('number_of_retries', 3)),
+            int(kwargs.get('batch_size', 1)),
+            kwargs.get('timeout')
+        )
+
+        self._ensure_started()
+
+        queue = self._deliveries[url]
+
+        if len(queue) >= CONF.notifier.webhook_pool_queue_size:
+            LOG.error(
+                "Message not delivered, too many messages are waiting for "
+                "delivery: [url=%s, event=%s, ex_id=%s]",
+                url, event, ex_id
+            )
+
+            return
+
+        queue.append(delivery)
+
+        if url not in self._scheduled:
+            self._scheduled.add(url)
+            self._ready_urls.put(url)
+
+    def _work(self):
+        while True:
+            url = self._ready_urls.get()
+
+            try:
+                self._process(url)
+            except Exception:
+                LOG.exception("Failed to process webhook [url=%s]", url)
+
+    def _process(self, url):
+        queue = self._deliveries[url]
+        batch = self._get_batch(queue)
+
+        if self._send(url, batch):
+            self._complete(queue, batch)
+        else:
+            head = batch[0]
+            head.attempts += 1
+
+            retries = head.number_of_retries
+
+            if retries == -1 or head.attempts <= retries:
+                delay = min(
+                    CONF.notifier.webhook_pool_retry_delay *
+                    2 ** (head.attempts - 1),
+                    CONF.notifier.webhook_pool_max_retry_delay
+                )
+
+                # Retry later without occupying the worker thread.
+                self._retry_timers[url] = eventlet.spawn_after(
+                    delay,
+                    self._retry,
+                    url
+                )
+
+                return
+
+            LOG.error(
+                'The number of retries is over: [url=%s, event=%s, ex_id=%s]',
+                url, head.event, head.ex_id
+            )
+
+            self._complete(queue, batch)
+
+        if queue:
+            self._ready_urls.put(url)
+        else:
+            self._scheduled.discard(url)
+
+            del self._deliveries[url]
+
+    def _retry(self, url):
+        del self._retry_timers[url]
+
+        self._ready_urls.put(url)
+
+    @staticmethod
+    def _complete(queue, batch):
+        for _ in batch:
+            queue.popleft()
+
+    @staticmethod
+    def _get_batch(queue):
+        head = queue[0]
+        batch = [head]
+
+        for delivery in list(queue)[1:head.batch_size]:
+            if not head.can_batch_with(delivery):
+                break
+
+            batch.append(delivery)
+
+        return batch
+
+    @staticmethod
+    def _send(url, batch):
+        head = batch[0]
+        headers = dict(head.headers)
+
+        if head.batch_size > 1:
+            body = '[%s]' % ','.join(d.body for d in batch)
+        else:
+            body = head.body
+
+        try:
+            if CONF.oauth2.security_profile == 'prod':
+                headers = secure_request.set_auth_token(headers)
+
+            resp = http_utils.get_session(url).post(
+                url,
+                data=body,
+                headers=headers,
+                timeout=head.timeout
+            )
+        except Exception as e:
+            LOG.error(
+                "Message not delivered: [url=%s, events=%s, message=%s, "
+                "number_of_retry=%s]",
+                url, len(batch), str(e), head.attempts
+            )
+
+            return False
+
+        if resp.status_code not in [HTTPStatus.OK, HTTPStatus.CREATED]:
+            LOG.error(
+                "Message not delivered: [url=%s, events=%s, status_code=%s, "
+                "text=%s, number_of_retry=%s]",
+                url, len(batch), resp.status_code, resp.text, head.attempts
+            )
+
+            return False
+
+        LOG.info(
+            "Webhook request url=%s code=%s events=%s",
+            url, resp.status_code, len(batch)
+        )
+
+        return True
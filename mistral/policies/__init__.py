@@ -24,6 +24,7 @@ from mistral.policies import environment
 from mistral.policies import event_trigger
 from mistral.policies import execution
 from mistral.policies import member
+from mistral.policies import profiler
 from mistral.policies import service
 from mistral.policies import task
 from mistral.policies import workbook
@@ -42,6 +43,7 @@ def list_rules():
         event_trigger.list_rules(),
         execution.list_rules(),
         member.list_rules(),
+        profiler.list_rules(),
         service.list_rules(),
         task.list_rules(),
         workbook.list_rules(),
@@ -0,0 +1,47 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from oslo_policy import policy
+
+from mistral.policies import base
+
+PROFILER = 'profiler:%s'
+
+rules = [
+    policy.DocumentedRuleDefault(
+        name=PROFILER % 'get',
+        check_str=base.RULE_ADMIN_ONLY,
+        description='Return aggregated profiler statistics of an engine.',
+        operations=[
+            {
+                'path': '/v2/profiler',
+                'method': 'GET'
+            }
+        ]
+    ),
+    policy.DocumentedRuleDefault(
+        name=PROFILER % 'update',
+        check_str=base.RULE_ADMIN_ONLY,
+        description='Change profiler aggregation settings of all engines.',
+        operations=[
+            {
+                'path': '/v2/profiler',
+                'method': 'PUT'
+            }
+        ]
+    )
+]
+
+
+def list_rules():
+    return rules
@@ -480,6 +480,38 @@ class EngineClient(eng.Engine):
             action_ex_ids=action_ex_ids
         )
 
+    @base.wrap_messaging_exception
+    def get_profiler_stats(self, host=None):
+        """Gets aggregated profiler statistics of an engine.
+
+        :param host: Host of the engine. If not specified, the statistics
+            of any engine are returned.
+        :return: Profiler statistics.
+        """
+        return self._client.sync_call(
+            auth_ctx.ctx(),
+            'get_profiler_stats',
+            target=host
+        )
+
+    @base.wrap_messaging_exception
+    def configure_profiler(self, enabled=None, sampling_rate=None,
+                           reset=False):
+        """Changes profiler aggregation settings of all engines.
+
+        :param enabled: Whether to aggregate the profiler trace points.
+        :param sampling_rate: The fraction of trace points to aggregate.
+        :param reset: Whether to drop the collected statistics.
+        """
+        return self._client.async_call(
+            auth_ctx.ctx(),
+            'configure_profiler',
+            fanout=True,
+            enabled=enabled,
+            sampling_rate=sampling_rate,
+            reset=reset
+        )
+
 
 class ExecutorClient(exe.Executor):
     """RPC Executor client."""
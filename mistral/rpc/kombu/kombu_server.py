@@ -13,6 +13,7 @@
 #    limitations under the License.
 
 import amqp
+import collections
 import socket
 import threading
 import time
@@ -28,6 +29,7 @@ from mistral import exceptions as exc
 from mistral.rpc import base as rpc_base
 from mistral.rpc.kombu import base as kombu_base
 from mistral.rpc.kombu import kombu_hosts
+from mistral.utils import metrics
 
 
 LOG = logging.getLogger(__name__)
@@ -75,6 +77,30 @@ class KombuRPCServer(rpc_base.RPCServer, kombu_base.Base):
         self._worker = None
         self._thread = None
 
+        # Limits the number of messages accepted for processing to the
+        # number of worker threads.
+        self._worker_slots = None
+        self._max_workers = 1
+
+        self._method_limits = {
+            name: int(limit)
+            for name, limit in CONF.kombu_rpc.method_concurrency.items()
+        }
+        self._ack_on_accept = set(CONF.kombu_rpc.ack_on_accept_methods)
+
+        # Method name -> number of its messages being processed.
+        self._method_running = collections.Counter()
+
+        # Method name -> messages waiting for the method concurrency limit.
+        self._method_waiting = collections.defaultdict(collections.deque)
+        self._method_lock = threading.Lock()
+
+        # The consumer of the current connection and its prefetch count.
+        # The prefetch count is only changed by the thread consuming
+        # messages since channels can't be shared between threads.
+        self._consumer = None
+        self._prefetch_count = None
+
         # TODO(ddeja): Those 2 options should be gathered from config.
         self._sleep_time = 1
         self._max_sleep_time = 10
@@ -126,7 +152,15 @@ class KombuRPCServer(rpc_base.RPCServer, kombu_base.Base):
                         queues=queue,
                         callbacks=[self._process_message],
                 ) as consumer:
-                    consumer.qos(prefetch_count=1)
+                    self._consumer = consumer
+                    self._prefetch_count = None
+
+                    # Messages received over a previous connection will be
+                    # redelivered so they can't be acknowledged anymore.
+                    with self._method_lock:
+                        self._method_waiting.clear()
+
+                    self._update_qos()
 
                     self._running.set()
                     self._stopped.clear()
@@ -152,6 +186,13 @@ class KombuRPCServer(rpc_base.RPCServer, kombu_base.Base):
                             )
 
                             return
+
+                        # Messages that were waiting for a method
+                        # concurrency limit may have been processed.
+                        self._update_qos()
+
+                    # The server has been stopped.
+                    return
             except (socket.error, amqp.exceptions.ConnectionForced) as e:
                 LOG.debug("Broker connection failed: %s", e)
 
@@ -218,7 +259,25 @@ class KombuRPCServer(rpc_base.RPCServer, kombu_base.Base):
                 type=res_type
             )
 
-    def _on_message_safe(self, request, message):
+    def _get_prefetch_count(self):
+        return CONF.kombu_rpc.prefetch_count or self._max_workers
+
+    def _update_qos(self):
+        # Messages waiting for a method concurrency limit are not
+        # acknowledged yet so the prefetch window is extended by their
+        # number. Otherwise they would keep messages of other methods
+        # from being delivered.
+        with self._method_lock:
+            waiting = sum(len(w) for w in self._method_waiting.values())
+
+        prefetch_count = self._get_prefetch_count() + waiting
+
+        if prefetch_count != self._prefetch_count:
+            self._consumer.qos(prefetch_count=prefetch_count)
+
+            self._prefetch_count = prefetch_count
+
+    def _on_message_safe(self, request, message, acked=False):
         try:
             return self._on_message(request, message)
         except Exception as e:
@@ -237,7 +296,8 @@ class KombuRPCServer(rpc_base.RPCServer, kombu_base.Base):
                 res_type='error'
             )
         finally:
-            message.ack()
+            if not acked:
+                message.ack()
 
     def _on_message(self, request, message):
         LOG.debug('Received message %s', request)
@@ -276,10 +336,80 @@ class KombuRPCServer(rpc_base.RPCServer, kombu_base.Base):
             )
 
     def register_endpoint(self, endpoint):
-        self.endpoints.append(endpoint)
+        self.endpoints.append(metrics.instrument_rpc_endpoint(endpoint))
 
     def _process_message(self, request, message):
-        self._worker.submit(self._on_message_safe, request, message)
+        method_name = request.get('rpc_method')
+        limit = self._method_limits.get(method_name)
+
+        if limit:
+            with self._method_lock:
+                waiting = self._method_running[method_name] >= limit
+
+                if waiting:
+                    self._method_waiting[method_name].append(
+                        (request, message)
+                    )
+                else:
+                    self._method_running[method_name] += 1
+
+            if waiting:
+                self._update_qos()
+
+                return
+
+        self._accept_message(request, message)
+
+    def _accept_message(self, request, message):
+        # Wait for a free worker thread so that the messages that can't be
+        # processed yet stay unacknowledged and count towards the prefetch.
+        self._worker_slots.acquire()
+
+        self._submit_message(request, message)
+
+    def _submit_message(self, request, message):
+        acked = (
+            request.get('async', False) and
+            request.get('rpc_method') in self._ack_on_accept
+        )
+
+        if acked:
+            message.ack()
+
+        try:
+            self._worker.submit(self._handle_message, request, message, acked)
+        except Exception:
+            self._release_message(request)
+
+            raise
+
+    def _handle_message(self, request, message, acked):
+        try:
+            self._on_message_safe(request, message, acked=acked)
+        finally:
+            self._release_message(request)
+
+    def _release_message(self, request):
+        method_name = request.get('rpc_method')
+
+        if method_name in self._method_limits:
+            with self._method_lock:
+                waiting = self._method_waiting.get(method_name)
+
+                if waiting:
+                    next_request, next_message = waiting.popleft()
+                else:
+                    next_request = None
+
+                    self._method_running[method_name] -= 1
+
+            if next_request is not None:
+                # Pass the worker slot to the waiting message.
+                self._submit_message(next_request, next_message)
+
+                return
+
+        self._worker_slots.release()
 
     def _prepare_worker(self, executor='blocking'):
         mgr = driver.DriverManager('kombu_driver.executors', executor)
@@ -289,4 +419,7 @@ class KombuRPCServer(rpc_base.RPCServer, kombu_base.Base):
         if executor != 'blocking':
             executor_opts['max_workers'] = self._executor_threads
 
+        self._max_workers = executor_opts.get('max_workers', 1)
+        self._worker_slots = threading.BoundedSemaphore(self._max_workers)
+
         self._worker = mgr.driver(**executor_opts)
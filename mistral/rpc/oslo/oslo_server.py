@@ -17,6 +17,7 @@ from oslo_messaging.rpc import dispatcher
 
 from mistral import context as ctx
 from mistral.rpc import base as rpc
+from mistral.utils import metrics
 
 
 class OsloRPCServer(rpc.RPCServer):
@@ -33,7 +34,7 @@ class OsloRPCServer(rpc.RPCServer):
         self.oslo_server = None
 
     def register_endpoint(self, endpoint):
-        self.endpoints.append(endpoint)
+        self.endpoints.append(metrics.instrument_rpc_endpoint(endpoint))
 
     def run(self, executor='eventlet'):
         target = messaging.Target(
@@ -34,6 +34,7 @@ CONF = cfg.CONF
 _stopped = True
 
 
+@db_utils.collect_query_stats('handle_expired_actions')
 @db_utils.retry_on_db_error
 @post_tx_queue.run
 def handle_expired_actions():
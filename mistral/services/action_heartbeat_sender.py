@@ -36,8 +36,8 @@ def add_action(action_ex_id):
 
     # With run-action there is no actions_ex_id assigned.
     if action_ex_id and _enabled:
-        rpc.get_engine_client().process_action_heartbeats([action_ex_id])
-
+        # The first heartbeat is sent with the next periodic batch rather
+        # than with a separate engine call for every started action.
         _running_actions.add(action_ex_id)
 
 
@@ -56,7 +56,9 @@ def send_action_heartbeats():
     if not _running_actions:
         return
 
-    rpc.get_engine_client().process_action_heartbeats(_running_actions)
+    rpc.get_engine_client().process_action_heartbeats(
+        list(_running_actions)
+    )
 
 
 def _loop():
@@ -18,12 +18,21 @@ collection of functions for accessing information about actions
 available in the system.
 """
 
+import collections
+import threading
+import time
+
+import cachetools
+from oslo_config import cfg
 from oslo_log import log as logging
 from stevedore import extension
 
 from mistral_lib import actions as ml_actions
 
 from mistral.actions import test
+from mistral.services import security
+
+CONF = cfg.CONF
 
 LOG = logging.getLogger(__name__)
 
@@ -31,6 +40,133 @@ _SYSTEM_PROVIDER = None
 _TEST_PROVIDER = None
 
 
+class CachingActionProvider(ml_actions.CompositeActionProvider):
+    """Composite action provider caching results of action lookups.
+
+    Results of the delegates that can tell the state of their actions,
+    i.e. implement the method "get_state()", are kept in a bounded
+    in-memory index per delegate, including the actions that are not
+    found. Such delegates usually load actions from DB so the index
+    saves a few DB queries on every action lookup. The state is checked
+    at most once per [action_lookup_cache]/state_check_interval seconds
+    and the index of a delegate is dropped as soon as its state changes.
+    The other delegates, including the dynamic action provider that has
+    its own cache, are always asked directly.
+    """
+
+    def __init__(self, name, delegates):
+        super().__init__(name, delegates)
+
+        self._lock = threading.RLock()
+
+        # {delegate => action lookup index}
+        self._indexes = {}
+
+        # {delegate => (state, time of the last check)}
+        self._states = {}
+
+        # Incremented every time an index is dropped so that results
+        # obtained with an outdated state are not put into the index.
+        self._generation = 0
+
+        self._stats = collections.Counter()
+
+    def _get_index(self, delegate):
+        index = self._indexes.get(delegate)
+
+        if index is None:
+            index = cachetools.LRUCache(
+                maxsize=CONF.action_lookup_cache.size
+            )
+
+            self._indexes[delegate] = index
+
+        return index
+
+    def _check_state(self, delegate):
+        interval = CONF.action_lookup_cache.state_check_interval
+
+        with self._lock:
+            state, checked_at = self._states.get(delegate, (None, None))
+
+            if (checked_at is not None and
+                    time.monotonic() - checked_at < interval):
+                return
+
+        new_state = delegate.get_state()
+
+        with self._lock:
+            if checked_at is None or new_state != state:
+                self._indexes.pop(delegate, None)
+
+                self._generation += 1
+
+            self._states[delegate] = (new_state, time.monotonic())
+
+    def _find_cached(self, delegate, action_name, namespace):
+        self._check_state(delegate)
+
+        key = (action_name, namespace, security.get_project_id())
+
+        with self._lock:
+            index = self._get_index(delegate)
+
+            if key in index:
+                self._stats['hits'] += 1
+
+                return index[key]
+
+            self._stats['misses'] += 1
+
+            generation = self._generation
+
+        action_desc = delegate.find(action_name, namespace)
+
+        with self._lock:
+            if generation == self._generation:
+                self._get_index(delegate)[key] = action_desc
+
+        return action_desc
+
+    def find(self, action_name, namespace=None):
+        if not CONF.action_lookup_cache.enabled:
+            return super().find(action_name, namespace)
+
+        for d in self._delegates:
+            if hasattr(d, 'get_state'):
+                action_desc = self._find_cached(d, action_name, namespace)
+            else:
+                action_desc = d.find(action_name, namespace)
+
+            if action_desc is not None:
+                return action_desc
+
+        return None
+
+    def clear_cache(self):
+        with self._lock:
+            self._indexes.clear()
+            self._states.clear()
+            self._stats.clear()
+
+            self._generation += 1
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+
+            if not stats:
+                return {}
+
+            stats['size'] = sum(len(i) for i in self._indexes.values())
+
+        hits = stats.get('hits', 0)
+
+        stats['hit_rate'] = hits / (hits + stats.get('misses', 0))
+
+        return stats
+
+
 def _get_registered_providers():
     providers = []
 
@@ -90,9 +226,21 @@ def get_system_action_provider():
         # always empty so it won't take any effect.
         delegates.append(get_test_action_provider())
 
-        _SYSTEM_PROVIDER = ml_actions.CompositeActionProvider(
-            'system',
-            delegates
-        )
+        _SYSTEM_PROVIDER = CachingActionProvider('system', delegates)
 
     return _SYSTEM_PROVIDER
+
+
+def get_stats():
+    """Returns statistics of the action lookup cache.
+
+    :return: A dict with the number of cache hits and misses, the hit rate
+        and the number of cached action lookup results.
+    """
+    return _SYSTEM_PROVIDER.get_stats() if _SYSTEM_PROVIDER else {}
+
+
+def clear_caches():
+    """Clears the action lookup cache."""
+    if _SYSTEM_PROVIDER:
+        _SYSTEM_PROVIDER.clear_cache()
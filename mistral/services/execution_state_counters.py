@@ -0,0 +1,71 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import eventlet
+
+from mistral.db.v2 import api as db_api
+from oslo_config import cfg
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+CONF = cfg.CONF
+
+_stopped = True
+
+
+def _flush():
+    try:
+        count = db_api.flush_execution_state_deltas()
+
+        LOG.debug("Updated %s execution state counters.", count)
+    except Exception:
+        LOG.exception(
+            'Failed to update execution state counters'
+            ' due to an unexpected exception.'
+        )
+
+
+def _loop():
+    while not _stopped:
+        eventlet.sleep(CONF.engine.execution_state_counters_flush_interval)
+
+        _flush()
+
+
+def start():
+    if not CONF.engine.execution_state_counters:
+        return
+
+    global _stopped
+
+    _stopped = False
+
+    db_api.track_execution_state_changes()
+
+    eventlet.spawn_n(_loop)
+
+
+def stop(graceful=False):
+    global _stopped
+
+    if _stopped:
+        return
+
+    _stopped = True
+
+    db_api.untrack_execution_state_changes()
+
+    # Don't lose the changes made since the last flush.
+    _flush()
@@ -16,6 +16,7 @@ import base64
 import time
 
 import eventlet
+from eventlet import semaphore
 from oslo_config import cfg
 from oslo_log import log
 import requests
@@ -25,8 +26,10 @@ Encapsulates a raw authentication token from IDP.
 Provides helper methods for extracting useful values from that token.
 """
 
-# gap, in seconds, to determine whether the given token is about to expire
-STALE_TOKEN_DURATION = 30
+# Default m2m tenant.
+DEFAULT_REALM = 'cloud-common'
+
+# Legacy view of the token of the default realm.
 TOKEN = {
     "access_token": "",
     "token_type": "",
@@ -34,6 +37,8 @@ TOKEN = {
     "expires_at": ""
 }
 
+_PROVIDERS = {}
+
 LOG = log.getLogger(__name__)
 
 
@@ -69,16 +74,164 @@ def request_with_retry(url, method='GET', body=None):
     return resp
 
 
-def set_auth_token(headers):
+def set_auth_token(headers, realm=DEFAULT_REALM):
     headers = headers or {}
 
-    if __will_expire_soon():
-        __refresh()
+    headers['Authorization'] = 'Bearer ' + get_token_provider(realm).get()
 
-    headers['Authorization'] = 'Bearer ' + TOKEN.get('access_token', '')
     return headers
 
 
+class TokenProvider(object):
+    """Caches an IDP token of one realm and refreshes it in advance.
+
+    Only one thread refreshes the token at a time, other threads either
+    keep using the current token if it's still valid or wait for the
+    refresh to complete. After every successful refresh the next one is
+    scheduled in background shortly before the token expires so that
+    requests normally never wait for the IDP.
+    """
+
+    def __init__(self, realm):
+        self.realm = realm
+        self.token = TOKEN if realm == DEFAULT_REALM else {}
+
+        self._lock = semaphore.Semaphore()
+        self._timer = None
+
+        self._stats = {
+            'refreshes': 0,
+            'failures': 0,
+            'refresh_time_total': 0.0,
+            'refresh_time_max': 0.0
+        }
+
+    def get(self):
+        if self.will_expire_soon(stale_duration=0):
+            # The token is absent or already expired, nothing to send.
+            self.refresh(force=False)
+        elif self.will_expire_soon():
+            # Still valid, renew it without holding up the request.
+            if not self._lock.locked():
+                eventlet.spawn_n(self.refresh, False)
+
+        return self.token.get('access_token', '')
+
+    def will_expire_soon(self, stale_duration=None):
+        """Determine if expiration is about to occur or token is absent.
+
+        :returns: true if expiration is within the given duration
+        :rtype: boolean
+        """
+        if stale_duration is None:
+            stale_duration = cfg.CONF.expiration_token_duration
+
+        return not self.token.get('access_token') or (
+            time.time() > self.token.get('expires_at', 0) - stale_duration
+        )
+
+    def refresh(self, force=True):
+        """Gets a new token from IDP.
+
+        :param force: If False, the token is not refreshed if another
+            thread has just refreshed it.
+        """
+        with self._lock:
+            if not force and not self.will_expire_soon():
+                return
+
+            started = time.monotonic()
+
+            try:
+                resp_json = _get_token(self.realm)
+            except Exception:
+                self._stats['failures'] += 1
+
+                LOG.exception(
+                    "Failed to get a token from IDP [realm=%s]", self.realm
+                )
+
+                raise
+            finally:
+                elapsed = time.monotonic() - started
+
+                self._stats['refreshes'] += 1
+                self._stats['refresh_time_total'] += elapsed
+                self._stats['refresh_time_max'] = max(
+                    self._stats['refresh_time_max'],
+                    elapsed
+                )
+
+            self.token['access_token'] = resp_json.get('access_token', '')
+            self.token['token_type'] = resp_json.get('token_type', '')
+            self.token['expires_in'] = resp_json.get('expires_in', '')
+            self.token['expires_at'] = (
+                time.time() + self.token.get('expires_in', 0)
+            )
+
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        if self._timer:
+            self._timer.cancel()
+
+        delay = (
+            self.token['expires_at'] -
+            cfg.CONF.expiration_token_duration -
+            time.time()
+        )
+
+        if delay > 0:
+            self._timer = eventlet.spawn_after(delay, self._refresh_safe)
+
+    def _refresh_safe(self):
+        self._timer = None
+
+        try:
+            self.refresh(force=False)
+        except Exception:
+            # Already logged, the token will be refreshed on demand.
+            pass
+
+    def stop(self):
+        if self._timer:
+            self._timer.cancel()
+
+            self._timer = None
+
+    def get_stats(self):
+        return dict(self._stats)
+
+
+def get_token_provider(realm=DEFAULT_REALM):
+    provider = _PROVIDERS.get(realm)
+
+    if provider is None:
+        provider = _PROVIDERS.setdefault(realm, TokenProvider(realm))
+
+    return provider
+
+
+def get_stats():
+    """Returns token refresh statistics by realm."""
+    return {
+        realm: provider.get_stats()
+        for realm, provider in _PROVIDERS.items()
+    }
+
+
+def cleanup():
+    for provider in _PROVIDERS.values():
+        provider.stop()
+
+    _PROVIDERS.clear()
+
+    TOKEN.update(
+        {"access_token": "", "token_type": "", "expires_in": "",
+         "expires_at": ""}
+    )
+
+
 def _request(url, method='GET', body=None):
     if cfg.CONF.pecan.auth_enable:
         return _request_with_auth(url, method=method, json=body)
@@ -105,10 +258,10 @@ def _request_with_auth(url, method, json=None, headers=None, auth_token=None,
     if not headers:
         headers = {"Content-Type": "application/json"}
 
+    provider = get_token_provider()
+
     if not auth_token:
-        if __will_expire_soon():
-            __refresh()
-        headers['Authorization'] = 'Bearer ' + TOKEN.get('access_token', '')
+        headers['Authorization'] = 'Bearer ' + provider.get()
     else:
         headers['Authorization'] = 'Bearer ' + auth_token
 
@@ -120,8 +273,8 @@ def _request_with_auth(url, method, json=None, headers=None, auth_token=None,
     resp = requests.request(method=method, url=url, **kwargs)
 
     if resp.status_code == 401:
-        __refresh()
-        headers['Authorization'] = 'Bearer ' + TOKEN.get('access_token', '')
+        provider.refresh()
+        headers['Authorization'] = 'Bearer ' + provider.get()
         kwargs['headers'] = headers
         LOG.debug("Sending secure request: method=%s, url=%s, args=%s",
                   method, url, kwargs)
@@ -129,29 +282,23 @@ def _request_with_auth(url, method, json=None, headers=None, auth_token=None,
     return resp
 
 
-def __refresh():
-    """Getting token from IDP and save it to the cache
+def _get_token(realm):
+    """Getting token from IDP
 
-    :return:
+    :return: IDP response.
     """
     auth_type = cfg.CONF.auth_type
     if auth_type == 'mitreid':
-        resp_json = _auth_using_mitreid()
+        return _auth_using_mitreid()
     elif auth_type == 'keycloak-oidc':
-        resp_json = _auth_using_keycloak()
+        return _auth_using_keycloak(realm)
     else:
         raise ValueError("Auth type {} doesn't support".format(auth_type))
 
-    TOKEN['access_token'] = resp_json.get('access_token', '')
-    TOKEN['token_type'] = resp_json.get('token_type', '')
-    TOKEN['expires_in'] = resp_json.get('expires_in', '')
-    TOKEN['expires_at'] = time.time() + TOKEN.get('expires_in', 0)
 
-
-def _auth_using_keycloak():
+def _auth_using_keycloak(realm=DEFAULT_REALM):
     idp_client = base64.b64encode((cfg.CONF.oauth2.client_id + ':' +
                                    cfg.CONF.oauth2.client_secret).encode())
-    realm = 'cloud-common'  # Default m2m tenant
     headers = {
         'Content-Type': 'application/x-www-form-urlencoded',
         'Authorization': 'Basic ' + idp_client.decode("utf-8"),
@@ -190,16 +337,3 @@ def _auth_using_mitreid():
                             headers=headers)
     resp.raise_for_status()
     return resp.json()
-
-
-def __will_expire_soon(stale_duration=None):
-    """Determine if expiration is about to occur or token is absent.
-
-    :returns: true if expiration is within the given duration
-    :rtype: boolean
-    """
-    stale_duration = (STALE_TOKEN_DURATION if stale_duration is None
-                      else stale_duration)
-    access_token = TOKEN.get('access_token')
-    return not access_token or (
-        time.time() > TOKEN.get('expires_at', 0) - stale_duration)
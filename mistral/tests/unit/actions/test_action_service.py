@@ -12,9 +12,26 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import datetime
+from unittest import mock
+
+from oslo_config import cfg
+
+from mistral.db.sqlalchemy import base as db_sa_base
+from mistral.db.v2 import api as db_api
 from mistral.services import actions
+from mistral.services import adhoc_actions as adhoc_action_service
 from mistral.tests.unit import base
 
+ACTION_TXT = """
+version: '2.0'
+
+my_action:
+  base: std.echo
+  base-input:
+    output: "%s"
+"""
+
 
 class LegacyActionProviderTest(base.DbTestCase):
     def test_get_system_action_provider(self):
@@ -46,3 +63,125 @@ class LegacyActionProviderTest(base.DbTestCase):
                 ]
             )
         )
+
+
+class CachingActionProviderTest(base.DbTestCase):
+    def setUp(self):
+        super(CachingActionProviderTest, self).setUp()
+
+        self.provider = actions.get_system_action_provider()
+
+    def _find_output(self, action_name):
+        action_desc = self.provider.find(action_name)
+
+        if action_desc is None:
+            return None
+
+        return action_desc.instantiate({}, {}).base_action.output
+
+    def test_find_cached(self):
+        adhoc_action_service.create_actions(ACTION_TXT % 'a')
+
+        self.assertEqual('a', self._find_output('my_action'))
+        self.assertIsNone(self.provider.find('unknown_action'))
+
+        stats = actions.get_stats()
+
+        self.assertLess(0, stats['size'])
+
+        with mock.patch.object(db_api, 'load_action_definition') as load:
+            self.assertEqual('a', self._find_output('my_action'))
+            self.assertIsNone(self.provider.find('unknown_action'))
+
+        load.assert_not_called()
+
+        new_stats = actions.get_stats()
+
+        self.assertEqual(stats['misses'], new_stats['misses'])
+        self.assertLess(stats.get('hits', 0), new_stats['hits'])
+        self.assertLess(stats['hit_rate'], new_stats['hit_rate'])
+
+    def test_find_builtin_action_cached(self):
+        self.assertIsNotNone(self.provider.find('std.echo'))
+
+        # Providers of ad-hoc and dynamic actions are asked first and
+        # remember that they don't have the action.
+        with mock.patch.object(db_api, 'load_action_definition') as load:
+            self.assertIsNotNone(self.provider.find('std.echo'))
+
+        load.assert_not_called()
+
+    def test_find_after_update(self):
+        self.assertIsNone(self.provider.find('my_action'))
+
+        adhoc_action_service.create_actions(ACTION_TXT % 'a')
+
+        self.assertEqual('a', self._find_output('my_action'))
+
+        adhoc_action_service.update_actions(ACTION_TXT % 'bb')
+
+        self.assertEqual('bb', self._find_output('my_action'))
+
+        db_api.delete_action_definition('my_action')
+
+        self.assertIsNone(self.provider.find('my_action'))
+
+    @mock.patch('mistral_lib.utils.utc_now_sec')
+    def test_find_after_updates_within_second(self, now_mock):
+        now_mock.return_value = datetime.datetime(2026, 1, 1)
+
+        adhoc_action_service.create_actions(ACTION_TXT % 'a')
+
+        self.assertEqual('a', self._find_output('my_action'))
+
+        # The definitions have the same length.
+        for output in ('b', 'a'):
+            adhoc_action_service.update_actions(ACTION_TXT % output)
+
+            self.assertEqual(output, self._find_output('my_action'))
+
+    def test_find_with_state_check_interval(self):
+        self.override_config(
+            'state_check_interval',
+            60,
+            'action_lookup_cache'
+        )
+
+        self.assertIsNone(self.provider.find('my_action'))
+
+        adhoc_action_service.create_actions(ACTION_TXT % 'a')
+
+        self.assertIsNone(self.provider.find('my_action'))
+
+        actions.clear_caches()
+
+        self.assertEqual('a', self._find_output('my_action'))
+
+    def test_find_cached_without_queries(self):
+        # Use the default intervals of state checks.
+        cfg.CONF.clear_override('state_check_interval', 'action_lookup_cache')
+        cfg.CONF.clear_override(
+            'version_check_interval',
+            'dynamic_action_provider'
+        )
+
+        self.override_config('enabled', True, 'query_instrumentation')
+
+        self.assertIsNotNone(self.provider.find('std.echo'))
+
+        with db_sa_base.query_stats('find') as stats:
+            self.assertIsNotNone(self.provider.find('std.echo'))
+
+        self.assertEqual(0, stats.queries)
+
+    def test_find_cache_disabled(self):
+        self.override_config('enabled', False, 'action_lookup_cache')
+
+        actions.clear_caches()
+
+        adhoc_action_service.create_actions(ACTION_TXT % 'a')
+
+        self.assertEqual('a', self._find_output('my_action'))
+        self.assertEqual('a', self._find_output('my_action'))
+
+        self.assertEqual({}, actions.get_stats())
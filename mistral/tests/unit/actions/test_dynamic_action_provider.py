@@ -12,6 +12,9 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import datetime
+from unittest import mock
+
 from mistral.actions import dynamic_action
 from mistral.db.v2 import api as db_api
 from mistral.tests.unit import base
@@ -35,6 +38,12 @@ NAMESPACE = "ns"
 
 
 class DynamicActionProviderTest(base.DbTestCase):
+    def setUp(self):
+        super(DynamicActionProviderTest, self).setUp()
+
+        self.addCleanup(db_api.delete_code_sources)
+        self.addCleanup(db_api.delete_dynamic_action_definitions)
+
     def _create_code_source(self, namespace=''):
         return db_api.create_code_source(
             {
@@ -129,3 +138,107 @@ class DynamicActionProviderTest(base.DbTestCase):
         self.assertEqual(0, len(action_descs))
 
         self._delete_code_source()
+
+    def test_find_uses_cache(self):
+        provider = dynamic_action.DynamicActionProvider()
+
+        code_source = self._create_code_source()
+
+        self._create_dynamic_actions(code_source)
+
+        self.assertIsNotNone(provider.find('dummy_action'))
+        self.assertIsNone(provider.find('unknown_action'))
+
+        with mock.patch.object(
+                db_api,
+                'load_dynamic_action_definition') as load_mock:
+            with mock.patch.object(db_api, 'get_code_source') as get_mock:
+                action_desc = provider.find('dummy_action')
+
+                self.assertIsNone(provider.find('unknown_action'))
+
+        self.assertEqual('DummyAction', action_desc.cls_name)
+
+        load_mock.assert_not_called()
+        get_mock.assert_not_called()
+
+    def test_find_after_code_source_update(self):
+        provider = dynamic_action.DynamicActionProvider()
+
+        code_source = self._create_code_source()
+
+        self._create_dynamic_actions(code_source)
+
+        action_desc = provider.find('dummy_action')
+
+        self.assertIsNone(action_desc.instantiate({}, {}).run(None))
+
+        db_api.update_code_source(
+            'code_source',
+            {'content': DUMMY_CODE_SOURCE.replace('None', '"updated"')}
+        )
+
+        action_desc = provider.find('dummy_action')
+
+        self.assertEqual('updated', action_desc.instantiate({}, {}).run(None))
+
+    @mock.patch('mistral_lib.utils.utc_now_sec')
+    def test_find_after_updates_within_second(self, now_mock):
+        now_mock.return_value = datetime.datetime(2026, 1, 1)
+
+        provider = dynamic_action.DynamicActionProvider()
+
+        code_source = self._create_code_source()
+
+        self._create_dynamic_actions(code_source)
+
+        for cls_name in ('DummyAction2', 'DummyAction'):
+            db_api.update_dynamic_action_definition(
+                'dummy_action',
+                {'class_name': cls_name}
+            )
+
+            self.assertEqual(cls_name, provider.find('dummy_action').cls_name)
+
+    def test_find_with_version_check_interval(self):
+        self.override_config(
+            'version_check_interval',
+            60,
+            'dynamic_action_provider'
+        )
+
+        provider = dynamic_action.DynamicActionProvider()
+
+        self.assertIsNone(provider.find('dummy_action'))
+
+        code_source = self._create_code_source()
+
+        self._create_dynamic_actions(code_source)
+
+        # The missing action is still cached.
+        self.assertIsNone(provider.find('dummy_action'))
+
+        dynamic_action.clear_caches()
+
+        self.assertIsNotNone(provider.find('dummy_action'))
+
+    def test_deserialize_uses_cached_module(self):
+        provider = dynamic_action.DynamicActionProvider()
+
+        code_source = self._create_code_source()
+
+        self._create_dynamic_actions(code_source)
+
+        action = provider.find('dummy_action').instantiate({}, {})
+
+        serializer = dynamic_action.DynamicActionSerializer()
+
+        with mock.patch.object(db_api, 'get_code_source') as get_mock:
+            for _ in range(3):
+                result = serializer.deserialize_from_dict(
+                    serializer.serialize_to_dict(action)
+                )
+
+        get_mock.assert_not_called()
+
+        self.assertIs(type(action.action), type(result.action))
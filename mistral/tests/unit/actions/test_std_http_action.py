@@ -19,7 +19,9 @@ from unittest import mock
 import requests
 
 from mistral.actions import std_actions as std
+from mistral import exceptions as exc
 from mistral.tests.unit import base
+from mistral.utils import http_utils
 from mistral_lib import actions as mistral_lib_actions
 
 
@@ -100,7 +102,8 @@ class HTTPActionTest(base.BaseTest):
             auth=None,
             allow_redirects=True,
             proxies=None,
-            verify=None
+            verify=None,
+            stream=False
         )
 
     @mock.patch.object(requests, 'request')
@@ -315,3 +318,84 @@ class HTTPActionTest(base.BaseTest):
 
         args, kwargs = mocked_method.call_args
         self.assertEqual(headers, kwargs['headers'])
+
+    @mock.patch.object(requests.Session, 'request')
+    def test_http_action_with_connection_pool(self, mocked_method):
+        self.override_config('enabled', True, 'http_connection_pool')
+
+        self.addCleanup(http_utils.cleanup)
+
+        mocked_method.return_value = get_success_fake_response()
+        mock_ctx = mock.Mock()
+        mock_ctx.execution.workflow_propagated_headers = {}
+
+        session1 = http_utils.get_session(URL + '/1')
+
+        action = std.HTTPAction(url=URL + '/2', method='GET')
+
+        result = action.run(mock_ctx)
+
+        self.assertEqual(DATA, result['content'])
+        self.assertEqual(1, mocked_method.call_count)
+
+        # Requests to the same host reuse the same session and connections.
+        self.assertIs(session1, http_utils.get_session(URL + '/3'))
+        self.assertIsNot(
+            session1,
+            http_utils.get_session('http://another_url')
+        )
+        self.assertIsNot(
+            session1,
+            http_utils.get_session(URL, proxies={'http': 'http://proxy'})
+        )
+
+    def test_http_action_connection_pool_limits(self):
+        self.override_config('max_pools', 2, 'http_connection_pool')
+
+        self.addCleanup(http_utils.cleanup)
+
+        session1 = http_utils.get_session('http://host1')
+        session2 = http_utils.get_session('http://host2')
+
+        # The least recently used session is closed.
+        http_utils.get_session('http://host3')
+
+        self.assertIs(session2, http_utils.get_session('http://host2'))
+        self.assertIsNot(session1, http_utils.get_session('http://host1'))
+
+    @mock.patch.object(requests, 'request')
+    def test_http_action_stream(self, mocked_method):
+        resp = get_success_fake_response()
+        resp.iter_content = mock.Mock(return_value=[b'{"a": ', b'1}'])
+        resp.close = mock.Mock()
+
+        mocked_method.return_value = resp
+        mock_ctx = mock.Mock()
+        mock_ctx.execution.workflow_propagated_headers = {}
+
+        action = std.HTTPAction(url=URL, method='GET', stream=True)
+
+        result = action.run(mock_ctx)
+
+        self.assertEqual(b'{"a": 1}', resp._content)
+        self.assertEqual(200, result['status'])
+        self.assertTrue(mocked_method.call_args[1]['stream'])
+        resp.close.assert_called_once_with()
+
+    @mock.patch.object(requests, 'request')
+    def test_http_action_stream_too_large(self, mocked_method):
+        self.override_config('execution_field_size_limit_kb', 1, 'engine')
+
+        resp = get_success_fake_response()
+        resp.iter_content = mock.Mock(return_value=[b'x' * 1000] * 2)
+        resp.close = mock.Mock()
+
+        mocked_method.return_value = resp
+        mock_ctx = mock.Mock()
+        mock_ctx.execution.workflow_propagated_headers = {}
+
+        action = std.HTTPAction(url=URL, method='GET', stream=True)
+
+        self.assertRaises(exc.ActionException, action.run, mock_ctx)
+
+        resp.close.assert_called_once_with()
@@ -107,7 +107,8 @@ class MistralHTTPActionTest(base.BaseTest):
             auth=None,
             allow_redirects=True,
             proxies=None,
-            verify=None
+            verify=None,
+            stream=False
         )
 
     @mock.patch.object(requests, 'request')
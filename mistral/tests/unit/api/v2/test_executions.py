@@ -16,6 +16,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import base64
 import copy
 import datetime
 import json
@@ -930,6 +931,121 @@ class TestExecutionsController(base.APITest):
 
         self.assertIn("Unknown sort direction", resp.body.decode())
 
+    def _create_executions_for_keyset_pagination(self):
+        created_at = datetime.datetime(2016, 12, 1, 15, 0, 0)
+
+        for i in range(5):
+            db_api.create_workflow_execution({
+                'workflow_name': 'wf%s' % (i % 2),
+                'spec': {},
+                'state': states.SUCCESS,
+                # Several executions have the same creation time.
+                'created_at': created_at + datetime.timedelta(seconds=i // 2)
+            })
+
+    def _get_all_pages(self, url):
+        ids = []
+
+        while url:
+            resp = self.app.get(url)
+
+            self.assertEqual(200, resp.status_int)
+            self.assertNotIn('total', resp.json)
+
+            ids.extend([ex['id'] for ex in resp.json['executions']])
+
+            url = resp.json.get('next')
+
+            if url:
+                self.assertIn('cursor=', url)
+                self.assertNotIn('marker=', url)
+
+        return ids
+
+    def test_get_all_keyset_pagination(self):
+        self._create_executions_for_keyset_pagination()
+
+        expected_ids = [
+            ex.id for ex in db_api.get_workflow_executions(
+                sort_keys=['created_at', 'id'],
+                sort_dirs=['desc', 'asc']
+            )
+        ]
+
+        self.assertEqual(
+            expected_ids,
+            self._get_all_pages(
+                '/v2/executions?limit=2&keyset=true'
+                '&sort_keys=created_at&sort_dirs=desc'
+            )
+        )
+
+        # Requesting certain fields doesn't change the order.
+        self.assertEqual(
+            expected_ids,
+            self._get_all_pages(
+                '/v2/executions?limit=2&keyset=true&fields=state'
+                '&sort_keys=created_at&sort_dirs=desc'
+            )
+        )
+
+    def test_get_all_keyset_pagination_with_filters(self):
+        self._create_executions_for_keyset_pagination()
+
+        expected_ids = [
+            ex.id for ex in db_api.get_workflow_executions(
+                workflow_name='wf0',
+                sort_keys=['created_at', 'id']
+            )
+        ]
+
+        self.assertEqual(3, len(expected_ids))
+        self.assertEqual(
+            expected_ids,
+            self._get_all_pages(
+                '/v2/executions?limit=1&keyset=true&workflow_name=wf0'
+            )
+        )
+
+    def test_get_all_keyset_pagination_without_limit(self):
+        resp = self.app.get(
+            '/v2/executions?keyset=true',
+            expect_errors=True
+        )
+
+        self.assertEqual(400, resp.status_int)
+
+        self.assertIn("Limit must be specified", resp.body.decode())
+
+    def test_get_all_keyset_pagination_invalid_cursor(self):
+        cursor = rest_utils.encode_cursor(['created_at', 'id'], [None, 'id'])
+
+        # Well-formed cursors with values of a wrong type.
+        bad_cursors = [
+            base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+            for data in (
+                {'k': ['created_at', 'id'], 'v': 5},
+                {'k': ['created_at', 'id']}
+            )
+        ]
+
+        for url, error in [
+            ('/v2/executions?limit=1&cursor=invalid', 'Invalid cursor'),
+            ('/v2/executions?limit=1&cursor=%s' % bad_cursors[0],
+             'does not match the sort keys'),
+            ('/v2/executions?limit=1&cursor=%s' % bad_cursors[1],
+             'does not match the sort keys'),
+            ('/v2/executions?limit=1&sort_keys=id&cursor=%s' % cursor,
+             'does not match the sort keys'),
+            ('/v2/executions?limit=1&marker=%s&cursor=%s' % (WF_EX.id, cursor),
+             'can not be used together')
+        ]:
+            resp = self.app.get(url, expect_errors=True)
+
+            self.assertEqual(400, resp.status_int)
+
+            self.assertIn(error, resp.body.decode())
+
     @mock.patch.object(
         db_api,
         'get_workflow_executions',
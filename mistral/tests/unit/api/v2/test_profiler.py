@@ -0,0 +1,92 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from mistral.rpc import clients as rpc_clients
+from mistral.tests.unit.api import base
+from mistral.tests.unit import base as unit_base
+
+STATS = {
+    'host': 'host1',
+    'enabled': True,
+    'sampling_rate': 0.5,
+    'started_at': '1970-01-01 00:00:00',
+    'traces': [
+        {
+            'name': 'engine-on-action-complete',
+            'count': 2,
+            'total': 0.3,
+            'avg': 0.15,
+            'max': 0.2,
+            'p50': 0.2,
+            'p95': 0.2,
+            'p99': 0.2
+        }
+    ]
+}
+
+
+class TestProfilerController(base.APITest):
+    def setUp(self):
+        super(TestProfilerController, self).setUp()
+
+        self.mock_ctx.return_value = unit_base.get_context(admin=True)
+
+    @mock.patch.object(
+        rpc_clients.EngineClient,
+        'get_profiler_stats',
+        return_value=STATS
+    )
+    def test_get(self, get_stats_mock):
+        resp = self.app.get('/v2/profiler?host=host1')
+
+        self.assertEqual(200, resp.status_int)
+        self.assertDictEqual(STATS, resp.json)
+
+        get_stats_mock.assert_called_once_with('host1')
+
+    @mock.patch.object(rpc_clients.EngineClient, 'configure_profiler')
+    def test_put(self, configure_mock):
+        resp = self.app.put_json(
+            '/v2/profiler',
+            {'sampling_rate': 0.1, 'reset': True}
+        )
+
+        self.assertEqual(202, resp.status_int)
+
+        configure_mock.assert_called_once_with(
+            enabled=None,
+            sampling_rate=0.1,
+            reset=True
+        )
+
+    @mock.patch.object(rpc_clients.EngineClient, 'configure_profiler')
+    def test_put_invalid_sampling_rate(self, configure_mock):
+        resp = self.app.put_json(
+            '/v2/profiler',
+            {'sampling_rate': 2},
+            expect_errors=True
+        )
+
+        self.assertEqual(400, resp.status_int)
+
+        configure_mock.assert_not_called()
+
+    def test_get_not_admin(self):
+        self.mock_ctx.return_value = unit_base.get_context()
+
+        resp = self.app.get('/v2/profiler', expect_errors=True)
+
+        self.assertEqual(403, resp.status_int)
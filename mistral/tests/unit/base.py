@@ -13,6 +13,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import contextlib
 import datetime
 import json
 import pkg_resources as pkg
@@ -23,6 +24,7 @@ from oslo_config import cfg
 from oslo_log import log as logging
 from oslotest import base
 
+from mistral.actions import dynamic_action
 from mistral import context as auth_context
 from mistral.db.sqlalchemy import base as db_sa_base
 from mistral.db.sqlalchemy import sqlite_lock
@@ -108,7 +110,21 @@ class BaseTest(base.BaseTestCase):
             'legacy_action_provider'
         )
 
+        # Tests change actions and use them right away.
+        self.override_config(
+            'state_check_interval',
+            0,
+            'action_lookup_cache'
+        )
+        self.override_config(
+            'version_check_interval',
+            0,
+            'dynamic_action_provider'
+        )
+
         self.addCleanup(spec_parser.clear_caches)
+        self.addCleanup(dynamic_action.clear_caches)
+        self.addCleanup(action_service.clear_caches)
 
         def _cleanup_actions():
             action_service.get_test_action_provider().cleanup()
@@ -320,3 +336,41 @@ class DbTestCase(BaseTest):
 
     def is_db_session_open(self):
         return db_sa_base._get_thread_local_session() is not None
+
+    @contextlib.contextmanager
+    def assert_query_budget(self, operation, max_queries):
+        """Asserts the number of DB statements of an operation.
+
+        Every call of the operation made within the block, in any thread,
+        must make no more than the given number of DB statements.
+
+        :param operation: Name of the operation, as passed to
+            db_utils.collect_query_stats().
+        :param max_queries: Maximum number of DB statements.
+        :return: List of the collected statistics.
+        """
+        collected = []
+
+        def _listener(stats):
+            if stats.operation == operation:
+                collected.append(stats)
+
+        db_sa_base.add_query_stats_listener(_listener)
+
+        try:
+            yield collected
+        finally:
+            db_sa_base.remove_query_stats_listener(_listener)
+
+        self.assertTrue(
+            collected,
+            'Operation %s was not performed.' % operation
+        )
+
+        for stats in collected:
+            self.assertLessEqual(
+                stats.queries,
+                max_queries,
+                'Operation %s exceeded the query budget: %s' %
+                (operation, stats.to_dict())
+            )
@@ -19,10 +19,13 @@
 import copy
 import datetime
 import time
+from unittest import mock
 
 from oslo_config import cfg
 
 from mistral import context as auth_context
+from mistral.db.sqlalchemy import base as db_base
+from mistral.db import utils as db_utils
 from mistral.db.v2.sqlalchemy import api as db_api
 from mistral.db.v2.sqlalchemy import models as db_models
 from mistral import exceptions as exc
@@ -2437,6 +2440,61 @@ class TaskExecutionTest(SQLAlchemyTest):
                 )
             )
 
+    def test_get_completed_task_executions_as_batches(self):
+        wf_ex = db_api.create_workflow_execution(WF_EXECS[0])
+
+        created_at = datetime.datetime(2016, 12, 1, 15, 0, 0)
+
+        with db_api.transaction():
+            for i in range(7):
+                values = copy.deepcopy(TASK_EXECS[0])
+                values.update({
+                    'workflow_execution_id': wf_ex.id,
+                    'name': 'task%s' % i,
+                    'state': 'SUCCESS' if i != 3 else 'RUNNING',
+                    'in_context': {'var': i},
+                    # Some task executions have the same creation time.
+                    'created_at': created_at + datetime.timedelta(
+                        seconds=i // 2
+                    )
+                })
+
+                db_api.create_task_execution(values)
+
+            batches = list(
+                db_api.get_completed_task_executions_as_batches(
+                    batch_size=2,
+                    workflow_execution_id=wf_ex.id
+                )
+            )
+
+            self.assertEqual([2, 2, 2], [len(b) for b in batches])
+
+            names = [t_ex.name for batch in batches for t_ex in batch]
+
+            self.assertEqual(
+                ['task0', 'task1', 'task2', 'task4', 'task5', 'task6'],
+                sorted(names)
+            )
+
+            batches = list(
+                db_api.get_completed_task_executions_as_batches(
+                    fields=('name', 'in_context'),
+                    batch_size=4,
+                    workflow_execution_id=wf_ex.id
+                )
+            )
+
+            self.assertEqual([4, 2], [len(b) for b in batches])
+            self.assertEqual(
+                names,
+                [row.name for batch in batches for row in batch]
+            )
+            self.assertEqual(
+                {0, 1, 2, 4, 5, 6},
+                {row.in_context['var'] for batch in batches for row in batch}
+            )
+
     def test_task_execution_repr(self):
         wf_ex = db_api.create_workflow_execution(WF_EXECS[0])
 
@@ -3558,6 +3616,42 @@ class LockTest(SQLAlchemyTest):
         # Make sure that outside 'with' section the lock record does not exist.
         self.assertEqual(0, len(db_api.get_named_locks()))
 
+    @mock.patch.object(db_api.b, 'get_dialect_name', return_value='postgresql')
+    @mock.patch.object(db_api, '_acquire_advisory_lock')
+    def test_with_named_lock_advisory(self, acquire_mock, _):
+        self.override_config('named_lock_backend', 'advisory', 'engine')
+
+        with db_api.transaction():
+            with db_api.named_lock('lock1'):
+                # Advisory locks don't create any lock records.
+                self.assertEqual(0, len(db_api.get_named_locks()))
+
+        acquire_mock.assert_called_once_with('lock1')
+
+        self.assertEqual(0, len(db_api.get_named_locks()))
+
+    @mock.patch.object(db_api, '_acquire_advisory_lock')
+    def test_with_named_lock_advisory_fallback(self, acquire_mock):
+        self.override_config('named_lock_backend', 'advisory', 'engine')
+
+        # The test database is SQLite so the table is used.
+        with db_api.transaction():
+            with db_api.named_lock('lock1'):
+                self.assertEqual(1, len(db_api.get_named_locks()))
+
+        with mock.patch.object(
+                db_api.b,
+                'get_dialect_name',
+                return_value='postgresql'):
+            # Outside of a transaction an advisory lock would be released
+            # right away so the table is used too.
+            with db_api.named_lock('lock1'):
+                self.assertEqual(1, len(db_api.get_named_locks()))
+
+        acquire_mock.assert_not_called()
+
+        self.assertEqual(0, len(db_api.get_named_locks()))
+
     def test_internal_get_direct_subworkflows(self):
         def wex(wex_id, tex_id=None):
             db_api.create_workflow_execution(
@@ -3589,3 +3683,260 @@ class LockTest(SQLAlchemyTest):
         wex('sub1sub1', 'sub1t1')
 
         assert_subworkflows(['sub1', 'sub2'])
+
+
+class ExecutionStateCountersTest(SQLAlchemyTest):
+    def setUp(self):
+        super(ExecutionStateCountersTest, self).setUp()
+
+        self.override_config('execution_state_counters', True, 'engine')
+
+        db_api.track_execution_state_changes()
+
+        self.addCleanup(self._delete_counters)
+        self.addCleanup(db_api._pop_state_deltas)
+        self.addCleanup(db_api.untrack_execution_state_changes)
+
+    @staticmethod
+    def _delete_counters():
+        with db_api.transaction():
+            db_api._delete_all(db_models.ExecutionStateCounter)
+
+    @staticmethod
+    def _get_counts():
+        return dict(db_api.get_workflow_execution_count_by_state())
+
+    def test_engine_changes_counted(self):
+        with db_api.transaction():
+            wf_ex1 = db_api.create_workflow_execution(
+                {'name': 'wf1', 'state': 'RUNNING'}
+            )
+            wf_ex2 = db_api.create_workflow_execution(
+                {'name': 'wf2', 'state': 'RUNNING'}
+            )
+
+        self.assertEqual(1, db_api.flush_execution_state_deltas())
+        self.assertEqual({'RUNNING': 2}, self._get_counts())
+
+        with db_api.transaction():
+            db_api.update_workflow_execution(wf_ex1.id, {'state': 'SUCCESS'})
+            db_api.update_workflow_execution(wf_ex2.id, {'state': 'ERROR'})
+
+        self.assertEqual(3, db_api.flush_execution_state_deltas())
+        self.assertEqual(
+            {'RUNNING': 0, 'SUCCESS': 1, 'ERROR': 1},
+            self._get_counts()
+        )
+
+        # Nothing to flush anymore.
+        self.assertEqual(0, db_api.flush_execution_state_deltas())
+
+    def test_rolled_back_changes_not_counted(self):
+        try:
+            with db_api.transaction():
+                db_api.create_workflow_execution(
+                    {'name': 'wf', 'state': 'RUNNING'}
+                )
+
+                raise ValueError('Rollback')
+        except ValueError:
+            pass
+
+        self.assertEqual(0, db_api.flush_execution_state_deltas())
+
+    def test_reconcile(self):
+        with db_api.transaction():
+            db_api.create_workflow_execution(
+                {'name': 'wf1', 'state': 'RUNNING'}
+            )
+            db_api.create_workflow_execution(
+                {'name': 'wf2', 'state': 'ERROR'}
+            )
+
+        # Deletions are only taken into account by reconciliation.
+        with db_api.transaction():
+            db_api.delete_workflow_executions(state='ERROR')
+
+        db_api.flush_execution_state_deltas()
+
+        self.assertEqual({'RUNNING': 1, 'ERROR': 1}, self._get_counts())
+
+        with db_api.transaction():
+            self.assertEqual(1, db_api.reconcile_execution_state_counters())
+
+        self.assertEqual({'RUNNING': 1}, self._get_counts())
+
+    def test_state_updates_counted(self):
+        with db_api.transaction():
+            wf_ex = db_api.create_workflow_execution(
+                {'name': 'wf', 'state': 'RUNNING'}
+            )
+            task_ex = db_api.create_task_execution(
+                {
+                    'name': 'task',
+                    'state': 'RUNNING',
+                    'workflow_execution_id': wf_ex.id
+                }
+            )
+
+        with db_api.transaction():
+            db_api.update_task_execution_state(
+                id=task_ex.id,
+                cur_state='RUNNING',
+                state='SUCCESS'
+            )
+            db_api.update_workflow_execution_state(
+                id=wf_ex.id,
+                cur_state='RUNNING',
+                state='SUCCESS'
+            )
+
+            # The state doesn't match so nothing is changed.
+            db_api.update_workflow_execution_state(
+                id=wf_ex.id,
+                cur_state='RUNNING',
+                state='ERROR'
+            )
+
+        db_api.flush_execution_state_deltas()
+
+        self.assertEqual({'SUCCESS': 1}, self._get_counts())
+        self.assertEqual(
+            {'SUCCESS': 1},
+            dict(db_api.get_task_execution_count_by_state())
+        )
+
+    def test_changes_before_reconcile_not_counted_twice(self):
+        with db_api.transaction():
+            wf_ex = db_api.create_workflow_execution(
+                {'name': 'wf1', 'state': 'RUNNING'}
+            )
+
+        # The change is committed but not flushed yet.
+        with db_api.transaction():
+            db_api.reconcile_execution_state_counters()
+
+        self.assertEqual({'RUNNING': 1}, self._get_counts())
+
+        with db_api.transaction():
+            db_api.update_workflow_execution_state(
+                id=wf_ex.id,
+                cur_state='RUNNING',
+                state='SUCCESS'
+            )
+
+        self.assertEqual(2, db_api.flush_execution_state_deltas())
+        self.assertEqual({'RUNNING': 0, 'SUCCESS': 1}, self._get_counts())
+
+
+class QueryStatsTest(SQLAlchemyTest):
+    def setUp(self):
+        super(QueryStatsTest, self).setUp()
+
+        self.override_config('enabled', True, 'query_instrumentation')
+
+    def _create_wf_exs(self, count):
+        with db_api.transaction():
+            return [
+                db_api.create_workflow_execution(
+                    {'name': 'wf%s' % i, 'state': 'RUNNING'}
+                ).id
+                for i in range(count)
+            ]
+
+    def test_query_stats(self):
+        wf_ex_ids = self._create_wf_exs(3)
+
+        with db_base.query_stats('outer') as stats:
+            with db_base.query_stats('inner') as inner_stats:
+                with db_api.transaction():
+                    for wf_ex_id in wf_ex_ids:
+                        db_api.get_workflow_execution(wf_ex_id)
+
+            with db_api.transaction():
+                db_api.get_workflow_executions()
+
+        # Only the outermost operation is taken into account.
+        self.assertIsNone(inner_stats)
+
+        self.assertEqual('outer', stats.operation)
+        self.assertEqual(2, stats.transactions)
+        self.assertEqual(3, stats.get_most_repeated()[1])
+        self.assertGreater(stats.time, 0)
+
+        # The driver may also make statements like BEGIN or a connection
+        # check that are counted too.
+        self.assertGreaterEqual(stats.queries, 4)
+
+        queries = stats.queries
+
+        # Statements outside of operations are not counted.
+        with db_api.transaction():
+            db_api.get_workflow_executions()
+
+        self.assertEqual(queries, stats.queries)
+
+    def test_query_stats_disabled(self):
+        self.override_config('enabled', False, 'query_instrumentation')
+
+        with db_base.query_stats('operation') as stats:
+            with db_api.transaction():
+                db_api.get_workflow_executions()
+
+        self.assertIsNone(stats)
+
+    @mock.patch.object(db_base, 'LOG')
+    def test_repeated_queries_logged(self, log):
+        self.override_config(
+            'max_repeated_queries',
+            2,
+            'query_instrumentation'
+        )
+
+        wf_ex_ids = self._create_wf_exs(3)
+
+        with db_api.transaction():
+            with db_base.query_stats('operation'):
+                db_api.get_workflow_execution(wf_ex_ids[0])
+                db_api.get_workflow_execution(wf_ex_ids[1])
+
+        log.warning.assert_not_called()
+
+        with db_api.transaction():
+            with db_base.query_stats('operation'):
+                for wf_ex_id in wf_ex_ids:
+                    db_api.get_workflow_execution(wf_ex_id)
+
+        log.warning.assert_called_once()
+
+        self.assertEqual(
+            ['max_repeated_queries'],
+            log.warning.call_args[0][1]
+        )
+
+    def test_assert_query_budget(self):
+        wf_ex_ids = self._create_wf_exs(3)
+
+        @db_utils.collect_query_stats('load')
+        def _load(ids):
+            with db_api.transaction():
+                for wf_ex_id in ids:
+                    db_api.get_workflow_execution(wf_ex_id)
+
+        with self.assert_query_budget('load', 10) as collected:
+            _load(wf_ex_ids)
+
+        self.assertEqual(1, len(collected))
+
+        self.assertRaises(
+            AssertionError,
+            self._assert_query_budget,
+            'load',
+            2,
+            _load,
+            wf_ex_ids
+        )
+
+    def _assert_query_budget(self, operation, max_queries, func, *args):
+        with self.assert_query_budget(operation, max_queries):
+            func(*args)
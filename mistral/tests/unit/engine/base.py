@@ -24,6 +24,7 @@ from oslo_service import service
 
 from mistral.db.v2 import api as db_api
 from mistral.engine import engine_server
+from mistral.engine import post_tx_queue
 from mistral.executors import base as exe
 from mistral.executors import executor_server
 from mistral.notifiers import notification_server as notif_server
@@ -70,6 +71,7 @@ class EngineTestCase(base.DbTestCase):
         rpc_base.cleanup()
         rpc_clients.cleanup()
         exe.cleanup()
+        post_tx_queue.cleanup()
 
         self.threads = []
 
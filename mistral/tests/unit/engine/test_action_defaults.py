@@ -128,6 +128,7 @@ class ActionDefaultTest(base.EngineTestCase):
             allow_redirects=None,
             proxies=None,
             verify=None,
+            stream=False,
             auth=EXPECTED_ENV_AUTH,
             timeout=ENV['__actions']['std.http']['timeout']
         )
@@ -154,7 +155,7 @@ class ActionDefaultTest(base.EngineTestCase):
         requests.request.assert_called_with(
             'GET', 'https://api.library.org/books',
             params=None, data=None, json=None, headers=None, cookies=None,
-            allow_redirects=None, proxies=None, verify=None,
+            allow_redirects=None, proxies=None, verify=None, stream=False,
             auth=EXPECTED_ENV_AUTH,
             timeout=60
         )
@@ -193,6 +194,7 @@ class ActionDefaultTest(base.EngineTestCase):
                                json=None, headers=None, cookies=None,
                                allow_redirects=None, proxies=None,
                                auth=EXPECTED_ENV_AUTH, verify=None,
+                               stream=False,
                                timeout=ENV['__actions']['std.http']['timeout'])
                      for url in wf_input['links']]
 
@@ -232,6 +234,7 @@ class ActionDefaultTest(base.EngineTestCase):
                            json=None, headers=None, cookies=None,
                            allow_redirects=None, proxies=None,
                            auth=EXPECTED_ENV_AUTH, verify=None,
+                           stream=False,
                            timeout=60)
                  for url in wf_input['links']]
 
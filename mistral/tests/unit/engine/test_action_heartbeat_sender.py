@@ -16,6 +16,7 @@ from oslo_config import cfg
 
 from mistral.db.v2 import api as db_api
 from mistral.rpc import clients as rpc_clients
+from mistral.services import action_heartbeat_sender
 from mistral.services import workflows as wf_service
 from mistral.tests.unit.engine import base
 from mistral.workflow import states
@@ -146,3 +147,25 @@ class ActionHeartbeatSenderRemoteExecutorTest(ActionHeartbeatSenderBaseTest):
 
     def test_long_action_failure_with_disabled_sender(self):
         self._do_long_action_failure_test_with_disabled_sender()
+
+
+class ActionHeartbeatSenderBatchTest(ActionHeartbeatSenderBaseTest):
+    @mock.patch.object(rpc_clients.EngineClient, 'process_action_heartbeats')
+    def test_first_heartbeat_sent_in_batch(self, process_heartbeats):
+        action_heartbeat_sender.add_action('action_ex_1')
+        action_heartbeat_sender.add_action('action_ex_2')
+
+        self.addCleanup(action_heartbeat_sender.remove_action, 'action_ex_1')
+        self.addCleanup(action_heartbeat_sender.remove_action, 'action_ex_2')
+
+        # No engine call is made when an action starts.
+        self.assertEqual(0, process_heartbeats.call_count)
+
+        action_heartbeat_sender.send_action_heartbeats()
+
+        process_heartbeats.assert_called_once_with(mock.ANY)
+
+        self.assertEqual(
+            {'action_ex_1', 'action_ex_2'},
+            set(process_heartbeats.call_args[0][0])
+        )
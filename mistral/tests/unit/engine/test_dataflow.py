@@ -1217,6 +1217,61 @@ class DataFlowEngineTest(engine_test_base.EngineTestCase):
             published_global
         )
 
+    def test_global_publishing_with_lock(self):
+        self.override_config('lock_global_publish', True, 'engine')
+
+        db_api.clear_lock_stats()
+
+        self.addCleanup(db_api.clear_lock_stats)
+
+        wf_text = """---
+        version: '2.0'
+
+        wf:
+          tasks:
+            task1:
+              action: std.noop
+              on-success:
+                publish:
+                  global:
+                    var1: 1
+
+            task2:
+              action: std.noop
+              on-success:
+                publish:
+                  global:
+                    var2: 2
+
+            task3:
+              action: std.noop
+              on-success:
+                publish:
+                  branch:
+                    var3: 3
+        """
+
+        wf_service.create_workflows(wf_text)
+
+        wf_ex = self.engine.start_workflow('wf')
+
+        self.await_workflow_success(wf_ex.id)
+
+        with db_api.transaction():
+            wf_ex = db_api.get_workflow_execution(wf_ex.id)
+
+            published_global = (
+                data_flow.get_workflow_execution_published_global(wf_ex)
+            )
+
+        self.assertDictEqual({'var1': 1, 'var2': 2}, published_global)
+
+        # Only the tasks publishing global variables take the lock.
+        self.assertEqual(
+            2,
+            db_api.get_lock_stats()['workflow_context']['count']
+        )
+
     def test_linear_data_with_input_expressions(self):
         wf_text = """---
         version: '2.0'
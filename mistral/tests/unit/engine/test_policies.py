@@ -717,6 +717,11 @@ class PoliciesTest(base.EngineTestCase):
             3,
             task_ex.runtime_context["retry_task_policy"]["retry_no"]
         )
+        self.assertEqual(3, task_ex.retry_count)
+        self.assertEqual(
+            {(wf_ex.id, task_ex.name): 3},
+            db_api.get_task_retries()
+        )
 
     @mock.patch.object(
         requests,
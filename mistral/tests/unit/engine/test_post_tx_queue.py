@@ -0,0 +1,162 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from eventlet import semaphore
+from osprofiler import profiler
+
+from mistral.engine import post_tx_queue
+from mistral.tests.unit import base
+
+
+class PostTxQueueTest(base.BaseTest):
+    def setUp(self):
+        super(PostTxQueueTest, self).setUp()
+
+        post_tx_queue.cleanup()
+
+        self.addCleanup(post_tx_queue.cleanup)
+
+        self.calls = []
+
+        # Blocks the only worker thread so that submitted work items
+        # stay in the queue.
+        self.blocker = semaphore.Semaphore(0)
+
+    def _block(self):
+        self.blocker.acquire()
+
+    def _call(self, name):
+        self.calls.append(name)
+
+    def _schedule(self, *ops):
+        @post_tx_queue.run
+        def _transaction():
+            for args, kw in ops:
+                post_tx_queue.register_operation(*args, **kw)
+
+        _transaction()
+
+    def test_operations_run_in_pool(self):
+        self.override_config('post_tx_queue_pool_size', 2, 'engine')
+
+        self._schedule(((self._call, ['op1']), {}))
+        self._schedule(((self._call, ['op2']), {}))
+
+        self._await(lambda: len(self.calls) == 2, delay=0.1)
+
+        self.assertListEqual(['op1', 'op2'], self.calls)
+
+        stats = post_tx_queue.get_stats()
+
+        self.assertEqual(2, stats['pool_size'])
+        self.assertEqual(2, stats['processed'])
+        self.assertEqual(0, stats['queue_depth'])
+
+    def test_pending_work_items_coalesced(self):
+        self.override_config('post_tx_queue_pool_size', 1, 'engine')
+
+        self._schedule(((self._block,), {}))
+
+        # Let the worker take the blocking work item.
+        self._sleep(0)
+
+        for i in range(3):
+            self._schedule(
+                ((self._call, ['start_task%s' % i]), {'group': 'wf1'}),
+                ((self._call, ['check']), {'key': 'check', 'group': 'wf1'})
+            )
+
+        stats = post_tx_queue.get_stats()
+
+        self.assertEqual(1, stats['queue_depth'])
+        self.assertEqual(2, stats['coalesced'])
+        self.assertEqual(2, stats['deduplicated'])
+
+        self.blocker.release()
+
+        self._await(lambda: len(self.calls) == 4, delay=0.1)
+
+        self.assertListEqual(
+            ['start_task0', 'check', 'start_task1', 'start_task2'],
+            self.calls
+        )
+
+    def test_overflow_inline(self):
+        self.override_config('post_tx_queue_pool_size', 1, 'engine')
+        self.override_config('post_tx_queue_max_size', 1, 'engine')
+        self.override_config('post_tx_queue_overflow_policy', 'inline',
+                             'engine')
+
+        self._schedule(((self._block,), {}))
+
+        # Let the worker take the blocking work item.
+        self._sleep(0)
+
+        self._schedule(((self._call, ['queued']), {}))
+
+        # The queue is full so the operation has to run right away.
+        self._schedule(((self._call, ['inline']), {}))
+
+        self.assertListEqual(['inline'], self.calls)
+        self.assertEqual(1, post_tx_queue.get_stats()['overflowed'])
+
+        self.blocker.release()
+
+        self._await(lambda: len(self.calls) == 2, delay=0.1)
+
+    def test_overflow_inline_keeps_profiler(self):
+        self.override_config('enabled', True, 'profiler')
+        self.override_config('hmac_keys', 'foobar', 'profiler')
+        self.override_config('post_tx_queue_pool_size', 1, 'engine')
+        self.override_config('post_tx_queue_max_size', 1, 'engine')
+        self.override_config('post_tx_queue_overflow_policy', 'inline',
+                             'engine')
+
+        self.addCleanup(profiler.clean)
+
+        def _get_profiler():
+            self.calls.append(profiler.get())
+
+        self._schedule(((self._block,), {}))
+
+        self._sleep(0)
+
+        self._schedule(((self._call, ['queued']), {}))
+
+        # No profiler is left in the thread after running inline.
+        self._schedule(((_get_profiler,), {}))
+
+        self.assertIsNotNone(self.calls[0])
+        self.assertIsNone(profiler.get())
+
+        # The profiler of the thread is used as it is.
+        prof = profiler.init('foobar')
+
+        self._schedule(((_get_profiler,), {}))
+
+        self.assertIs(prof, self.calls[1])
+        self.assertIs(prof, profiler.get())
+
+        self.blocker.release()
+
+        self._await(lambda: len(self.calls) == 3, delay=0.1)
+
+    def test_pool_disabled(self):
+        self.override_config('post_tx_queue_pool_size', 0, 'engine')
+
+        self._schedule(((self._call, ['op']), {}))
+
+        self._await(lambda: len(self.calls) == 1, delay=0.1)
+
+        self.assertDictEqual({}, post_tx_queue.get_stats())
@@ -20,6 +20,7 @@ import osprofiler
 from mistral import context
 from mistral.services import workflows as wf_service
 from mistral.tests.unit.engine import base
+from mistral.utils import profiler as profiler_utils
 from mistral.workflow import states
 
 
@@ -85,3 +86,53 @@ class EngineProfilerTest(base.EngineTestCase):
         self.await_workflow_success(wf_ex['id'])
 
         self.assertEqual(self.mock_profiler_log_func.call_count, 0)
+
+    def test_aggregated_profile_trace(self):
+        self.override_config('aggregate', True, 'profiler')
+
+        profiler_utils.setup('mistral-engine', 'localhost')
+
+        self.addCleanup(profiler_utils.cleanup)
+
+        wf_def = """
+        version: '2.0'
+        wf:
+          type: direct
+          tasks:
+            task1:
+              action: std.echo output="Peace!"
+        """
+
+        wf_service.create_workflows(wf_def)
+
+        wf_ex = self.engine_client.start_workflow('wf')
+
+        self.await_workflow_success(wf_ex['id'])
+
+        self.assertEqual(0, self.mock_profiler_log_func.call_count)
+
+        stats = self.engine_client.get_profiler_stats()
+
+        self.assertTrue(stats['enabled'])
+        self.assertEqual(1.0, stats['sampling_rate'])
+
+        traces = {t['name']: t for t in stats['traces']}
+
+        self.assertIn('engine-on-action-complete', traces)
+
+        trace = traces['engine-on-action-complete']
+
+        self.assertEqual(1, trace['count'])
+        self.assertLessEqual(trace['p50'], trace['max'])
+
+        # Stop aggregating and drop the statistics.
+        profiler_utils.configure(enabled=False, reset=True)
+
+        wf_ex = self.engine_client.start_workflow('wf')
+
+        self.await_workflow_success(wf_ex['id'])
+
+        stats = self.engine_client.get_profiler_stats()
+
+        self.assertFalse(stats['enabled'])
+        self.assertEqual([], stats['traces'])
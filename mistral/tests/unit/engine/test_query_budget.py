@@ -0,0 +1,93 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from oslo_config import cfg
+
+from mistral.api.controllers.v2 import execution_report
+from mistral.services import workflows as wf_service
+from mistral.tests.unit.engine import base
+
+
+# Use the set_default method to set value otherwise in certain test cases
+# the change in value is not permanent.
+cfg.CONF.set_default('auth_enable', False, group='pecan')
+
+
+def _get_linear_wf(size):
+    tasks = '\n'.join(
+        """
+            task%d:
+              action: std.echo output=%d
+              on-success: task%d
+        """ % (i, i, i + 1)
+        for i in range(size - 1)
+    )
+
+    return """
+        version: '2.0'
+
+        wf:
+          tasks:
+            %s
+            task%d:
+              action: std.echo output=%d
+        """ % (tasks.strip(), size - 1, size - 1)
+
+
+def _get_with_items_wf(size):
+    return """
+        version: '2.0'
+
+        wf:
+          tasks:
+            task1:
+              with-items: i in <%% range(0, %d) %%>
+              action: std.echo output=<%% $.i %%>
+        """ % size
+
+
+class QueryBudgetTest(base.EngineTestCase):
+    """Checks that the number of DB statements doesn't grow unnoticed.
+
+    The budgets are set with a margin. If a change exceeds them, make sure
+    it doesn't load objects one by one before increasing the budget.
+    """
+
+    def _run_wf(self, wf_text):
+        wf_service.create_workflows(wf_text)
+
+        wf_ex = self.engine.start_workflow('wf')
+
+        self.await_workflow_success(wf_ex.id)
+
+        return wf_ex
+
+    def test_linear_workflow(self):
+        with self.assert_query_budget('start_workflow', 40):
+            with self.assert_query_budget('on_action_complete', 30):
+                self._run_wf(_get_linear_wf(5))
+
+    def test_with_items(self):
+        # The number of statements must not depend on the number of items.
+        with self.assert_query_budget('on_action_complete', 20):
+            self._run_wf(_get_with_items_wf(20))
+
+    def test_execution_report(self):
+        wf_ex = self._run_wf(_get_linear_wf(10))
+
+        # The report is built task by task so its budget is per task.
+        with self.assert_query_budget('execution_report', 10 + 10 * 6):
+            execution_report.build_report(wf_ex.id, {'errors_only': False,
+                                                     'max_depth': -1,
+                                                     'statistics_only': False})
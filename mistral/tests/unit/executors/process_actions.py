@@ -0,0 +1,27 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# Actions run by worker processes in tests. The module must not import
+# test utilities because it's imported by the worker processes.
+
+import os
+
+from mistral_lib import actions as ml_actions
+
+
+class PidAction(ml_actions.Action):
+    run_in_process = True
+
+    def run(self, context):
+        return os.getpid()
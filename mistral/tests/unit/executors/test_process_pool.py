@@ -0,0 +1,120 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+from unittest import mock
+
+import eventlet
+
+from mistral.actions import std_actions
+from mistral.executors import default_executor
+from mistral.executors import process_pool
+from mistral.tests.unit import base
+from mistral.tests.unit.executors import process_actions
+
+
+class ProcessPoolTest(base.BaseTest):
+    def setUp(self):
+        super(ProcessPoolTest, self).setUp()
+
+        self.override_config('process_pool_size', 1, 'executor')
+        self.override_config(
+            'process_pool_actions',
+            ['mistral.actions.std_actions.SleepAction'],
+            'executor'
+        )
+
+        process_pool.cleanup()
+
+        self.addCleanup(process_pool.cleanup)
+
+        self.executor = default_executor.DefaultExecutor()
+
+    def _run_action(self, action, action_ex_id=None, timeout=None):
+        return self.executor.run_action(
+            action,
+            action_ex_id,
+            False,
+            {},
+            timeout=timeout
+        )
+
+    def test_is_enabled_for(self):
+        self.assertTrue(
+            process_pool.is_enabled_for(process_actions.PidAction())
+        )
+        self.assertTrue(
+            process_pool.is_enabled_for(std_actions.SleepAction(1))
+        )
+        self.assertFalse(
+            process_pool.is_enabled_for(std_actions.EchoAction('a'))
+        )
+
+        self.override_config('process_pool_size', 0, 'executor')
+
+        self.assertFalse(
+            process_pool.is_enabled_for(process_actions.PidAction())
+        )
+
+    def test_run_action(self):
+        result = self._run_action(process_actions.PidAction())
+
+        self.assertFalse(result.is_error(), result.error)
+        self.assertNotEqual(os.getpid(), result.data)
+
+        # The same worker process is reused.
+        self.assertEqual(
+            result.data,
+            self._run_action(process_actions.PidAction()).data
+        )
+
+    def test_action_timeout_kills_worker(self):
+        pid = self._run_action(process_actions.PidAction()).data
+
+        result = self._run_action(std_actions.SleepAction(10), timeout=0.5)
+
+        self.assertTrue(result.is_error())
+        self.assertIn('Action timed out', result.error)
+
+        self.assertNotEqual(
+            pid,
+            self._run_action(process_actions.PidAction()).data
+        )
+
+    def test_interrupt_action(self):
+        self.executor._engine_client = mock.Mock()
+
+        thread = eventlet.spawn(
+            self.executor._do_run_action,
+            std_actions.SleepAction(10),
+            'action_ex_id',
+            {},
+            False,
+            False,
+            None,
+            None
+        )
+
+        self._await(
+            lambda: 'action_ex_id' in process_pool.get_pool()._running
+        )
+
+        self.executor.interrupt_action('action_ex_id')
+
+        thread.wait()
+
+        on_action_complete = self.executor._engine_client.on_action_complete
+        result = on_action_complete.call_args[0][1]
+
+        self.assertIn('The action was interrupted', result.error)
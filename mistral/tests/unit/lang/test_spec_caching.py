@@ -12,6 +12,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from unittest import mock
+
 from mistral.db.v2 import api as db_api
 from mistral.lang import parser as spec_parser
 from mistral.services import workbooks as wb_service
@@ -238,6 +240,111 @@ class SpecificationCachingTest(base.DbTestCase):
 
         self.assertEqual(2, len(wf_spec_by_exec_id.get_tasks()))
 
+    def _create_executions(self, wf_text, count):
+        wf_def = wf_service.create_workflows(wf_text)[0]
+
+        with db_api.transaction():
+            return [
+                db_api.create_workflow_execution({
+                    'name': 'wf',
+                    'workflow_id': wf_def.id,
+                    'spec': wf_def.spec,
+                    'state': states.RUNNING
+                }).id
+                for _ in range(count)
+            ]
+
+    def test_executions_share_spec(self):
+        wf_text = """
+        version: '2.0'
+
+        wf:
+          tasks:
+            task1:
+              action: std.echo output="Echo"
+        """
+
+        wf_ex_ids = self._create_executions(wf_text, 3)
+
+        specs = [
+            spec_parser.get_workflow_spec_by_execution_id(wf_ex_id)
+            for wf_ex_id in wf_ex_ids
+        ]
+
+        self.assertIs(specs[0], specs[1])
+        self.assertIs(specs[0], specs[2])
+
+        self.assertIs(
+            specs[0],
+            spec_parser.get_workflow_spec_by_execution_id(wf_ex_ids[0])
+        )
+
+        stats = spec_parser.get_stats()
+
+        self.assertEqual(1, stats['parsed'])
+        self.assertEqual(1, stats['specifications'])
+        self.assertEqual(3, stats['executions'])
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(3, stats['misses'])
+        self.assertEqual(0.25, stats['hit_rate'])
+        self.assertLess(0, stats['memory'])
+
+    def test_spec_cache_bounded_by_memory(self):
+        self.override_config('spec_cache_max_memory', 1, 'engine')
+
+        spec_parser.clear_caches()
+
+        wf_text = """
+        version: '2.0'
+
+        wf%s:
+          tasks:
+            task1:
+              action: std.echo output="%s"
+        """
+
+        wf_ex_ids = [
+            self._create_executions(wf_text % (i, 'x' * 300000), 1)[0]
+            for i in range(5)
+        ]
+
+        for wf_ex_id in wf_ex_ids:
+            spec_parser.get_workflow_spec_by_execution_id(wf_ex_id)
+
+        stats = spec_parser.get_stats()
+
+        self.assertEqual(5, stats['executions'])
+        self.assertGreater(5, stats['specifications'])
+        self.assertGreaterEqual(1024 * 1024, stats['memory'])
+
+        # An evicted specification is loaded again.
+        wf_spec = spec_parser.get_workflow_spec_by_execution_id(wf_ex_ids[0])
+
+        self.assertEqual(1, len(wf_spec.get_tasks()))
+        self.assertEqual(6, spec_parser.get_stats()['parsed'])
+
+    def test_warm_up_caches(self):
+        wf_text = """
+        version: '2.0'
+
+        wf:
+          tasks:
+            task1:
+              action: std.echo output="Echo"
+        """
+
+        wf_ex_ids = self._create_executions(wf_text, 3)
+
+        spec_parser.warm_up_caches()
+
+        self.assertEqual(3, spec_parser.get_wf_execution_spec_cache_size())
+        self.assertEqual(1, spec_parser.get_stats()['parsed'])
+
+        with mock.patch.object(db_api, 'get_workflow_execution') as get_mock:
+            spec_parser.get_workflow_spec_by_execution_id(wf_ex_ids[0])
+
+        get_mock.assert_not_called()
+
 
 class SpecificationCachingEngineTest(engine_base.EngineTestCase):
     def test_cache_workflow_spec_no_duplicates(self):
@@ -19,6 +19,7 @@ import copy
 import yaml
 
 from mistral import exceptions as exc
+from mistral.lang.v2 import workflows
 from mistral.tests.unit.lang.v2 import base
 from mistral_lib import utils
 
@@ -483,3 +484,51 @@ class WorkflowSpecValidationTest(base.WorkflowSpecValidationTestCase):
                 changes=overlay,
                 expect_error=expect_error
             )
+
+    def test_schema_validator_cached(self):
+        validator = workflows.DirectWorkflowSpec.get_validator()
+
+        self.assertIs(validator, workflows.DirectWorkflowSpec.get_validator())
+
+        # Every specification class has its own validator.
+        self.assertIsNot(
+            validator,
+            workflows.ReverseWorkflowSpec.get_validator()
+        )
+
+        self._parse_dsl_spec(
+            add_tasks=True,
+            changes={'test': {'type': 'direct', 'input': 'invalid'}},
+            expect_error=True
+        )
+
+    def test_inbound_task_specs(self):
+        wf = {
+            'version': '2.0',
+            'wf': {
+                'tasks': {
+                    't1': {'action': 'std.noop', 'on-success': ['t3']},
+                    't2': {'action': 'std.noop', 'on-error': ['t3']},
+                    't3': {'action': 'std.noop', 'on-complete': ['t4']},
+                    't4': {'action': 'std.noop'}
+                }
+            }
+        }
+
+        wf_spec = self._spec_parser(
+            yaml.safe_dump(wf, default_flow_style=False)
+        ).get_workflows()[0]
+
+        def _inbound(t_name):
+            return [
+                t_s.get_name() for t_s in
+                wf_spec.find_inbound_task_specs(wf_spec.get_task(t_name))
+            ]
+
+        self.assertEqual([], _inbound('t1'))
+        self.assertEqual(['t1', 't2'], _inbound('t3'))
+        self.assertEqual(['t3'], _inbound('t4'))
+        self.assertEqual(
+            ['t1', 't2'],
+            [t_s.get_name() for t_s in wf_spec.find_start_tasks()]
+        )
@@ -0,0 +1,139 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import threading
+from unittest import mock
+
+from mistral.monitoring import base as monitoring_base
+from mistral.monitoring import monitoring_server
+from mistral.tests.unit import base
+
+
+class FakeCollector(monitoring_base.MetricCollector):
+    def __init__(self, name, value=1):
+        self.name = name
+        self.value = value
+        self.error = None
+        self.event = None
+        self.calls = 0
+
+    def collect(self):
+        self.calls += 1
+
+        if self.event:
+            self.event.wait()
+
+        if self.error:
+            raise self.error
+
+        metrics = []
+
+        monitoring_base.add_metric(
+            metrics,
+            'test',
+            tags={
+                'name': self.name,
+                'description': 'Test metric',
+                'namespace': 'test',
+                'labels': ['namespace']
+            },
+            fields={'value': self.value}
+        )
+
+        return metrics
+
+
+class SlowCollector(FakeCollector):
+    pass
+
+
+class MonitoringServerTest(base.BaseTest):
+    def setUp(self):
+        super(MonitoringServerTest, self).setUp()
+
+        self.override_config('metric_collector_timeout', 1, 'monitoring')
+
+        self.fast = FakeCollector('fast_metric')
+        self.slow = SlowCollector('slow_metric')
+
+        entry_points = [
+            mock.Mock(load=mock.Mock(return_value=lambda c=c: c))
+            for c in (self.fast, self.slow)
+        ]
+
+        with mock.patch.object(
+                monitoring_server,
+                'entry_points',
+                return_value=entry_points):
+            self.server = monitoring_server.MonitoringServer(
+                setup_profiler=False
+            )
+
+        self.addCleanup(self.server._collector_executor.shutdown, False)
+
+    def _get_values(self):
+        metrics = asyncio.run(self.server.collect_metrics())
+
+        return {m.tags['name']: m.fields['value'] for m in metrics}
+
+    def test_collect_metrics(self):
+        self.assertEqual(
+            {'fast_metric': 1, 'slow_metric': 1},
+            self._get_values()
+        )
+
+        self.assertIn(
+            'fast_metric{namespace="test"} 1.0',
+            self.server._prometheus_cache
+        )
+
+        # The metrics are cached.
+        self._get_values()
+
+        self.assertEqual(1, self.fast.calls)
+
+    def test_stale_metrics_on_error(self):
+        asyncio.run(self.server.refresh_metrics())
+
+        self.fast.value = 2
+        self.slow.error = Exception('Collector failed')
+
+        asyncio.run(self.server.refresh_metrics())
+
+        self.assertEqual(
+            {'fast_metric': 2, 'slow_metric': 1},
+            self._get_values()
+        )
+
+    def test_stale_metrics_on_timeout(self):
+        asyncio.run(self.server.refresh_metrics())
+
+        self.fast.value = 2
+        self.slow.value = 2
+        self.slow.event = threading.Event()
+
+        asyncio.run(self.server.refresh_metrics())
+
+        self.assertEqual(
+            {'fast_metric': 2, 'slow_metric': 1},
+            self._get_values()
+        )
+
+        # The collector that is still running isn't called again.
+        asyncio.run(self.server.refresh_metrics())
+
+        self.assertEqual(2, self.slow.calls)
+
+        self.slow.event.set()
@@ -0,0 +1,138 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import json
+from unittest import mock
+
+from mistral.notifiers.publishers import webhookpool
+from mistral.tests.unit import base
+from mistral.utils import http_utils
+
+
+GOOD_URL = 'http://good_url'
+BAD_URL = 'http://bad_url'
+
+
+class WebhookPoolPublisherTest(base.BaseTest):
+    def setUp(self):
+        super(WebhookPoolPublisherTest, self).setUp()
+
+        self.override_config('webhook_pool_retry_delay', 0.1, 'notifier')
+
+        self.requests = []
+
+        session = mock.Mock()
+        session.post.side_effect = self._post
+
+        self.patch_session = mock.patch.object(
+            http_utils,
+            'get_session',
+            return_value=session
+        )
+        self.patch_session.start()
+
+        self.addCleanup(self.patch_session.stop)
+
+        self.publisher = webhookpool.WebhookPoolPublisher()
+
+        self.addCleanup(self.publisher.stop)
+
+    def _post(self, url, data=None, headers=None, timeout=None):
+        self.requests.append((url, json.loads(data)))
+
+        return base.FakeHTTPResponse('', 500 if url == BAD_URL else 200)
+
+    def _publish(self, url, ex_id, **kwargs):
+        self.publisher.publish(
+            None,
+            ex_id,
+            {'id': ex_id},
+            'EVENT',
+            None,
+            url=url,
+            **kwargs
+        )
+
+    def _get_requests(self, url):
+        return [body for u, body in self.requests if u == url]
+
+    def test_ordered_delivery(self):
+        for i in range(5):
+            self._publish(GOOD_URL, str(i))
+
+        self._await(lambda: len(self.requests) == 5, delay=0.1)
+
+        self.assertListEqual(
+            [{'id': str(i)} for i in range(5)],
+            self._get_requests(GOOD_URL)
+        )
+
+    def test_failing_url_does_not_block_others(self):
+        self._publish(BAD_URL, 'bad', number_of_retries=2)
+
+        for i in range(3):
+            self._publish(GOOD_URL, str(i))
+
+        self._await(lambda: len(self._get_requests(GOOD_URL)) == 3, delay=0.1)
+
+        # The first attempt plus two retries.
+        self._await(lambda: len(self._get_requests(BAD_URL)) == 3, delay=0.1)
+
+        self._sleep(0.5)
+
+        self.assertEqual(3, len(self._get_requests(BAD_URL)))
+
+    def test_full_url_queue_does_not_block_others(self):
+        self.override_config('webhook_pool_queue_size', 2, 'notifier')
+
+        for i in range(4):
+            self._publish(BAD_URL, str(i), number_of_retries=-1)
+
+        self._publish(GOOD_URL, 'good')
+
+        self._await(lambda: self._get_requests(GOOD_URL), delay=0.1)
+
+        # Notifications that didn't fit into the queue are dropped.
+        self.assertEqual(
+            {'0'},
+            set(body['id'] for body in self._get_requests(BAD_URL))
+        )
+        self.assertEqual(2, len(self.publisher._deliveries[BAD_URL]))
+
+    def test_stop_cancels_retries(self):
+        self.override_config('webhook_pool_retry_delay', 0.5, 'notifier')
+
+        self._publish(BAD_URL, 'bad', number_of_retries=-1)
+
+        self._await(lambda: self._get_requests(BAD_URL), delay=0.1)
+
+        self.assertIn(BAD_URL, self.publisher._retry_timers)
+
+        self.publisher.stop()
+
+        self._sleep(0.7)
+
+        self.assertEqual(1, len(self._get_requests(BAD_URL)))
+        self.assertEqual({}, self.publisher._retry_timers)
+
+    def test_batch_delivery(self):
+        for i in range(3):
+            self._publish(GOOD_URL, str(i), batch_size=10)
+
+        self._await(lambda: self.requests, delay=0.1)
+
+        self.assertListEqual(
+            [[{'id': str(i)} for i in range(3)]],
+            self._get_requests(GOOD_URL)
+        )
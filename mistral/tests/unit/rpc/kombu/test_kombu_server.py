@@ -309,3 +309,126 @@ class KombuServerTest(base.KombuTestCase):
             self.server._prepare_worker,
             'non_valid_executor'
         )
+
+    def test_prefetch_count(self):
+        self.server._prepare_worker('blocking')
+
+        self.assertEqual(1, self.server._get_prefetch_count())
+
+        self.server._prepare_worker('eventlet')
+
+        self.assertEqual(64, self.server._get_prefetch_count())
+
+        self.override_config('prefetch_count', 10, 'kombu_rpc')
+
+        self.assertEqual(10, self.server._get_prefetch_count())
+
+    @mock.patch.object(kombu_server.KombuRPCServer, '_on_message')
+    def test_ack_on_accept(self, _on_message):
+        self.server._prepare_worker('blocking')
+
+        def on_message(request, message):
+            self.assertEqual(
+                request['rpc_method'] == 'process_action_heartbeats',
+                message.ack.called
+            )
+
+        _on_message.side_effect = on_message
+
+        for method_name in ['process_action_heartbeats', 'start_task']:
+            message = mock.MagicMock()
+
+            self.server._process_message(
+                {'rpc_method': method_name, 'async': True},
+                message
+            )
+
+            self.assertEqual(1, message.ack.call_count)
+
+        self.assertEqual(2, _on_message.call_count)
+
+    @mock.patch.object(kombu_server.KombuRPCServer, '_on_message')
+    def test_method_concurrency(self, _on_message):
+        self.server._method_limits = {'run_action': 1}
+        self.server._prepare_worker('blocking')
+        self.server._consumer = mock.MagicMock()
+
+        # Emulate a call of the method that is being processed.
+        self.server._method_running['run_action'] = 1
+        self.server._worker_slots.acquire()
+
+        request = {'rpc_method': 'run_action', 'async': True}
+        message = mock.MagicMock()
+
+        self.server._process_message(request, message)
+
+        self.assertEqual(0, _on_message.call_count)
+        self.assertEqual(0, message.ack.call_count)
+
+        # The waiting message is processed when the method call completes.
+        self.server._release_message(request)
+
+        _on_message.assert_called_once_with(request, message)
+
+        self.assertEqual(1, message.ack.call_count)
+        self.assertEqual(0, self.server._method_running['run_action'])
+
+        # All worker slots are free again.
+        self.assertTrue(self.server._worker_slots.acquire(blocking=False))
+
+    @mock.patch('stevedore.driver.DriverManager')
+    @mock.patch.object(kombu_server.KombuRPCServer, '_on_message')
+    def test_waiting_messages_extend_prefetch(self, _on_message,
+                                              driver_manager_mock):
+        driver_manager_mock.return_value.driver.return_value = (
+            futurist.SynchronousExecutor()
+        )
+
+        self.server._executor_threads = 2
+        self.server._method_limits = {'run_action': 1}
+        self.server._prepare_worker('threading')
+
+        prefetch_counts = []
+
+        self.server._consumer = mock.MagicMock()
+        self.server._consumer.qos.side_effect = (
+            lambda prefetch_count: prefetch_counts.append(prefetch_count)
+        )
+
+        self.server._update_qos()
+
+        self.assertEqual([2], prefetch_counts)
+
+        # Emulate a call of the limited method that is being processed.
+        self.server._method_running['run_action'] = 1
+        self.server._worker_slots.acquire()
+
+        unacked = 1
+
+        # The broker delivers a message only if the number of
+        # unacknowledged messages is less than the prefetch count.
+        for method_name in ['run_action', 'run_action', 'start_task']:
+            self.assertLess(unacked, prefetch_counts[-1])
+
+            message = mock.MagicMock()
+
+            self.server._process_message(
+                {'rpc_method': method_name, 'async': True},
+                message
+            )
+
+            unacked += 1 - message.ack.call_count
+
+        _on_message.assert_called_once_with(
+            {'rpc_method': 'start_task', 'async': True},
+            message
+        )
+
+        self.assertEqual([2, 3, 4], prefetch_counts)
+
+        # The window shrinks back once waiting messages are processed.
+        self.server._release_message({'rpc_method': 'run_action'})
+        self.server._update_qos()
+
+        self.assertEqual(3, _on_message.call_count)
+        self.assertEqual([2, 3, 4, 2], prefetch_counts)
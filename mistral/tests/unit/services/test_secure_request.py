@@ -0,0 +1,125 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+import eventlet
+
+from mistral.services import secure_request
+from mistral.tests.unit import base
+
+
+class SecureRequestTest(base.BaseTest):
+    def setUp(self):
+        super(SecureRequestTest, self).setUp()
+
+        secure_request.cleanup()
+
+        self.addCleanup(secure_request.cleanup)
+
+        self.token_num = 0
+
+    def _get_token(self, realm, expires_in=300):
+        # Give other threads a chance to run while "waiting" for IDP.
+        eventlet.sleep(0.1)
+
+        self.token_num += 1
+
+        return {
+            'access_token': '%s-%s' % (realm, self.token_num),
+            'token_type': 'Bearer',
+            'expires_in': expires_in
+        }
+
+    @mock.patch.object(secure_request, '_get_token')
+    def test_single_flight_refresh(self, get_token):
+        get_token.side_effect = self._get_token
+
+        threads = [
+            eventlet.spawn(secure_request.set_auth_token, {})
+            for _ in range(5)
+        ]
+
+        headers = [t.wait() for t in threads]
+
+        self.assertEqual(1, get_token.call_count)
+
+        for h in headers:
+            self.assertEqual('Bearer cloud-common-1', h['Authorization'])
+
+        stats = secure_request.get_stats()['cloud-common']
+
+        self.assertEqual(1, stats['refreshes'])
+        self.assertEqual(0, stats['failures'])
+
+    @mock.patch.object(secure_request, '_get_token')
+    def test_token_per_realm(self, get_token):
+        get_token.side_effect = self._get_token
+
+        self.assertEqual(
+            'Bearer realm1-1',
+            secure_request.set_auth_token({}, 'realm1')['Authorization']
+        )
+        self.assertEqual(
+            'Bearer realm2-2',
+            secure_request.set_auth_token({}, 'realm2')['Authorization']
+        )
+        self.assertEqual(
+            'Bearer realm1-1',
+            secure_request.set_auth_token({}, 'realm1')['Authorization']
+        )
+
+    @mock.patch.object(secure_request, '_get_token')
+    def test_stale_token_refreshed_in_background(self, get_token):
+        self.override_config('expiration_token_duration', 30)
+
+        # The token is valid but expires within the stale window.
+        get_token.side_effect = lambda realm: self._get_token(realm, 10)
+
+        provider = secure_request.get_token_provider()
+
+        provider.refresh()
+
+        # The current token is returned without waiting for a refresh.
+        self.assertEqual('cloud-common-1', provider.get())
+
+        self._await(
+            lambda: provider.token['access_token'] == 'cloud-common-2',
+            delay=0.1
+        )
+
+        self.assertEqual(2, get_token.call_count)
+
+    @mock.patch.object(secure_request, '_get_token')
+    def test_refresh_scheduled_before_expiration(self, get_token):
+        self.override_config('expiration_token_duration', 30)
+
+        get_token.side_effect = self._get_token
+
+        provider = secure_request.get_token_provider()
+
+        with mock.patch.object(eventlet, 'spawn_after') as spawn_after:
+            provider.refresh()
+
+        self.assertAlmostEqual(270, spawn_after.call_args[0][0], delta=1)
+
+    @mock.patch.object(secure_request, '_get_token')
+    def test_refresh_failure(self, get_token):
+        get_token.side_effect = RuntimeError('IDP is down')
+
+        self.assertRaises(RuntimeError, secure_request.set_auth_token, {})
+
+        stats = secure_request.get_stats()['cloud-common']
+
+        self.assertEqual(1, stats['failures'])
@@ -0,0 +1,151 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from oslo_utils import importutils
+import testtools
+
+from mistral.tests.unit import base
+from mistral.utils import javascript
+
+
+@testtools.skipIf(not importutils.try_import('py_mini_racer'),
+                  'This test requires that py_mini_racer library was '
+                  'installed')
+class PyMiniRacerEvaluatorTest(base.BaseTest):
+    def setUp(self):
+        super(PyMiniRacerEvaluatorTest, self).setUp()
+
+        javascript.cleanup()
+
+        self.addCleanup(javascript.cleanup)
+
+    @staticmethod
+    def _evaluate(script, ctx):
+        return javascript.PyMiniRacerEvaluator.evaluate(script, ctx)
+
+    def _get_idle(self):
+        return javascript._get_mini_racer_pool()._idle
+
+    def test_evaluate(self):
+        self.assertEqual(2, self._evaluate('return $.num * 2;', {'num': 1}))
+        self.assertEqual('a', self._evaluate('return $.str;', {'str': 'a'}))
+        self.assertEqual(
+            {'list': [1, 2]},
+            self._evaluate('return {list: $.list};', {'list': [1, 2]})
+        )
+
+    def test_context_reused(self):
+        for i in range(10):
+            self.assertEqual(i * 2, self._evaluate('return $ * 2;', i))
+
+        self.assertEqual(1, len(self._get_idle()))
+
+        js_ctx = self._get_idle()[0]
+
+        self.assertEqual(1, len(js_ctx._script_ids))
+
+    def test_context_with_changed_globals_discarded(self):
+        self.assertEqual(1, self._evaluate('leaked = 1; return leaked;', {}))
+
+        self.assertEqual(0, len(self._get_idle()))
+
+        self.assertEqual(
+            'undefined',
+            self._evaluate('return typeof leaked;', {})
+        )
+
+    def test_changed_builtins_not_leaked(self):
+        self.assertEqual(
+            'a!',
+            self._evaluate(
+                'Array.prototype.map = function() { return 42; };'
+                'JSON.stringify = function() { return "{}"; };'
+                'String.prototype.shout = function() { return this + "!"; };'
+                'return $.shout();',
+                'a'
+            )
+        )
+
+        self.assertEqual(0, len(self._get_idle()))
+
+        self.assertEqual(
+            [2, 3],
+            self._evaluate('return $.map(function(x) { return x + 1; });',
+                           [1, 2])
+        )
+        self.assertEqual(
+            {'a': 1},
+            self._evaluate('return JSON.parse(JSON.stringify($));', {'a': 1})
+        )
+        self.assertEqual(
+            'undefined',
+            self._evaluate('return typeof "a".shout;', {})
+        )
+
+        self.assertEqual(1, len(self._get_idle()))
+
+    def test_context_with_replaced_builtin_discarded(self):
+        self.assertEqual(1, self._evaluate('Math = null; return 1;', {}))
+
+        self.assertEqual(0, len(self._get_idle()))
+
+        self.assertEqual(1, self._evaluate('return Math.abs(-1);', {}))
+
+    def test_own_properties_of_objects_allowed(self):
+        self.assertEqual(
+            'o',
+            self._evaluate(
+                'var o = {};'
+                'o.toString = function() { return "o"; };'
+                'o.constructor = null;'
+                'return String(o);',
+                {}
+            )
+        )
+
+        self.assertEqual(1, len(self._get_idle()))
+
+    def test_context_with_registered_script_discarded(self):
+        self._evaluate('__mistral_register("1", null); return 1;', {})
+
+        self.assertEqual(0, len(self._get_idle()))
+
+    def test_context_with_error_discarded(self):
+        self.assertRaises(
+            javascript._PY_MINI_RACER.JSEvalException,
+            self._evaluate,
+            'return $.a.b;',
+            {}
+        )
+
+        self.assertEqual(0, len(self._get_idle()))
+
+    def test_pool_disabled(self):
+        self.override_config('js_context_pool_size', 0)
+
+        self.assertEqual(2, self._evaluate('return $ * 2;', 1))
+
+        self.assertEqual(0, len(self._get_idle()))
+
+    def test_builtins_changed_with_pool_disabled(self):
+        self.override_config('js_context_pool_size', 0)
+
+        self.assertEqual(
+            'a!',
+            self._evaluate(
+                'String.prototype.shout = function() { return this + "!"; };'
+                'return $.shout();',
+                'a'
+            )
+        )
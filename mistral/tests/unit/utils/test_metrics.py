@@ -0,0 +1,127 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from mistral import expressions
+from mistral.tests.unit import base
+from mistral.utils import metrics
+
+
+class FakeEndpoint(object):
+    def start(self, rpc_ctx, value):
+        return value
+
+    def helper(self, value):
+        return value
+
+    def _private(self, rpc_ctx):
+        return rpc_ctx
+
+
+class MetricsTest(base.BaseTest):
+    def setUp(self):
+        super(MetricsTest, self).setUp()
+
+        self.addCleanup(metrics.cleanup)
+
+    def _setup(self):
+        self.override_config('enabled', True, 'process_metrics')
+
+        with mock.patch.object(
+                metrics.prometheus_client,
+                'start_http_server') as start_mock:
+            metrics.setup('mistral-test')
+
+        start_mock.assert_called_once_with(
+            9091,
+            addr='0.0.0.0',
+            registry=metrics.get_registry()
+        )
+
+    def _get_sample(self, name, labels):
+        return metrics.get_registry().get_sample_value(name, labels)
+
+    def test_disabled(self):
+        metrics.setup('mistral-test')
+
+        self.assertFalse(metrics.is_enabled())
+
+        @metrics.timed('operation')
+        def func(value):
+            return value
+
+        self.assertEqual(1, func(1))
+
+        endpoint = FakeEndpoint()
+
+        self.assertIs(endpoint, metrics.instrument_rpc_endpoint(endpoint))
+        self.assertNotIn('start', vars(endpoint))
+
+    def test_timed(self):
+        self._setup()
+
+        @metrics.timed('operation')
+        def func(value):
+            return value
+
+        self.assertEqual(1, func(1))
+        self.assertEqual(2, func(2))
+
+        self.assertEqual(
+            2,
+            self._get_sample(
+                metrics.ENGINE_OPERATION + '_count',
+                {'operation': 'operation'}
+            )
+        )
+
+    def test_instrument_rpc_endpoint(self):
+        self._setup()
+
+        endpoint = metrics.instrument_rpc_endpoint(FakeEndpoint())
+
+        self.assertEqual(1, endpoint.start(None, 1))
+        self.assertEqual(1, endpoint.helper(1))
+
+        self.assertEqual(
+            1,
+            self._get_sample(
+                metrics.RPC_CALL + '_count',
+                {'method': 'start'}
+            )
+        )
+
+        self.assertNotIn('helper', vars(endpoint))
+        self.assertNotIn('_private', vars(endpoint))
+
+    def test_expression_evaluation(self):
+        self._setup()
+
+        self.assertEqual(3, expressions.evaluate('<% 1 + 2 %>', {}))
+
+        self.assertEqual(
+            1,
+            self._get_sample(
+                metrics.EXPRESSION_EVALUATION + '_count',
+                {'evaluator': 'yaql'}
+            )
+        )
+
+    def test_stats(self):
+        self._setup()
+
+        self.assertIsNotNone(
+            self._get_sample('mistral_spec_cache', {'stat': 'hit_rate'})
+        )
@@ -14,6 +14,8 @@
 
 from unittest import TestCase
 
+import yaml
+
 from mistral.utils import safe_yaml
 
 
@@ -68,3 +70,57 @@ class TestSafeLoader(TestCase):
                  }
         }
         self.assertEqual(result, safe_yaml.load(yaml_text))
+
+    def test_load_at_sign(self):
+        yaml_text = """
+        a: @value
+        b: [@x, @y]
+        c: user@example.com
+        """
+
+        self.assertEqual(
+            {'a': '@value', 'b': ['@x', '@y'], 'c': 'user@example.com'},
+            safe_yaml.load(yaml_text)
+        )
+
+    def test_load_special_chars_in_scalars(self):
+        yaml_text = """
+        expr: <% $.a * $.b %>
+        js: |
+          if (a && b) { return *p; }
+        """
+
+        self.assertEqual(
+            {
+                'expr': '<% $.a * $.b %>',
+                'js': 'if (a && b) { return *p; }\n'
+            },
+            safe_yaml.load(yaml_text)
+        )
+
+    def test_load_same_as_safe_loader(self):
+        yaml_texts = [
+            'a: 1\nb: [1, 2.5, true, null]\nc: {d: "e"}\n',
+            'a: &x 1\nb: *x\n',
+            'a: 1\n  b: 2\n',
+            'a: [1, 2\n'
+        ]
+
+        for yaml_text in yaml_texts:
+            try:
+                expected = yaml.load(yaml_text, safe_yaml.SafeLoader)
+            except yaml.YAMLError as e:
+                expected = str(e)
+
+            try:
+                result = safe_yaml.load(yaml_text)
+            except yaml.YAMLError as e:
+                result = str(e)
+
+            self.assertEqual(expected, result)
+
+    def test_load_with_anchors(self):
+        self.assertEqual(
+            {'a': 1, 'b': 1},
+            safe_yaml.load_with_anchors('a: &x 1\nb: *x\n')
+        )
@@ -0,0 +1,220 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from mistral.tests.unit import base
+from mistral.utils import ssh_utils
+
+
+class FakeChannel(object):
+    def __init__(self, stdout=b'', stderr=b'', exit_status=0):
+        self._stdout = stdout
+        self._stderr = stderr
+        self._exit_status = exit_status
+        self.closed = False
+
+    def exec_command(self, cmd):
+        pass
+
+    def recv_ready(self):
+        return bool(self._stdout)
+
+    def recv(self, size):
+        data, self._stdout = self._stdout[:size], self._stdout[size:]
+
+        return data
+
+    def recv_stderr_ready(self):
+        return bool(self._stderr)
+
+    def recv_stderr(self, size):
+        data, self._stderr = self._stderr[:size], self._stderr[size:]
+
+        return data
+
+    def exit_status_ready(self):
+        return True
+
+    def recv_exit_status(self):
+        return self._exit_status
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSSHClient(object):
+    def __init__(self, chan_factory):
+        self._chan_factory = chan_factory
+        self.transport = mock.Mock()
+        self.transport.open_session.side_effect = chan_factory
+        self.transport.is_active.return_value = True
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+
+
+class SSHUtilsTest(base.BaseTest):
+    def setUp(self):
+        super(SSHUtilsTest, self).setUp()
+
+        self.addCleanup(ssh_utils.cleanup)
+
+        self.clients = []
+
+        def connect(host, username, password=None, pkey=None, proxy=None):
+            client = FakeSSHClient(lambda: FakeChannel(b'out', b'err'))
+
+            self.clients.append(client)
+
+            return client
+
+        patcher = mock.patch.object(ssh_utils, '_connect', connect)
+        patcher.start()
+
+        self.addCleanup(patcher.stop)
+
+    def test_read_large_output(self):
+        stdout = b'o' * 1000000
+        stderr = b'e' * 1000000
+
+        self.assertEqual(
+            (stdout.decode(), stderr.decode()),
+            ssh_utils._read_channel(FakeChannel(stdout, stderr))
+        )
+
+    def test_read_output_arrived_with_exit_status(self):
+        chan = FakeChannel(b'out', b'err')
+
+        with mock.patch.object(chan, 'recv_ready', return_value=False):
+            with mock.patch.object(
+                    chan,
+                    'recv_stderr_ready',
+                    return_value=False):
+                self.assertEqual(
+                    ('out', 'err'),
+                    ssh_utils._read_channel(chan)
+                )
+
+    def test_read_output_truncated(self):
+        self.override_config('max_output_size', 10, 'ssh_connection_pool')
+
+        self.assertEqual(
+            ('o' * 10, 'e' * 5),
+            ssh_utils._read_channel(FakeChannel(b'o' * 100, b'e' * 5))
+        )
+
+    def test_execute_command_without_pool(self):
+        self.assertEqual(
+            (0, 'out', 'err'),
+            ssh_utils.execute_command('ls', 'host', 'user', get_stderr=True)
+        )
+        self.assertEqual(
+            (0, 'out'),
+            ssh_utils.execute_command('ls', 'host', 'user')
+        )
+
+        self.assertEqual(2, len(self.clients))
+        self.assertTrue(all(c.closed for c in self.clients))
+
+    def test_execute_command_with_pool(self):
+        self.override_config('enabled', True, 'ssh_connection_pool')
+
+        for _ in range(3):
+            ssh_utils.execute_command('ls', 'host', 'user', password='pass')
+
+        self.assertEqual(1, len(self.clients))
+        self.assertFalse(self.clients[0].closed)
+
+        # Different credentials mean a different connection.
+        ssh_utils.execute_command('ls', 'host', 'user', password='other')
+
+        self.assertEqual(2, len(self.clients))
+
+    def test_inactive_connection_not_reused(self):
+        self.override_config('enabled', True, 'ssh_connection_pool')
+
+        ssh_utils.execute_command('ls', 'host', 'user')
+
+        self.clients[0].transport.is_active.return_value = False
+
+        ssh_utils.execute_command('ls', 'host', 'user')
+
+        self.assertEqual(2, len(self.clients))
+        self.assertTrue(self.clients[0].closed)
+
+    def test_idle_connections_limit(self):
+        self.override_config('enabled', True, 'ssh_connection_pool')
+        self.override_config(
+            'max_idle_connections',
+            1,
+            'ssh_connection_pool'
+        )
+
+        ssh_utils.execute_command('ls', 'host1', 'user')
+        ssh_utils.execute_command('ls', 'host2', 'user')
+
+        self.assertTrue(self.clients[0].closed)
+        self.assertFalse(self.clients[1].closed)
+
+    def test_connection_closed_on_error(self):
+        self.override_config('enabled', True, 'ssh_connection_pool')
+
+        with mock.patch.object(
+                ssh_utils,
+                '_read_channel',
+                side_effect=IOError('Connection lost')):
+            self.assertRaises(
+                IOError,
+                ssh_utils.execute_command,
+                'ls',
+                'host',
+                'user'
+            )
+
+        self.assertTrue(self.clients[0].closed)
+
+    def test_connection_reused_after_failed_command(self):
+        self.override_config('enabled', True, 'ssh_connection_pool')
+
+        ssh_utils.execute_command('ls', 'host', 'user')
+
+        self.clients[0].transport.open_session.side_effect = (
+            lambda: FakeChannel(exit_status=1)
+        )
+
+        self.assertRaises(
+            RuntimeError,
+            ssh_utils.execute_command,
+            'ls',
+            'host',
+            'user'
+        )
+
+        self.assertEqual(
+            (1, ''),
+            ssh_utils.execute_command(
+                'ls',
+                'host',
+                'user',
+                raise_when_error=False
+            )
+        )
+
+        self.assertEqual(1, len(self.clients))
+        self.assertFalse(self.clients[0].closed)
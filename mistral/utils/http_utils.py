@@ -0,0 +1,131 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+from http import cookiejar
+import threading
+import time
+from urllib import parse
+
+from oslo_config import cfg
+from oslo_log import log as logging
+import requests
+from requests import adapters
+
+"""
+Process wide pool of HTTP sessions.
+
+Every session keeps its own pool of keep-alive connections so that HTTP
+requests sent to the same host don't pay for a TCP and TLS handshake each
+time. Sessions are keyed by a scheme, host, SSL verification setting and
+proxies and never store cookies between requests.
+"""
+
+LOG = logging.getLogger(__name__)
+
+CONF = cfg.CONF
+
+# Session key -> (session, time of the last use).
+_SESSIONS = collections.OrderedDict()
+_LOCK = threading.Lock()
+
+
+def _get_session_key(url, verify=None, proxies=None):
+    url_data = parse.urlsplit(url)
+
+    return (
+        url_data.scheme,
+        url_data.netloc,
+        str(verify),
+        tuple(sorted((proxies or {}).items()))
+    )
+
+
+def _create_session():
+    session = requests.Session()
+
+    # Cookies received by one action must not be sent by another one.
+    session.cookies.set_policy(
+        cookiejar.DefaultCookiePolicy(allowed_domains=[])
+    )
+
+    adapter = adapters.HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=CONF.http_connection_pool.max_connections_per_host
+    )
+
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return session
+
+
+def _close_idle_sessions(now):
+    idle_timeout = CONF.http_connection_pool.idle_timeout
+
+    for key, (session, last_used) in list(_SESSIONS.items()):
+        if now - last_used > idle_timeout:
+            del _SESSIONS[key]
+
+            session.close()
+
+
+def get_session(url, verify=None, proxies=None):
+    """Returns a shared HTTP session suitable for the given request.
+
+    :param url: URL of the request.
+    :param verify: SSL verification setting of the request.
+    :param proxies: Proxies of the request.
+    :return: requests.Session instance.
+    """
+    key = _get_session_key(url, verify, proxies)
+    now = time.monotonic()
+
+    with _LOCK:
+        _close_idle_sessions(now)
+
+        entry = _SESSIONS.pop(key, None)
+
+        session = entry[0] if entry else _create_session()
+
+        _SESSIONS[key] = (session, now)
+
+        while len(_SESSIONS) > CONF.http_connection_pool.max_pools:
+            _, (lru_session, _) = _SESSIONS.popitem(last=False)
+
+            lru_session.close()
+
+    return session
+
+
+def request(method, url, **kwargs):
+    """Sends an HTTP request.
+
+    Has the same signature as requests.request() but uses the shared
+    connection pool if it's enabled.
+    """
+    if not CONF.http_connection_pool.enabled:
+        return requests.request(method, url, **kwargs)
+
+    session = get_session(url, kwargs.get('verify'), kwargs.get('proxies'))
+
+    return session.request(method, url, **kwargs)
+
+
+def cleanup():
+    with _LOCK:
+        while _SESSIONS:
+            _, (session, _) = _SESSIONS.popitem()
+
+            session.close()
@@ -15,6 +15,7 @@
 #    limitations under the License.
 
 import abc
+import contextlib
 import json
 
 from mistral import config as cfg
@@ -29,6 +30,7 @@ _PYV8 = importutils.try_import('PyV8')
 _V8EVAL = importutils.try_import('v8eval')
 _PY_MINI_RACER = importutils.try_import('py_mini_racer.py_mini_racer')
 _EVALUATOR = None
+_MINI_RACER_POOL = None
 
 
 class JSEvaluator(object):
@@ -90,34 +92,275 @@ class PyMiniRacerEvaluator(JSEvaluator):
                 "PyMiniRacer."
             )
 
-        js_ctx = _PY_MINI_RACER.MiniRacer()
+        with _get_mini_racer_pool().get() as js_ctx:
+            result = js_ctx.evaluate(script, ctx)
 
-        wrapper_script = '''
-            var original_result = (function() {{
-                {}
-                return f();
-            }})();
+        if isinstance(result, str):
+            try:
+                return json.loads(result)
+            except json.JSONDecodeError:
+                return result
+        else:
+            return result
+
+
+# Defines functions that register compiled scripts and call them with the
+# given data and convert their results. The data is passed as a JSON string
+# so that V8 parses it with JSON.parse() rather than as a part of the script.
+#
+# Pooled contexts are reused by scripts of different workflows so the
+# properties of all objects reachable from the global object, i.e. global
+# variables and built-ins, are remembered and compared after every call.
+# The context is not reused if a script changed any of them. The check only
+# uses functions obtained before any script runs so that scripts can't
+# fool it. The compiled scripts are kept in a closure for the same reason.
+_MINI_RACER_BOOTSTRAP = '''
+    (function(check_globals) {
+        // Functions in the strict mode have no "arguments" and "caller"
+        // properties that change while they run.
+        'use strict';
+
+        var uncurry = Function.prototype.bind.bind(Function.prototype.call);
+
+        var ownKeys = Reflect.ownKeys;
+        var getDescriptor = Object.getOwnPropertyDescriptor;
+        var getPrototype = Object.getPrototypeOf;
+        var isExtensible = Object.isExtensible;
+        var is = Object.is;
+        var defineProperty = Object.defineProperty;
+        var jsonParse = JSON.parse;
+        var jsonStringify = JSON.stringify;
+        var newMap = function() { return new Map(); };
+        var mapGet = uncurry(Map.prototype.get);
+        var mapHas = uncurry(Map.prototype.has);
+        var mapSet = uncurry(Map.prototype.set);
+        var mapSize = uncurry(getDescriptor(Map.prototype, 'size').get);
+
+        var scripts = newMap();
+
+        // [object, prototype, extensible, keys, descriptors] for every
+        // object reachable from the global object.
+        var takeSnapshot = function() {
+            var snapshot = [];
+            var seen = newMap();
+            var stack = [globalThis];
+            var size = 1;
+
+            while (size) {
+                var obj = stack[--size];
+
+                if (Object(obj) !== obj || mapHas(seen, obj)) {
+                    continue;
+                }
+
+                mapSet(seen, obj, true);
+
+                var proto = getPrototype(obj);
+                var keys = ownKeys(obj);
+                var descs = [];
+
+                stack[size++] = proto;
+
+                for (var i = 0; i < keys.length; i++) {
+                    var desc = getDescriptor(obj, keys[i]);
+
+                    descs[i] = desc;
+
+                    if ('value' in desc) {
+                        stack[size++] = desc.value;
+                    } else {
+                        stack[size++] = desc.get;
+                        stack[size++] = desc.set;
+                    }
+                }
+
+                snapshot[snapshot.length] = [
+                    obj, proto, isExtensible(obj), keys, descs
+                ];
+            }
+
+            return snapshot;
+        };
+
+        var sameDescriptors = function(d1, d2) {
+            return d2 !== undefined &&
+                is(d1.value, d2.value) &&
+                d1.get === d2.get &&
+                d1.set === d2.set &&
+                d1.writable === d2.writable &&
+                d1.enumerable === d2.enumerable &&
+                d1.configurable === d2.configurable;
+        };
+
+        var isChanged = function(snapshot) {
+            for (var i = 0; i < snapshot.length; i++) {
+                var obj = snapshot[i][0];
+                var keys = snapshot[i][3];
+                var descs = snapshot[i][4];
+
+                if (getPrototype(obj) !== snapshot[i][1] ||
+                        isExtensible(obj) !== snapshot[i][2] ||
+                        ownKeys(obj).length !== keys.length) {
+                    return true;
+                }
+
+                for (var j = 0; j < keys.length; j++) {
+                    if (!sameDescriptors(descs[j],
+                                         getDescriptor(obj, keys[j]))) {
+                        return true;
+                    }
+                }
+            }
+
+            return false;
+        };
+
+        var snapshot = null;
+
+        var register = function(script_id, script) {
+            if (mapHas(scripts, script_id)) {
+                throw new Error('Script is already registered: ' + script_id);
+            }
+
+            mapSet(scripts, script_id, script);
+        };
+
+        var call = function(script_id, ctx_json) {
+            var original_result = mapGet(scripts, script_id)(
+                jsonParse(ctx_json)
+            );
 
             var isPrimitive = (val) => Object(val) !== val;
             var isString = (val) => typeof val === "string";
 
             var result = isPrimitive(original_result) ?
              (isString(original_result) ?
-             '\"' + original_result + '\"' : original_result)
-             : JSON.stringify(original_result);
-            result;
-        '''.format(script)
-        result = js_ctx.eval(
-            '$ = {}; {}'.format(utils.to_json_str(ctx), wrapper_script)
+             '\\"' + original_result + '\\"' : original_result)
+             : jsonStringify(original_result);
+
+            var dirty = snapshot !== null && isChanged(snapshot);
+
+            // The result is formatted without calling any functions that
+            // a script could have changed.
+            return '[' + (result === undefined ? 'null' :
+                          jsonStringify(result)) + ',' + dirty + ',' +
+                mapSize(scripts) + ']';
+        };
+
+        defineProperty(globalThis, '__mistral_register', {value: register});
+        defineProperty(globalThis, '__mistral_call', {value: call});
+
+        if (check_globals) {
+            snapshot = takeSnapshot();
+        }
+    })(%s);
+'''
+
+_MINI_RACER_COMPILE = '''
+    __mistral_register({}, function($) {{
+        {}
+        return f();
+    }});
+'''
+
+# The maximum number of scripts compiled in one context.
+_MINI_RACER_MAX_SCRIPTS = 100
+
+
+class _MiniRacerContext(object):
+    """A V8 context with compiled scripts.
+
+    :param pooled: Whether the context may be reused. Global variables and
+        built-ins are only checked for changes in such contexts.
+    """
+
+    def __init__(self, pooled=True):
+        self._js_ctx = _PY_MINI_RACER.MiniRacer()
+        self._js_ctx.eval(
+            _MINI_RACER_BOOTSTRAP % ('true' if pooled else 'false')
         )
 
-        if isinstance(result, str):
-            try:
-                return json.loads(result)
-            except json.JSONDecodeError:
-                return result
+        self._pooled = pooled
+        self._script_ids = {}
+
+        # A context can't be reused if a script changed global variables
+        # or built-ins, failed or took too much memory.
+        self.reusable = pooled
+
+    def evaluate(self, script, ctx):
+        max_memory = cfg.CONF.js_context_max_memory * 1024 * 1024 or None
+
+        self.reusable = False
+
+        script_id = self._script_ids.get(script)
+
+        if script_id is None:
+            script_id = json.dumps(str(len(self._script_ids)))
+
+            self._js_ctx.eval(
+                _MINI_RACER_COMPILE.format(script_id, script),
+                max_memory=max_memory
+            )
+
+            self._script_ids[script] = script_id
+
+        result, dirty, scripts_count = json.loads(self._js_ctx.eval(
+            '__mistral_call({}, {})'.format(
+                script_id,
+                json.dumps(utils.to_json_str(ctx))
+            ),
+            max_memory=max_memory
+        ))
+
+        used_heap_size = self._js_ctx.heap_stats()['used_heap_size']
+
+        # A script may also have registered scripts of its own.
+        self.reusable = (
+            self._pooled and
+            not dirty and
+            scripts_count == len(self._script_ids) and
+            len(self._script_ids) < _MINI_RACER_MAX_SCRIPTS and
+            used_heap_size <
+            cfg.CONF.js_context_max_idle_memory * 1024 * 1024
+        )
+
+        return result
+
+
+class _MiniRacerPool(object):
+    """A pool of warm V8 contexts."""
+
+    def __init__(self, size):
+        self._size = size
+        self._idle = []
+
+    @contextlib.contextmanager
+    def get(self):
+        if self._idle:
+            js_ctx = self._idle.pop()
         else:
-            return result
+            js_ctx = _MiniRacerContext(pooled=self._size > 0)
+
+        try:
+            yield js_ctx
+        finally:
+            if js_ctx.reusable and len(self._idle) < self._size:
+                self._idle.append(js_ctx)
+
+
+def _get_mini_racer_pool():
+    global _MINI_RACER_POOL
+
+    if _MINI_RACER_POOL is None:
+        _MINI_RACER_POOL = _MiniRacerPool(cfg.CONF.js_context_pool_size)
+
+    return _MINI_RACER_POOL
+
+
+def cleanup():
+    global _MINI_RACER_POOL
+
+    _MINI_RACER_POOL = None
 
 
 _mgr = extension.ExtensionManager(
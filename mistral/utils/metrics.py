@@ -0,0 +1,263 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""In-process metrics of Mistral services.
+
+The metrics are only collected if the 'process_metrics' group is enabled
+and setup() is called by the service. Otherwise all the functions of this
+module do nothing.
+"""
+
+import contextlib
+import functools
+import inspect
+import time
+
+from oslo_config import cfg
+from oslo_log import log as logging
+from oslo_utils import importutils
+
+prometheus_client = importutils.try_import('prometheus_client')
+prometheus_core = importutils.try_import('prometheus_client.core')
+
+LOG = logging.getLogger(__name__)
+
+ENGINE_OPERATION = 'mistral_engine_operation_seconds'
+RPC_CALL = 'mistral_rpc_call_seconds'
+DB_TRANSACTION = 'mistral_db_transaction_seconds'
+DB_RETRIES = 'mistral_db_retries'
+DB_QUERIES = 'mistral_db_queries'
+LOCK_WAIT = 'mistral_lock_wait_seconds'
+EXPRESSION_EVALUATION = 'mistral_expression_evaluation_seconds'
+
+# Name -> (type, description, label).
+_METRICS = {
+    ENGINE_OPERATION: (
+        'Histogram',
+        'Time of engine operations.',
+        'operation'
+    ),
+    RPC_CALL: (
+        'Histogram',
+        'Time of processing incoming RPC calls.',
+        'method'
+    ),
+    DB_TRANSACTION: (
+        'Histogram',
+        'Time of DB transactions.',
+        'mode'
+    ),
+    DB_RETRIES: (
+        'Counter',
+        'Number of operations repeated because of DB errors.',
+        'operation'
+    ),
+    DB_QUERIES: (
+        'Counter',
+        'Number of DB statements made by engine operations.',
+        'operation'
+    ),
+    LOCK_WAIT: (
+        'Histogram',
+        'Time of waiting for DB locks.',
+        'kind'
+    ),
+    EXPRESSION_EVALUATION: (
+        'Histogram',
+        'Time of expression evaluation.',
+        'evaluator'
+    )
+}
+
+_REGISTRY = None
+_METRIC_OBJECTS = {}
+
+
+class _StatsCollector(object):
+    """Exports the statistics of caches and queues as gauges.
+
+    The statistics are gathered from the modules when the metrics are
+    scraped so they don't cost anything in between.
+    """
+
+    @staticmethod
+    def _get_stats():
+        from mistral.db.v2 import api as db_api
+        from mistral.engine import post_tx_queue
+        from mistral.lang import parser as spec_parser
+        from mistral.services import actions
+        from mistral.services import secure_request
+
+        yield 'mistral_post_tx_queue', {}, post_tx_queue.get_stats()
+        yield 'mistral_spec_cache', {}, spec_parser.get_stats()
+        yield 'mistral_action_lookup_cache', {}, actions.get_stats()
+
+        for realm, stats in secure_request.get_stats().items():
+            yield 'mistral_token_provider', {'realm': realm}, stats
+
+        for kind, stats in db_api.get_lock_stats().items():
+            yield 'mistral_locks', {'kind': kind}, stats
+
+    def collect(self):
+        families = {}
+
+        for name, labels, stats in self._get_stats():
+            if name not in families:
+                families[name] = prometheus_core.GaugeMetricFamily(
+                    name,
+                    'Statistics of %s.' % name[len('mistral_'):],
+                    labels=list(labels) + ['stat']
+                )
+
+            for stat, value in stats.items():
+                if isinstance(value, (int, float)):
+                    families[name].add_metric(
+                        list(labels.values()) + [stat],
+                        value
+                    )
+
+        return list(families.values())
+
+
+def setup(binary):
+    """Starts collecting and exporting the metrics of the process.
+
+    :param binary: Name of the service, used in the logs.
+    """
+    global _REGISTRY
+
+    if not cfg.CONF.process_metrics.enabled or _REGISTRY is not None:
+        return
+
+    if not prometheus_client:
+        LOG.warning(
+            "The prometheus_client library is not installed, the process "
+            "metrics are disabled [binary=%s]", binary
+        )
+
+        return
+
+    registry = prometheus_client.CollectorRegistry()
+
+    for name, (type_, description, label) in _METRICS.items():
+        _METRIC_OBJECTS[name] = getattr(prometheus_client, type_)(
+            name,
+            description,
+            [label],
+            registry=registry
+        )
+
+    registry.register(_StatsCollector())
+
+    _REGISTRY = registry
+
+    try:
+        prometheus_client.start_http_server(
+            cfg.CONF.process_metrics.port,
+            addr=cfg.CONF.process_metrics.host,
+            registry=registry
+        )
+    except OSError as e:
+        LOG.warning(
+            "Failed to start the process metrics endpoint, probably "
+            "another process exports its metrics on the same port "
+            "[binary=%s, port=%s, error=%s]",
+            binary,
+            cfg.CONF.process_metrics.port,
+            e
+        )
+
+
+def cleanup():
+    global _REGISTRY
+
+    _REGISTRY = None
+    _METRIC_OBJECTS.clear()
+
+
+def is_enabled():
+    return _REGISTRY is not None
+
+
+def get_registry():
+    return _REGISTRY
+
+
+def observe(name, label, value):
+    metric = _METRIC_OBJECTS.get(name)
+
+    if metric is not None:
+        metric.labels(label).observe(value)
+
+
+def increment(name, label, value=1):
+    metric = _METRIC_OBJECTS.get(name)
+
+    if metric is not None:
+        metric.labels(label).inc(value)
+
+
+@contextlib.contextmanager
+def timer(name, label):
+    if _REGISTRY is None:
+        yield
+
+        return
+
+    started = time.monotonic()
+
+    try:
+        yield
+    finally:
+        observe(name, label, time.monotonic() - started)
+
+
+def timed(label, name=ENGINE_OPERATION):
+    """Decorator measuring the time of the decorated function."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _REGISTRY is None:
+                return func(*args, **kwargs)
+
+            with timer(name, label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_rpc_endpoint(endpoint):
+    """Measures the time of the RPC methods of the given endpoint.
+
+    RPC methods are the public methods whose first argument is the RPC
+    context named 'rpc_ctx'. They're replaced with measuring wrappers in
+    the endpoint instance.
+
+    :return: The same endpoint.
+    """
+    if _REGISTRY is None:
+        return endpoint
+
+    for name, method in inspect.getmembers(endpoint, inspect.ismethod):
+        if name.startswith('_'):
+            continue
+
+        params = list(inspect.signature(method).parameters)
+
+        if params and params[0] == 'rpc_ctx':
+            setattr(endpoint, name, timed(name, RPC_CALL)(method))
+
+    return endpoint
@@ -12,9 +12,13 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import collections
 import copy
 import datetime
 import json
+import random
+import threading
+import time
 
 from oslo_config import cfg
 from oslo_log import log as logging
@@ -73,7 +77,161 @@ def log_to_file(info, context=None):
     PROFILER_LOG.info(' '.join(attrs))
 
 
+class _TraceStats(object):
+    def __init__(self, samples):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.durations = collections.deque(maxlen=samples)
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.durations.append(duration)
+
+    def to_dict(self, name):
+        durations = sorted(self.durations)
+
+        def _percentile(p):
+            return durations[min(len(durations) - 1, int(len(durations) * p))]
+
+        return {
+            'name': name,
+            'count': self.count,
+            'total': self.total,
+            'avg': self.total / self.count,
+            'max': self.max,
+            'p50': _percentile(0.5),
+            'p95': _percentile(0.95),
+            'p99': _percentile(0.99)
+        }
+
+
+class Aggregator(object):
+    """Aggregates profiler trace points into per trace statistics.
+
+    It's used as an osprofiler notifier instead of writing the trace
+    points into the profiler log. Only the given fraction of trace
+    points is taken into account, the decision is made when a trace
+    point starts. Percentiles are calculated using the latest durations
+    of a trace.
+    """
+
+    def __init__(self, sampling_rate=1.0, samples=1000):
+        self.enabled = True
+        self.sampling_rate = sampling_rate
+        self.started_at = datetime.datetime.utcnow()
+
+        self._samples = samples
+        self._starts = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, info, context=None):
+        name = info['name']
+        trace_id = info['trace_id']
+
+        if name.endswith('-start'):
+            if self.enabled and random.random() < self.sampling_rate:
+                self._starts[trace_id] = time.monotonic()
+
+            return
+
+        started = self._starts.pop(trace_id, None)
+
+        if started is None or not name.endswith('-stop'):
+            return
+
+        duration = time.monotonic() - started
+
+        with self._lock:
+            stats = self._stats.get(name[:-5])
+
+            if stats is None:
+                stats = self._stats[name[:-5]] = _TraceStats(self._samples)
+
+            stats.add(duration)
+
+    def configure(self, enabled=None, sampling_rate=None, reset=False):
+        if enabled is not None:
+            self.enabled = enabled
+
+        if sampling_rate is not None:
+            self.sampling_rate = sampling_rate
+
+        if reset:
+            with self._lock:
+                self._stats = {}
+
+            self.started_at = datetime.datetime.utcnow()
+
+    def get_stats(self):
+        with self._lock:
+            traces = [s.to_dict(n) for n, s in self._stats.items()]
+
+        return {
+            'enabled': self.enabled,
+            'sampling_rate': self.sampling_rate,
+            'started_at': utils.datetime_to_str(self.started_at),
+            'traces': sorted(traces, key=lambda t: t['total'], reverse=True)
+        }
+
+
+_AGGREGATOR = None
+
+
+def is_aggregating():
+    """Returns True if the trace points are aggregated in this process."""
+    return _AGGREGATOR is not None and _AGGREGATOR.enabled
+
+
+def get_stats():
+    """Returns the aggregated statistics of the profiler traces.
+
+    :return: A dict with the current aggregation settings and a list of
+        traces with the number of occurrences, the total, average and
+        maximum time and the 50th, 95th and 99th percentiles of time in
+        seconds, sorted by the total time. None if the aggregation is not
+        configured in this process.
+    """
+    return _AGGREGATOR.get_stats() if _AGGREGATOR else None
+
+
+def configure(enabled=None, sampling_rate=None, reset=False):
+    """Changes the aggregation settings at runtime.
+
+    :param enabled: Whether to aggregate the trace points.
+    :param sampling_rate: The fraction of trace points to aggregate.
+    :param reset: Whether to drop the statistics collected so far.
+    :return: True if the aggregation is configured in this process.
+    """
+    if not _AGGREGATOR:
+        return False
+
+    _AGGREGATOR.configure(enabled, sampling_rate, reset)
+
+    return True
+
+
 def setup(binary, host):
+    global _AGGREGATOR
+
     if cfg.CONF.profiler.enabled:
-        osprofiler.notifier.set(log_to_file)
+        if cfg.CONF.profiler.aggregate:
+            _AGGREGATOR = Aggregator(
+                cfg.CONF.profiler.sampling_rate,
+                cfg.CONF.profiler.aggregate_samples
+            )
+
+            osprofiler.notifier.set(_AGGREGATOR)
+        else:
+            osprofiler.notifier.set(log_to_file)
+
         osprofiler.web.enable(cfg.CONF.profiler.hmac_keys)
+
+
+def cleanup():
+    global _AGGREGATOR
+
+    _AGGREGATOR = None
@@ -16,8 +16,11 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import base64
+import datetime
 import functools
 import json
+import types
 
 from oslo_config import cfg
 from oslo_db import exception as db_exc
@@ -143,10 +146,68 @@ def filters_to_dict(**kwargs):
     return {k: v for k, v in kwargs.items() if v is not None}
 
 
+def _encode_cursor_value(value):
+    if isinstance(value, datetime.datetime):
+        return {'__datetime__': value.isoformat()}
+
+    raise TypeError('Unsupported cursor value: %r' % value)
+
+
+def _decode_cursor_value(obj):
+    if '__datetime__' in obj:
+        return datetime.datetime.fromisoformat(obj['__datetime__'])
+
+    return obj
+
+
+def encode_cursor(sort_keys, values):
+    """Returns an opaque keyset pagination cursor.
+
+    :param sort_keys: Columns the results are sorted by.
+    :param values: Values of the sort columns of the last returned object.
+    """
+    data = json.dumps(
+        {'k': sort_keys, 'v': values},
+        default=_encode_cursor_value
+    )
+
+    return base64.urlsafe_b64encode(data.encode()).rstrip(b'=').decode()
+
+
+def decode_cursor(cursor, sort_keys):
+    """Returns a pagination marker built from a cursor.
+
+    The marker has the values of the sort columns as attributes so that
+    it can be passed to the DB API instead of a DB object. Thus no extra
+    query is needed to fetch the marker.
+
+    :param cursor: Cursor returned by encode_cursor().
+    :param sort_keys: Columns the results are sorted by. They must be
+        the same as the ones the cursor was built for.
+    """
+    try:
+        data = json.loads(
+            base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)),
+            object_hook=_decode_cursor_value
+        )
+    except (TypeError, ValueError):
+        raise wsme_exc.ClientSideError("Invalid cursor.")
+
+    if (not isinstance(data, dict) or data.get('k') != sort_keys or
+            not isinstance(data.get('v'), list) or
+            len(data['v']) != len(sort_keys)):
+        raise wsme_exc.ClientSideError(
+            "Invalid cursor, it does not match the sort keys."
+        )
+
+    return types.SimpleNamespace(**dict(zip(sort_keys, data['v'])))
+
+
 def get_all(list_cls, cls, get_all_function, get_function,
             resource_function=None, get_count_function=None,
             marker=None, limit=None, sort_keys=None, sort_dirs=None,
-            fields=None, all_projects=False, **filters):
+            fields=None, all_projects=False, cursor=None, keyset=False,
+            **filters):
     """Return a list of cls.
 
     :param list_cls: REST Resource collection class (e.g.: Actions,
@@ -172,6 +233,14 @@ def get_all(list_cls, cls, get_all_function, get_function,
                    constructing 'next' link.
     :param filters: Optional. A specified dictionary of filters to match.
     :param all_projects: Optional. Get resources of all projects.
+    :param cursor: Optional. Keyset pagination cursor returned in the
+                   'next' link of the previous page. It implies keyset
+                   pagination.
+    :param keyset: Optional. Use keyset pagination. Instead of a marker
+                   the 'next' link contains a cursor with the values of
+                   the sort keys of the last object so the marker object
+                   does not need to be fetched. The total number of
+                   objects is not counted in this mode.
     """
     sort_keys = ['created_at'] if sort_keys is None else sort_keys
     sort_dirs = ['asc'] if sort_dirs is None else sort_dirs
@@ -183,6 +252,24 @@ def get_all(list_cls, cls, get_all_function, get_function,
     validate_query_params(limit, sort_keys, sort_dirs)
     validate_fields(fields, cls.get_fields())
 
+    keyset = keyset or cursor is not None
+
+    if keyset:
+        if marker:
+            raise wsme_exc.ClientSideError(
+                "Marker and cursor can not be used together."
+            )
+
+        if limit is None:
+            raise wsme_exc.ClientSideError(
+                "Limit must be specified for keyset pagination."
+            )
+
+        # Sorting by id makes the order of objects unique.
+        if 'id' not in sort_keys:
+            sort_keys.append('id')
+            sort_dirs.append('asc')
+
     # Admin user can get all tenants resources, no matter they are private or
     # public.
     insecure = False
@@ -193,10 +280,27 @@ def get_all(list_cls, cls, get_all_function, get_function,
 
     marker_obj = None
 
-    if marker:
+    if cursor:
+        marker_obj = decode_cursor(cursor, sort_keys)
+    elif marker:
         marker_obj = get_function(marker)
 
+    # Cursor pointing to the next page, only used with keyset pagination.
+    next_cursor = None
+
+    def _get_next_cursor(rows, get_value):
+        # There may be more objects only if the page is full.
+        if not keyset or len(rows) != limit:
+            return None
+
+        return encode_cursor(
+            sort_keys,
+            [get_value(rows[-1], key) for key in sort_keys]
+        )
+
     def _get_all_function():
+        nonlocal next_cursor
+
         with db_api.transaction():
             db_models = get_all_function(
                 limit=limit,
@@ -207,6 +311,8 @@ def get_all(list_cls, cls, get_all_function, get_function,
                 **filters
             )
 
+            next_cursor = _get_next_cursor(db_models, getattr)
+
             for db_model in db_models:
                 try:
                     if resource_function:
@@ -234,6 +340,12 @@ def get_all(list_cls, cls, get_all_function, get_function,
     # If only certain fields are requested then we ignore "resource_function"
     # parameter because it doesn't make sense anymore.
     if fields:
+        query_fields = fields
+
+        # The values of the sort keys are needed to build a cursor.
+        if keyset:
+            query_fields = fields + [k for k in sort_keys if k not in fields]
+
         # Use retries to prevent possible failures.
         db_list = r.call(
             get_all_function,
@@ -241,11 +353,16 @@ def get_all(list_cls, cls, get_all_function, get_function,
             marker=marker_obj,
             sort_keys=sort_keys,
             sort_dirs=sort_dirs,
-            fields=fields,
+            fields=query_fields,
             insecure=insecure,
             **filters
         )
 
+        next_cursor = _get_next_cursor(
+            db_list,
+            lambda row, key: row[query_fields.index(key)]
+        )
+
         for obj_values in db_list:
             # Note: in case if only certain fields have been requested
             # "db_list" contains tuples with values of db objects.
@@ -262,10 +379,11 @@ def get_all(list_cls, cls, get_all_function, get_function,
         sort_keys=','.join(sort_keys),
         sort_dirs=','.join(sort_dirs),
         fields=','.join(fields) if fields else '',
+        cursor=next_cursor,
         **filters
     )
 
-    if get_count_function:
+    if get_count_function and not keyset:
         with db_api.transaction():
             total_count = get_count_function(**filters)
         res.total = total_count
@@ -12,6 +12,8 @@
 #  License for the specific language governing permissions and limitations
 #  under the License.
 
+import re
+
 import yaml
 from yaml import *  # noqa
 
@@ -54,9 +56,48 @@ class SafeLoader(yaml.SafeLoader):
             return super(SafeLoader, self).check_plain()
 
 
+# libyaml based loader. It is much faster than the pure Python one but
+# it cannot be customized the way SafeLoader is.
+_C_SAFE_LOADER = getattr(yaml, 'CSafeLoader', None)
+
+# '&', '*' or '@' that may start a token. The pattern finds them in
+# scalars as well (e.g. "a && b"), so the text is then scanned to find
+# out whether it really has anchors or aliases.
+_SPECIAL_TOKEN_PATTERN = re.compile(r'(?:^|[\s\[\]{},:?\-])[&*@]')
+
+
+def _has_anchors(stream):
+    # A token starting with '@' is a scanner error in libyaml.
+    for token in yaml.scan(stream, Loader=_C_SAFE_LOADER):
+        if isinstance(token, (yaml.AnchorToken, yaml.AliasToken)):
+            return True
+
+    return False
+
+
 def load(stream):
+    # libyaml produces the same result as SafeLoader unless the text
+    # has anchors, aliases or tokens starting with '@'.
+    if _C_SAFE_LOADER is not None and isinstance(stream, str):
+        try:
+            if (not _SPECIAL_TOKEN_PATTERN.search(stream) or
+                    not _has_anchors(stream)):
+                return yaml.load(stream, _C_SAFE_LOADER)
+        except yaml.YAMLError:
+            # Let SafeLoader either load the text or report the error
+            # the same way as before.
+            pass
+
     return yaml.load(stream, SafeLoader)
 
 
+def load_with_anchors(stream):
+    """Loads YAML the same way as yaml.safe_load() does.
+
+    Anchors and aliases are not disabled, libyaml is used if available.
+    """
+    return yaml.load(stream, _C_SAFE_LOADER or yaml.SafeLoader)
+
+
 def safe_load(stream):
     return load(stream)
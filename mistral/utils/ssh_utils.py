@@ -12,10 +12,16 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from os import path
-
+import collections
+import contextlib
+import hashlib
 import io
+from os import path
+import select
+import threading
+import time
 
+from oslo_config import cfg
 from oslo_log import log as logging
 import paramiko
 
@@ -25,16 +31,226 @@ from mistral import exceptions as exc
 KEY_PATH = path.expanduser("~/.ssh/")
 LOG = logging.getLogger(__name__)
 
+CONF = cfg.CONF
+
+_READ_CHUNK_SIZE = 32768
+
+# Connection key -> idle connections, the most recently used are the last.
+_IDLE_CONNECTIONS = collections.OrderedDict()
+_LOCK = threading.Lock()
+
+
+class _OutputBuffer(object):
+    """Collects output of a command keeping at most limit bytes."""
+
+    def __init__(self, limit):
+        self._chunks = []
+        self._size = 0
+        self._limit = limit
+        self.truncated = False
+
+    def append(self, data):
+        if self._limit and self._size + len(data) > self._limit:
+            data = data[:self._limit - self._size]
+
+            self.truncated = True
+
+        if data:
+            self._chunks.append(data)
+            self._size += len(data)
+
+    def getvalue(self):
+        result = b''.join(self._chunks)
+
+        if self.truncated:
+            # The last character may be cut.
+            return result.decode('utf-8', errors='ignore')
+
+        return result.decode('utf-8')
+
+
+def _read_channel(chan):
+    """Reads stdout and stderr of the channel until the command exits.
+
+    Both streams are read as soon as data arrives so that the command
+    is never blocked on a full stderr buffer while stdout is being read.
+    """
+    max_output_size = CONF.ssh_connection_pool.max_output_size
+
+    stdout = _OutputBuffer(max_output_size)
+    stderr = _OutputBuffer(max_output_size)
+
+    while True:
+        received = False
+
+        while chan.recv_ready():
+            stdout.append(chan.recv(_READ_CHUNK_SIZE))
+
+            received = True
+
+        while chan.recv_stderr_ready():
+            stderr.append(chan.recv_stderr(_READ_CHUNK_SIZE))
+
+            received = True
+
+        if received:
+            continue
+
+        if chan.exit_status_ready() or chan.closed:
+            break
+
+        # The channel becomes readable when new data or the exit status
+        # arrive. The timeout guards against missed wakeups.
+        select.select([chan], [], [], 1)
+
+    # Output may arrive between the checks above and the exit status so
+    # the streams are read until their end.
+    for recv, output in ((chan.recv, stdout), (chan.recv_stderr, stderr)):
+        data = recv(_READ_CHUNK_SIZE)
+
+        while data:
+            output.append(data)
+
+            data = recv(_READ_CHUNK_SIZE)
+
+    if stdout.truncated or stderr.truncated:
+        LOG.warning(
+            "SSH command output exceeded %s bytes and was truncated.",
+            max_output_size
+        )
 
-def _read_paramimko_stream(recv_func):
-    result = b''
-    buf = recv_func(1024)
+    return stdout.getvalue(), stderr.getvalue()
 
-    while buf != b'':
-        result += buf
-        buf = recv_func(1024)
 
-    return result.decode('utf-8')
+class _Connection(object):
+    def __init__(self, client, gateway_client=None):
+        self.client = client
+        self.gateway_client = gateway_client
+        self.last_used = time.monotonic()
+
+    def is_active(self):
+        transport = self.client.get_transport()
+
+        return transport is not None and transport.is_active()
+
+    def close(self):
+        self.client.close()
+
+        if self.gateway_client:
+            self.gateway_client.close()
+
+
+def _get_connection_key(*args):
+    # Credentials are part of the key so that a connection is reused only
+    # by those who could open it themselves. They are hashed to not keep
+    # them in memory longer than needed.
+    key = hashlib.sha256()
+
+    for arg in args:
+        if isinstance(arg, paramiko.PKey):
+            arg = arg.get_fingerprint()
+
+        key.update(repr(arg).encode('utf-8'))
+
+    return key.hexdigest()
+
+
+def _close_idle_connections(now):
+    idle_timeout = CONF.ssh_connection_pool.idle_timeout
+    max_idle = CONF.ssh_connection_pool.max_idle_connections
+
+    idle_count = 0
+
+    for key, conns in list(_IDLE_CONNECTIONS.items()):
+        for conn in list(conns):
+            if now - conn.last_used > idle_timeout:
+                conns.remove(conn)
+
+                conn.close()
+
+        if not conns:
+            del _IDLE_CONNECTIONS[key]
+
+        idle_count += len(conns)
+
+    while idle_count > max_idle:
+        key, conns = next(iter(_IDLE_CONNECTIONS.items()))
+
+        conns.popleft().close()
+
+        if not conns:
+            del _IDLE_CONNECTIONS[key]
+
+        idle_count -= 1
+
+
+def _acquire_connection(key):
+    with _LOCK:
+        _close_idle_connections(time.monotonic())
+
+        conns = _IDLE_CONNECTIONS.get(key)
+
+        while conns:
+            conn = conns.pop()
+
+            if not conns:
+                del _IDLE_CONNECTIONS[key]
+
+            if conn.is_active():
+                return conn
+
+            conn.close()
+
+    return None
+
+
+def _release_connection(key, conn):
+    conn.last_used = time.monotonic()
+
+    with _LOCK:
+        conns = _IDLE_CONNECTIONS.pop(key, None) or collections.deque()
+
+        conns.append(conn)
+
+        _IDLE_CONNECTIONS[key] = conns
+
+        _close_idle_connections(conn.last_used)
+
+
+@contextlib.contextmanager
+def _get_connection(key, connect_func):
+    """Provides a connection from the pool or a new one.
+
+    A connection is used by one command at a time so that the number of
+    sessions opened on it never exceeds the server limit.
+    """
+    pool_enabled = CONF.ssh_connection_pool.enabled
+
+    conn = _acquire_connection(key) if pool_enabled else None
+
+    if conn is None:
+        conn = connect_func()
+
+    try:
+        yield conn
+    except BaseException:
+        conn.close()
+
+        raise
+
+    if pool_enabled:
+        _release_connection(key, conn)
+    else:
+        conn.close()
+
+
+def cleanup():
+    with _LOCK:
+        while _IDLE_CONNECTIONS:
+            _, conns = _IDLE_CONNECTIONS.popitem()
+
+            for conn in conns:
+                conn.close()
 
 
 def _to_paramiko_private_key(private_key_filename,
@@ -81,43 +297,32 @@ def _connect(host, username, password=None, pkey=None, proxy=None):
     return ssh_client
 
 
-def _cleanup(ssh_client):
-    ssh_client.close()
+def _execute_command(ssh_client, cmd):
+    chan = ssh_client.get_transport().open_session()
 
-
-def _execute_command(ssh_client, cmd, get_stderr=False,
-                     raise_when_error=True):
     try:
-        chan = ssh_client.get_transport().open_session()
         chan.exec_command(cmd)
 
-        # TODO(nmakhotkin): that could hang if stderr buffer overflows
-        stdout = _read_paramimko_stream(chan.recv)
-        stderr = _read_paramimko_stream(chan.recv_stderr)
-
-        ret_code = chan.recv_exit_status()
+        stdout, stderr = _read_channel(chan)
 
-        if ret_code and raise_when_error:
-            raise RuntimeError("Cmd: %s\nReturn code: %s\nstdout: %s"
-                               % (cmd, ret_code, stdout))
-        if get_stderr:
-            return ret_code, stdout, stderr
-        else:
-            return ret_code, stdout
+        return chan.recv_exit_status(), stdout, stderr
     finally:
-        _cleanup(ssh_client)
+        chan.close()
 
 
-def execute_command_via_gateway(cmd, host, username, private_key_filename,
-                                gateway_host, gateway_username=None,
-                                proxy_command=None, password=None,
-                                private_key=None):
-    LOG.debug('Creating SSH connection')
+def _get_command_result(cmd, ret_code, stdout, stderr, get_stderr=False,
+                        raise_when_error=True):
+    if ret_code and raise_when_error:
+        raise RuntimeError("Cmd: %s\nReturn code: %s\nstdout: %s"
+                           % (cmd, ret_code, stdout))
+    if get_stderr:
+        return ret_code, stdout, stderr
+    else:
+        return ret_code, stdout
 
-    private_key = _to_paramiko_private_key(private_key_filename,
-                                           private_key,
-                                           password)
 
+def _connect_via_gateway(host, username, private_key, gateway_host,
+                         gateway_username, proxy_command):
     proxy = None
 
     if proxy_command:
@@ -130,9 +335,6 @@ def execute_command_via_gateway(cmd, host, username, private_key_filename,
 
     LOG.debug('Connecting to proxy gateway at: %s', gateway_host)
 
-    if not gateway_username:
-        gateway_username = username
-
     _proxy_ssh_client.connect(
         gateway_host,
         username=gateway_username,
@@ -140,25 +342,67 @@ def execute_command_via_gateway(cmd, host, username, private_key_filename,
         sock=proxy
     )
 
-    proxy = _proxy_ssh_client.get_transport().open_session()
-    proxy.exec_command("nc {0} 22".format(host))
+    try:
+        proxy = _proxy_ssh_client.get_transport().open_session()
+        proxy.exec_command("nc {0} 22".format(host))
+
+        ssh_client = _connect(
+            host,
+            username=username,
+            pkey=private_key,
+            proxy=proxy
+        )
+    except Exception:
+        _proxy_ssh_client.close()
+
+        raise
+
+    return _Connection(ssh_client, _proxy_ssh_client)
+
+
+def execute_command_via_gateway(cmd, host, username, private_key_filename,
+                                gateway_host, gateway_username=None,
+                                proxy_command=None, password=None,
+                                private_key=None):
+    LOG.debug('Creating SSH connection')
+
+    private_key = _to_paramiko_private_key(private_key_filename,
+                                           private_key,
+                                           password)
+
+    if not gateway_username:
+        gateway_username = username
 
-    ssh_client = _connect(
+    key = _get_connection_key(
         host,
-        username=username,
-        pkey=private_key,
-        proxy=proxy
+        username,
+        private_key,
+        gateway_host,
+        gateway_username,
+        proxy_command
     )
 
-    try:
-        return _execute_command(
-            ssh_client,
-            cmd,
-            get_stderr=False,
-            raise_when_error=True
+    def connect():
+        return _connect_via_gateway(
+            host,
+            username,
+            private_key,
+            gateway_host,
+            gateway_username,
+            proxy_command
         )
-    finally:
-        _cleanup(_proxy_ssh_client)
+
+    with _get_connection(key, connect) as conn:
+        ret_code, stdout, stderr = _execute_command(conn.client, cmd)
+
+    return _get_command_result(
+        cmd,
+        ret_code,
+        stdout,
+        stderr,
+        get_stderr=False,
+        raise_when_error=True
+    )
 
 
 def execute_command(cmd, host, username, password=None,
@@ -171,8 +415,21 @@ def execute_command(cmd, host, username, password=None,
                                            private_key,
                                            password)
 
-    ssh_client = _connect(host, username, password, private_key)
+    key = _get_connection_key(host, username, password, private_key)
 
-    LOG.debug("Executing command %s", cmd)
+    def connect():
+        return _Connection(_connect(host, username, password, private_key))
 
-    return _execute_command(ssh_client, cmd, get_stderr, raise_when_error)
+    with _get_connection(key, connect) as conn:
+        LOG.debug("Executing command %s", cmd)
+
+        ret_code, stdout, stderr = _execute_command(conn.client, cmd)
+
+    return _get_command_result(
+        cmd,
+        ret_code,
+        stdout,
+        stderr,
+        get_stderr,
+        raise_when_error
+    )
@@ -19,6 +19,7 @@ from oslo_log import log as logging
 from osprofiler import profiler
 
 from mistral import context as auth_ctx
+from mistral.db.v2 import api as db_api
 from mistral.db.v2.sqlalchemy import models
 from mistral import exceptions as exc
 from mistral import expressions as expr
@@ -253,10 +254,15 @@ def publish_variables(task_ex, task_spec, dry_run=False):
     global_publish = expr.evaluate_recursively(global_vars, expr_ctx)
 
     if not dry_run:
-        utils.merge_dicts(
-            task_ex.workflow_execution.context,
-            global_publish
-        )
+        wf_ex = task_ex.workflow_execution
+
+        # The context may be changed by parallel transactions so it
+        # has to be reloaded under a lock, otherwise their changes
+        # may be overwritten.
+        if global_publish and CONF.engine.lock_global_publish:
+            db_api.lock_workflow_execution_context(wf_ex)
+
+        utils.merge_dicts(wf_ex.context, global_publish)
 
     # TODO(rakhmerov):
     # 1. Publish atomic variables.
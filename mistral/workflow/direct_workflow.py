@@ -277,7 +277,9 @@ class DirectWorkflowController(base.WorkflowController):
         return cnt == 0
 
     def _find_end_task_executions_as_batches(self):
+        # Only the fields needed to evaluate outbound contexts are fetched.
         batches = db_api.get_completed_task_executions_as_batches(
+            fields=('id', 'name', 'in_context', 'published'),
             workflow_execution_id=self.wf_ex.id,
             has_next_tasks=False
         )
@@ -0,0 +1,141 @@
+# Copyright 2026 - NetCracker Technology Corp.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Measures the time of parsing and validating large workflow texts.
+
+The time of loading YAML is reported separately from the total time.
+
+It parses the workbooks and workflows from rally-jobs/extra and a big
+parallel workflow generated by tools/wf_generators/generate_parallel_wf.py
+the same way as the API does when a workflow is uploaded or updated.
+
+Usage: python tools/spec_parse_benchmark.py [--repeat N] [--branches N]
+    [--depth N] [FILE ...]
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from mistral import config  # noqa
+from mistral.lang import parser as spec_parser
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RALLY_DIR = os.path.join(ROOT_DIR, 'rally-jobs', 'extra')
+
+GENERATOR = os.path.join(
+    ROOT_DIR,
+    'tools',
+    'wf_generators',
+    'generate_parallel_wf.py'
+)
+
+
+def _get_rally_files():
+    return sorted(
+        glob.glob(os.path.join(RALLY_DIR, '*.yaml')) +
+        glob.glob(os.path.join(RALLY_DIR, 'scenarios', '*', '*.yaml'))
+    )
+
+
+def _generate_parallel_wf(tmp_dir, branches, depth):
+    subprocess.check_call(
+        [sys.executable, GENERATOR, 'parallel_wf', str(branches),
+         str(depth), 'join'],
+        cwd=tmp_dir,
+        stdout=subprocess.DEVNULL
+    )
+
+    return os.path.join(tmp_dir, 'parallel_wf.mist')
+
+
+def _parse(spec_dict):
+    if 'workflows' in spec_dict or 'name' in spec_dict:
+        return spec_parser.get_workbook_spec(spec_dict, validate=True)
+
+    return spec_parser.get_workflow_list_spec(spec_dict, validate=True)
+
+
+def _measure(path, repeat):
+    with open(path) as f:
+        text = f.read()
+
+    # The first run warms up caches of expressions and schemas.
+    _parse(spec_parser.parse_yaml(text))
+
+    yaml_duration = 0
+    started = time.time()
+
+    for _ in range(repeat):
+        yaml_started = time.time()
+
+        spec_dict = spec_parser.parse_yaml(text)
+
+        yaml_duration += time.time() - yaml_started
+
+        _parse(spec_dict)
+
+    return yaml_duration / repeat, (time.time() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Workflow text parsing benchmark.'
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--branches', type=int, default=50)
+    parser.add_argument('--depth', type=int, default=40)
+    parser.add_argument('files', nargs='*')
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files = args.files or (
+            _get_rally_files() +
+            [_generate_parallel_wf(tmp_dir, args.branches, args.depth)]
+        )
+
+        yaml_total = 0
+        total = 0
+
+        print('%-60s %13s %13s' % ('File', 'YAML', 'Total'))
+
+        for path in files:
+            yaml_duration, duration = _measure(path, args.repeat)
+
+            yaml_total += yaml_duration
+            total += duration
+
+            print(
+                '%-60s %10.1f ms %10.1f ms' %
+                (os.path.relpath(path, ROOT_DIR)
+                 if path.startswith(ROOT_DIR) else os.path.basename(path),
+                 yaml_duration * 1000,
+                 duration * 1000)
+            )
+
+        print(
+            '%-60s %10.1f ms %10.1f ms' %
+            ('Total', yaml_total * 1000, total * 1000)
+        )
+
+
+if __name__ == '__main__':
+    main()